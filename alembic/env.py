@@ -12,6 +12,19 @@ from app.config.database.session import DATABASE_URL, Base
 
 # Import all models to ensure they are registered with Base.metadata
 from app.account.infrastructure.orm.account_model import AccountModel  # noqa: F401
+from app.inquiry.infrastructure.orm.inquiry_model import InquiryModel  # noqa: F401
+from app.inquiry.infrastructure.orm.inquiry_reply_model import InquiryReplyModel  # noqa: F401
+from app.faq.infrastructure.orm.faq_model import FAQModel  # noqa: F401
+from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm  # noqa: F401
+from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm  # noqa: F401
+from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm  # noqa: F401
+from app.conversation.infrastructure.orm.chat_room_summary_orm import ChatRoomSummaryOrm  # noqa: F401
+from app.conversation.infrastructure.orm.usage_event_orm import UsageEventOrm  # noqa: F401
+from app.simulation.infrastructure.orm.simulation_chat_orm import SimulationChatORM  # noqa: F401
+from app.simulation.infrastructure.orm.simulation_chat_message_orm import SimulationChatMessageORM  # noqa: F401
+from app.survey.infrastructure.orm.survey_model import SurveyTemplateModel  # noqa: F401
+from app.survey.infrastructure.orm.survey_response_orm import SurveyResponseOrm  # noqa: F401
+from app.survey.infrastructure.orm.survey_response_item_orm import SurveyResponseItemOrm  # noqa: F401
 
 # this is the Alembic Config object
 config = context.config
@@ -1,7 +1,7 @@
 """Add role, plan, billing, status columns to account table
 
 Revision ID: 20241218_000001
-Revises:
+Revises: 20241201_000000
 Create Date: 2024-12-18
 
 """
@@ -13,7 +13,7 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision: str = '20241218_000001'
-down_revision: Union[str, None] = None
+down_revision: Union[str, None] = '20241201_000000'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
@@ -0,0 +1,38 @@
+"""Create usage_event table
+
+Revision ID: 20261018_000002
+Revises: 20261018_000001
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_000002'
+down_revision: Union[str, None] = '20261018_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Per-call token usage, written in batches by the usage meter
+    op.create_table(
+        'usage_event',
+        sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), autoincrement=True, nullable=False),
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('room_id', sa.String(36), nullable=True),
+        sa.Column('input_tokens', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('output_tokens', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_usage_event_account_created', 'usage_event', ['account_id', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_usage_event_account_created', table_name='usage_event')
+    op.drop_table('usage_event')
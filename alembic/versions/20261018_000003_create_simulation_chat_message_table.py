@@ -0,0 +1,150 @@
+"""Move simulation chat messages to an append-only simulation_chat_message table
+
+Revision ID: 20261018_000003
+Revises: 20261018_000002
+Create Date: 2026-10-18
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_000003'
+down_revision: Union[str, None] = '20261018_000002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+simulation_chat = sa.table(
+    'simulation_chat',
+    sa.column('id', sa.String(50)),
+    sa.column('messages', sa.JSON()),
+    sa.column('message_count', sa.Integer()),
+    sa.column('last_message_preview', sa.Text()),
+    sa.column('last_message_iv', sa.String(64)),
+)
+
+simulation_chat_message = sa.table(
+    'simulation_chat_message',
+    sa.column('chat_id', sa.String(50)),
+    sa.column('seq', sa.Integer()),
+    sa.column('role', sa.String(20)),
+    sa.column('content', sa.Text()),
+    sa.column('iv', sa.String(64)),
+    sa.column('created_at', sa.DateTime()),
+)
+
+
+def _parse_timestamp(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'simulation_chat_message',
+        sa.Column('chat_id', sa.String(50), nullable=False),
+        sa.Column('seq', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('role', sa.String(20), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('iv', sa.String(64), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['chat_id'], ['simulation_chat.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('chat_id', 'seq'),
+    )
+    op.add_column('simulation_chat', sa.Column('message_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('simulation_chat', sa.Column('last_message_preview', sa.Text(), nullable=True))
+    op.add_column('simulation_chat', sa.Column('last_message_iv', sa.String(64), nullable=True))
+
+    # Backfill: JSON 목록을 메시지 행으로 옮기고 요약 컬럼을 채운 뒤 JSON 은 비운다.
+    # 미리보기는 마지막 메시지 암호문을 그대로 복사한다 (잘라내기는 조회 시 복호화 후 수행).
+    conn = op.get_bind()
+    last_id = ''
+    while True:
+        rows = conn.execute(
+            sa.select(simulation_chat.c.id, simulation_chat.c.messages)
+            .where(simulation_chat.c.id > last_id)
+            .order_by(simulation_chat.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        message_rows = []
+        for chat_id, messages in rows:
+            messages = [m for m in (messages or []) if isinstance(m, dict)]
+            for seq, msg in enumerate(messages):
+                message_rows.append({
+                    'chat_id': chat_id,
+                    'seq': seq,
+                    'role': msg.get('role') or 'assistant',
+                    'content': msg.get('content') or '',
+                    'iv': msg.get('iv') or None,
+                    'created_at': _parse_timestamp(msg.get('timestamp')),
+                })
+
+            last = messages[-1] if messages else {}
+            conn.execute(
+                sa.update(simulation_chat)
+                .where(simulation_chat.c.id == chat_id)
+                .values(
+                    message_count=len(messages),
+                    last_message_preview=last.get('content') or None,
+                    last_message_iv=last.get('iv') or None,
+                    messages=sa.null(),
+                )
+            )
+
+        if message_rows:
+            conn.execute(sa.insert(simulation_chat_message), message_rows)
+
+
+def downgrade() -> None:
+    # 메시지 행을 다시 JSON 목록으로 되돌린다 (업그레이드 이후 추가된 턴 포함)
+    conn = op.get_bind()
+    last_id = ''
+    while True:
+        chat_ids = conn.execute(
+            sa.select(simulation_chat.c.id)
+            .where(simulation_chat.c.id > last_id)
+            .order_by(simulation_chat.c.id)
+            .limit(BATCH_SIZE)
+        ).scalars().all()
+        if not chat_ids:
+            break
+        last_id = chat_ids[-1]
+
+        grouped = {chat_id: [] for chat_id in chat_ids}
+        for row in conn.execute(
+            sa.select(simulation_chat_message)
+            .where(simulation_chat_message.c.chat_id.in_(chat_ids))
+            .order_by(simulation_chat_message.c.chat_id, simulation_chat_message.c.seq)
+        ):
+            grouped[row.chat_id].append({
+                'role': row.role,
+                'content': row.content,
+                'iv': row.iv,
+                'timestamp': row.created_at.isoformat() if row.created_at else None,
+            })
+
+        for chat_id, messages in grouped.items():
+            conn.execute(
+                sa.update(simulation_chat)
+                .where(simulation_chat.c.id == chat_id)
+                .values(messages=messages)
+            )
+
+    op.drop_column('simulation_chat', 'last_message_iv')
+    op.drop_column('simulation_chat', 'last_message_preview')
+    op.drop_column('simulation_chat', 'message_count')
+    op.drop_table('simulation_chat_message')
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.auth.adapter.input.web.dependencies import (
     get_optional_jwt_payload,
     get_optional_session,
+    get_session_usecase,
 )
 from app.auth.application.port.jwt_token_port import TokenPayload
+from app.auth.application.usecase.session_usecase import SessionUseCase
 from app.auth.domain.entity.session import Session
 from app.config.database.session import get_db_session
 
@@ -18,25 +20,22 @@ from app.account.application.usecase.account_usecase import AccountUseCase
 from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
 
 
-# =============================
-# DI 객체 (conversation_router 스타일)
-# =============================
-account_repo = AccountRepositoryImpl()
-account_usecase = AccountUseCase(account_repo)
-
 router = APIRouter(prefix="/account", tags=["account"])
 
 
 # =============================
 # 인증 관련
 # =============================
-def get_current_account_id(
+async def get_current_account_id(
+    request: Request,
     jwt_payload: TokenPayload | None = Depends(get_optional_jwt_payload),
-    session: Session | None = Depends(get_optional_session),
+    session_usecase: SessionUseCase = Depends(get_session_usecase),
 ) -> int:
 
     if jwt_payload:
         return jwt_payload.account_id
+    # JWT 가 없을 때만 세션 조회 (Redis 왕복)
+    session = await get_optional_session(request, session_usecase)
     if session:
         return session.account_id
     raise HTTPException(status_code=401, detail="Not authenticated")
@@ -15,7 +15,9 @@ from app.auth.infrastructure.cache.session_repository_impl import SessionReposit
 from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl
 from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService
 from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
+from app.config.container import AppContainer, get_container
 from app.config.database.session import SessionLocal
+from app.conversation.infrastructure.observability.tracing import trace_span
 
 
 def get_db() -> Generator[DBSession, None, None]:
@@ -27,9 +29,11 @@ def get_db() -> Generator[DBSession, None, None]:
         db.close()
 
 
-def get_session_repository() -> SessionRepositoryImpl:
-    """Get session repository dependency."""
-    return SessionRepositoryImpl()
+def get_session_repository(
+    container: AppContainer = Depends(get_container),
+) -> SessionRepositoryImpl:
+    """Get the process-wide session repository."""
+    return container.session_repository
 
 
 def get_account_repository(
@@ -58,16 +62,18 @@ def get_account_usecase(
     return AccountUseCase(account_repo)
 
 
-def get_token_blacklist() -> TokenBlacklistImpl:
-    """Get token blacklist dependency."""
-    return TokenBlacklistImpl()
+def get_token_blacklist(
+    container: AppContainer = Depends(get_container),
+) -> TokenBlacklistImpl:
+    """Get the process-wide token blacklist."""
+    return container.token_blacklist
 
 
 def get_jwt_service(
-    blacklist: TokenBlacklistImpl = Depends(get_token_blacklist),
+    container: AppContainer = Depends(get_container),
 ) -> JWTTokenService:
-    """Get JWT token service dependency with blacklist support."""
-    return JWTTokenService(blacklist=blacklist)
+    """Get the process-wide JWT token service (blacklist and payload cache wired in)."""
+    return container.jwt_service
 
 
 def get_auth_usecase(
@@ -80,7 +86,7 @@ def get_auth_usecase(
     return AuthUseCase(session_usecase, csrf_usecase, account_usecase, jwt_service)
 
 
-def get_current_session(
+async def get_current_session(
     request: Request,
     session_usecase: SessionUseCase = Depends(get_session_usecase),
 ) -> Session:
@@ -99,7 +105,7 @@ def get_current_session(
             detail="Not authenticated",
         )
 
-    session = session_usecase.validate_session(session_id)
+    session = await session_usecase.validate_session(session_id)
 
     if not session:
         raise HTTPException(
@@ -110,7 +116,7 @@ def get_current_session(
     return session
 
 
-def get_optional_session(
+async def get_optional_session(
     request: Request,
     session_usecase: SessionUseCase = Depends(get_session_usecase),
 ) -> Session | None:
@@ -123,10 +129,11 @@ def get_optional_session(
     if not session_id:
         return None
 
-    return session_usecase.validate_session(session_id)
+    with trace_span("session_validate", flow="auth"):
+        return await session_usecase.validate_session(session_id)
 
 
-def get_current_jwt_payload(
+async def get_current_jwt_payload(
     request: Request,
     jwt_service: JWTTokenService = Depends(get_jwt_service),
 ) -> TokenPayload:
@@ -151,7 +158,8 @@ def get_current_jwt_payload(
             detail="Not authenticated",
         )
 
-    payload = jwt_service.validate_token(token)
+    with trace_span("jwt_validate", flow="auth"):
+        payload = await jwt_service.validate_token(token)
 
     if not payload:
         raise HTTPException(
@@ -162,7 +170,7 @@ def get_current_jwt_payload(
     return payload
 
 
-def get_optional_jwt_payload(
+async def get_optional_jwt_payload(
     request: Request,
     jwt_service: JWTTokenService = Depends(get_jwt_service),
 ) -> Optional[TokenPayload]:
@@ -180,7 +188,8 @@ def get_optional_jwt_payload(
     if not token:
         return None
 
-    return jwt_service.validate_token(token)
+    with trace_span("jwt_validate", flow="auth"):
+        return await jwt_service.validate_token(token)
 
 
 def verify_admin_role(
@@ -219,7 +228,7 @@ def verify_csrf(
     return True
 
 
-def verify_jwt_csrf(
+async def verify_jwt_csrf(
     request: Request,
     jwt_service: JWTTokenService = Depends(get_jwt_service),
 ) -> bool:
@@ -253,7 +262,7 @@ def verify_jwt_csrf(
         )
 
     # Validate CSRF token against JWT
-    if not jwt_service.validate_csrf(token, header_csrf):
+    if not await jwt_service.validate_csrf(token, header_csrf):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="CSRF token validation failed",
@@ -123,11 +123,11 @@ async def logout(
     # Blacklist JWT token if exists
     token = request.cookies.get("access_token")
     if token:
-        auth_usecase.blacklist_jwt(token)
+        await auth_usecase.blacklist_jwt(token)
 
     # Destroy session if exists
     if session:
-        auth_usecase.logout(session.session_id)
+        await auth_usecase.logout(session.session_id)
 
     # Clear all auth cookies
     response.delete_cookie("access_token")
@@ -347,7 +347,7 @@ async def refresh_token(
         )
 
     # Refresh the token
-    new_token_pair = auth_usecase.refresh_jwt(token)
+    new_token_pair = await auth_usecase.refresh_jwt(token)
 
     if not new_token_pair:
         raise HTTPException(
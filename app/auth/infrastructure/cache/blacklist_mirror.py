@@ -0,0 +1,134 @@
+"""Local mirror of the Redis token blacklist kept fresh via pub/sub."""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+
+class BlacklistMirror:
+    """In-process copy of every `blacklist:{jti}` key.
+
+    The mirror subscribes to `CHANNEL` before loading the keyspace with SCAN,
+    so no revocation published during the load is lost. While the subscription
+    is healthy `ready` is True and lookups need no Redis round trip; if the
+    connection drops the mirror marks itself not ready and callers fall back
+    to Redis until it has resubscribed and reloaded.
+
+    The blacklist only holds tokens revoked within their 12-hour lifetime, so
+    an exact jti -> expiry map is small enough that a bloom filter is not needed.
+    """
+
+    KEY_PREFIX = "blacklist:"
+    CHANNEL = "blacklist:events"
+
+    def __init__(self):
+        """Initialize an empty, not-ready mirror."""
+        self._entries: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._ready = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """True while the mirror is known to be complete."""
+        return self._ready
+
+    def contains(self, jti: str) -> bool:
+        """Check whether a jti is blacklisted according to the mirror."""
+        expires_at = self._entries.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            with self._lock:
+                self._entries.pop(jti, None)
+            return False
+        return True
+
+    def add(self, jti: str, ttl_seconds: float) -> None:
+        """Record a revocation locally."""
+        with self._lock:
+            self._entries[jti] = time.monotonic() + ttl_seconds
+
+    def remove(self, jti: str) -> None:
+        """Forget a revocation locally."""
+        with self._lock:
+            self._entries.pop(jti, None)
+
+    def _apply(self, message: str) -> None:
+        # "add:{ttl}:{jti}" | "del:{jti}"
+        action, _, rest = message.partition(":")
+        if action == "add":
+            ttl, _, jti = rest.partition(":")
+            self.add(jti, float(ttl))
+        elif action == "del":
+            self.remove(rest)
+
+    async def _load(self, redis_client: aioredis.Redis) -> None:
+        entries: dict[str, float] = {}
+        now = time.monotonic()
+        async for key in redis_client.scan_iter(match=f"{self.KEY_PREFIX}*", count=1000):
+            if key == self.CHANNEL:
+                continue
+            ttl = await redis_client.ttl(key)
+            if ttl > 0:
+                entries[key[len(self.KEY_PREFIX):]] = now + ttl
+        with self._lock:
+            # Keep entries that arrived via pub/sub while scanning
+            for jti, expires_at in entries.items():
+                self._entries.setdefault(jti, expires_at)
+
+    async def run(self, redis_client: aioredis.Redis, retry_seconds: float = 5.0) -> None:
+        """Subscribe, load and follow revocations until cancelled."""
+        while True:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.CHANNEL)
+                await self._load(redis_client)
+                self._ready = True
+                logger.info("blacklist mirror ready: %d entries", len(self._entries))
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._apply(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("blacklist mirror disconnected, retrying", exc_info=True)
+            finally:
+                self._ready = False
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+            await asyncio.sleep(retry_seconds)
+
+    def start(self, redis_client: aioredis.Redis) -> None:
+        """Start the background subscription task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(redis_client))
+
+    async def stop(self) -> None:
+        """Cancel the background subscription task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_mirror_instance: Optional[BlacklistMirror] = None
+
+
+def get_blacklist_mirror() -> BlacklistMirror:
+    """Get the process-wide blacklist mirror."""
+    global _mirror_instance
+    if _mirror_instance is None:
+        _mirror_instance = BlacklistMirror()
+    return _mirror_instance
@@ -2,10 +2,11 @@
 
 from typing import Optional
 
-import redis
+import redis.asyncio as aioredis
 
 from app.auth.application.port.token_blacklist_port import TokenBlacklistPort
-from app.config.redis_config import get_redis
+from app.auth.infrastructure.cache.blacklist_mirror import BlacklistMirror, get_blacklist_mirror
+from app.config.redis_config import get_async_redis
 
 
 class TokenBlacklistImpl(TokenBlacklistPort):
@@ -17,23 +18,32 @@ class TokenBlacklistImpl(TokenBlacklistPort):
 
     The TTL should match the token's remaining validity period,
     so entries auto-expire when the token would have expired anyway.
+
+    Changes are published on BlacklistMirror.CHANNEL so every worker's local
+    mirror stays current; lookups hit Redis only while the mirror is not ready.
     """
 
     KEY_PREFIX = "blacklist:"
 
-    def __init__(self, redis_client: Optional[redis.Redis] = None):
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        mirror: Optional[BlacklistMirror] = None,
+    ):
         """Initialize with Redis client.
 
         Args:
             redis_client: Redis client instance. Uses default if not provided.
+            mirror: Local blacklist mirror. Uses the process-wide one if not provided.
         """
-        self._redis = redis_client or get_redis()
+        self._redis = redis_client or get_async_redis()
+        self._mirror = mirror or get_blacklist_mirror()
 
     def _make_key(self, jti: str) -> str:
         """Create Redis key for blacklisted token."""
         return f"{self.KEY_PREFIX}{jti}"
 
-    def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
+    async def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
         """Add a token ID to the blacklist.
 
         Args:
@@ -41,9 +51,13 @@ class TokenBlacklistImpl(TokenBlacklistPort):
             ttl_seconds: Time-to-live in seconds (should match token expiry).
         """
         key = self._make_key(jti)
-        self._redis.setex(key, ttl_seconds, "1")
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.setex(key, ttl_seconds, "1")
+            pipe.publish(BlacklistMirror.CHANNEL, f"add:{ttl_seconds}:{jti}")
+            await pipe.execute()
+        self._mirror.add(jti, ttl_seconds)
 
-    def is_blacklisted(self, jti: str) -> bool:
+    async def is_blacklisted(self, jti: str) -> bool:
         """Check if a token ID is blacklisted.
 
         Args:
@@ -52,14 +66,20 @@ class TokenBlacklistImpl(TokenBlacklistPort):
         Returns:
             True if the token is blacklisted, False otherwise.
         """
+        if self._mirror.ready:
+            return self._mirror.contains(jti)
         key = self._make_key(jti)
-        return self._redis.exists(key) > 0
+        return await self._redis.exists(key) > 0
 
-    def remove_from_blacklist(self, jti: str) -> None:
+    async def remove_from_blacklist(self, jti: str) -> None:
         """Remove a token ID from the blacklist.
 
         Args:
             jti: The JWT ID (jti claim) to remove.
         """
         key = self._make_key(jti)
-        self._redis.delete(key)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            pipe.publish(BlacklistMirror.CHANNEL, f"del:{jti}")
+            await pipe.execute()
+        self._mirror.remove(jti)
@@ -0,0 +1,84 @@
+"""In-process cache of validated JWT payloads."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.auth.application.port.jwt_token_port import TokenPayload
+
+
+class ValidatedTokenCache:
+    """Short-TTL LRU of payloads whose signature and expiry were already verified.
+
+    Entries are keyed by the SHA-256 of the raw token so tokens are never kept
+    in memory. An entry never outlives the token's own `exp`. Blacklist checks
+    are NOT cached here; callers must still consult the blacklist.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached payloads.
+            ttl_seconds: How long a verified payload may be reused.
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[TokenPayload, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[TokenPayload]:
+        """Return the cached payload for a token, or None on miss/expiry."""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, token: str, payload: TokenPayload) -> None:
+        """Cache a freshly verified payload."""
+        remaining = (payload.exp - datetime.now(timezone.utc)).total_seconds()
+        ttl = min(self._ttl, remaining)
+        if ttl <= 0:
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (payload, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size (for /metrics)."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+_cache_instance: Optional[ValidatedTokenCache] = None
+
+
+def get_validated_token_cache() -> ValidatedTokenCache:
+    """Get the process-wide validated token cache."""
+    global _cache_instance
+    if _cache_instance is None:
+        from app.config.settings import settings
+        _cache_instance = ValidatedTokenCache(
+            max_entries=settings.JWT_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.JWT_CACHE_TTL_SECONDS,
+        )
+    return _cache_instance
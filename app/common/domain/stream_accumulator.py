@@ -0,0 +1,97 @@
+"""Accumulator for streamed LLM replies."""
+
+import time
+from typing import Callable, Optional
+
+
+class StreamAccumulator:
+    """Collects streamed text chunks without quadratic string concatenation.
+
+    Chunks are kept in a list and joined once on demand. Alongside the text it
+    tracks chunk/char/byte counts and first-chunk / inter-chunk timing so that
+    the same object can feed metrics and usage metering.
+    """
+
+    __slots__ = (
+        "_parts",
+        "_text",
+        "_token_counter",
+        "chunk_count",
+        "char_count",
+        "byte_count",
+        "started_at",
+        "first_chunk_at",
+        "last_chunk_at",
+        "max_gap",
+    )
+
+    def __init__(self, token_counter: Optional[Callable[[str], int]] = None):
+        """Initialize an empty accumulator.
+
+        Args:
+            token_counter: Function used by token_count. Defaults to a
+                len // 4 estimate.
+        """
+        self._parts: list[str] = []
+        self._text: Optional[str] = ""
+        self._token_counter = token_counter or (lambda text: len(text) // 4)
+        self.chunk_count = 0
+        self.char_count = 0
+        self.byte_count = 0
+        self.started_at = time.perf_counter()
+        self.first_chunk_at: Optional[float] = None
+        self.last_chunk_at: Optional[float] = None
+        self.max_gap = 0.0
+
+    def append(self, chunk: str, encoded: Optional[bytes] = None) -> str:
+        """Add a chunk and return it unchanged.
+
+        Args:
+            chunk: Text chunk from the stream.
+            encoded: UTF-8 bytes of the chunk if the caller already has them.
+        """
+        if not chunk:
+            return chunk
+
+        now = time.perf_counter()
+        if self.first_chunk_at is None:
+            self.first_chunk_at = now
+        else:
+            self.max_gap = max(self.max_gap, now - self.last_chunk_at)
+        self.last_chunk_at = now
+
+        self._parts.append(chunk)
+        self._text = None
+        self.chunk_count += 1
+        self.char_count += len(chunk)
+        self.byte_count += len(encoded) if encoded is not None else len(chunk.encode("utf-8"))
+        return chunk
+
+    @property
+    def text(self) -> str:
+        """Full text received so far (joined once and cached)."""
+        if self._text is None:
+            self._text = "".join(self._parts)
+            self._parts = [self._text]
+        return self._text
+
+    @property
+    def token_count(self) -> int:
+        """Estimated output tokens of the accumulated text."""
+        return self._token_counter(self.text)
+
+    @property
+    def time_to_first_chunk(self) -> Optional[float]:
+        """Seconds between creation and the first chunk, or None if empty."""
+        if self.first_chunk_at is None:
+            return None
+        return self.first_chunk_at - self.started_at
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds between creation and the last chunk (or now if empty)."""
+        end = self.last_chunk_at if self.last_chunk_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def __len__(self) -> int:
+        return self.char_count
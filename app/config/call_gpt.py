@@ -1,47 +1,37 @@
 """OpenAI GPT API 호출 모듈."""
 
+import math
 import os
-from typing import Optional, AsyncIterator, List, Any
+from functools import lru_cache
+from typing import AsyncIterator, Callable, List, Any, Optional
 
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
 
-load_dotenv()
+from app.config.llm import LlmGatewayBusy, get_llm_gateway
+from app.conversation.application.exception.llm_exception import LlmBusyException
+from app.conversation.application.port.out.llm_chat_port import LlmChatPort, LlmUsage
 
-# 환경 변수 검증
-MAX_TOKENS_ENV = os.getenv("MAX_TOKENS")
-if not MAX_TOKENS_ENV:
-    raise ValueError("MAX_TOKENS environment variable is required")
+load_dotenv()
 
-try:
-    MAX_TOKENS = int(MAX_TOKENS_ENV)
-except ValueError as e:
-    raise ValueError(f"MAX_TOKENS must be a valid integer: {e}") from e
 
-# OpenAI 클라이언트 초기화
-_async_client: Optional[AsyncOpenAI] = None
+@lru_cache(maxsize=1)
+def _max_tokens() -> int:
+    """MAX_TOKENS 환경 변수 검증 (import 시점이 아닌 첫 호출 시점)."""
+    max_tokens_env = os.getenv("MAX_TOKENS")
+    if not max_tokens_env:
+        raise ValueError("MAX_TOKENS environment variable is required")
 
+    try:
+        return int(max_tokens_env)
+    except ValueError as e:
+        raise ValueError(f"MAX_TOKENS must be a valid integer: {e}") from e
 
-def get_async_client() -> AsyncOpenAI:
-    """비동기 클라이언트 싱글톤 인스턴스 반환"""
-    global _async_client
-    if _async_client is None:
-        _async_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    return _async_client
 
+def _build_messages(prompt: str, file_urls: list[str] = None) -> List[Any]:
+    """프롬프트와 이미지 URL 을 단일 user 메시지로 구성합니다.
 
-async def _create_chat_completion_stream(prompt: str, file_urls: list[str] = None) -> AsyncIterator[str]:
-    """비동기 방식으로 GPT API를 호출합니다.
-    
-    Args:
-        prompt: 사용자 프롬프트
-        
-    Returns:
-        GPT 응답 텍스트
-        
     Raises:
         ValueError: 프롬프트가 비어있는 경우
-        Exception: OpenAI API 호출 실패 시
     """
 
     if isinstance(prompt, str):
@@ -51,7 +41,6 @@ async def _create_chat_completion_stream(prompt: str, file_urls: list[str] = Non
     else:
         actual_prompt = str(prompt)
 
-    client = get_async_client()
     file_urls = file_urls or []
 
     # 1. 텍스트와 이미지를 포함한 메시지 구성
@@ -64,30 +53,33 @@ async def _create_chat_completion_stream(prompt: str, file_urls: list[str] = Non
                 "type": "image_url",
                 "image_url": {"url": url}
             })
-    
+
     # 타입 안전성을 위해 딕셔너리를 명시적으로 구성
-    messages: List[Any] = [
-        {"role": "user", "content": content}
-    ]
-    try:
-        response = await client.chat.completions.create(
-            model="gpt-4.1",
-            messages=messages,
-            max_tokens=MAX_TOKENS,
-            temperature=0,
-            stream=True
-        )
+    return [{"role": "user", "content": content}]
 
-        async for chunk in response:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
 
-    except Exception as e:
-        raise Exception(f"Failed to call GPT API: {str(e)}") from e
+class CallGPT(LlmChatPort):
+    """LLM 게이트웨이를 통해 GPT 를 비동기로 호출하는 클래스.
 
+    업스트림 클라이언트, 커넥션 풀, 동시 실행 제한은 모두 게이트웨이가 관리합니다.
+    """
 
-class CallGPT:
-    """OpenAI GPT API를 비동기로 호출하는 클래스."""
+    async def stream_chat(
+        self,
+        messages: list[dict],
+        cache_key: Optional[str] = None,
+        on_usage: Optional[Callable[[LlmUsage], None]] = None,
+    ) -> AsyncIterator[str]:
+        """역할이 구분된 메시지 목록으로 호출합니다 (시스템 접두부가 고정되어 프롬프트 캐시에 유리)."""
+        try:
+            async for chunk in get_llm_gateway().stream(
+                messages, max_tokens=_max_tokens(), cache_key=cache_key, on_usage=on_usage
+            ):
+                yield chunk
+        except LlmGatewayBusy as e:
+            raise LlmBusyException(str(e), retry_after=math.ceil(e.retry_after)) from e
+        except Exception as e:
+            raise Exception(f"Failed to call GPT API: {str(e)}") from e
 
     @staticmethod
     async def call_gpt(prompt: str, file_urls: list[str] = None) -> AsyncIterator[str]:
@@ -104,7 +96,8 @@ class CallGPT:
             Exception: OpenAI API 호출 실패 시
         """
         try:
-            async for chunk in _create_chat_completion_stream(prompt, file_urls):
+            messages = _build_messages(prompt, file_urls)
+            async for chunk in get_llm_gateway().stream(messages, max_tokens=_max_tokens()):
                 yield chunk
         except Exception as e:
             raise Exception(f"CallGPT 중계 에러: {str(e)}")
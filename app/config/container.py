@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from fastapi import Request
+
+from app.auth.infrastructure.cache.session_repository_impl import SessionRepositoryImpl
+from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl
+from app.auth.infrastructure.cache.validated_token_cache import get_validated_token_cache
+from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService
+from app.config.call_gpt import CallGPT
+from app.config.s3_service import S3Service
+from app.config.security.message_crypto import AESEncryption
+from app.conversation.infrastructure.background.chat_stream_runner import ChatStreamRunner
+from app.conversation.infrastructure.background.room_summary_scheduler import RoomSummaryScheduler
+from app.conversation.infrastructure.cache.decrypted_history_cache import DecryptedHistoryCache
+from app.conversation.infrastructure.repository.usage_meter_impl import UsageMeterImpl
+
+
+@dataclass(frozen=True)
+class AppContainer:
+    """
+    요청마다 만들 필요가 없는 무상태 서비스 묶음.
+    lifespan 에서 한 번 만들어 app.state.container 에 둔다 (라우터 import 시점에는 아무것도 만들지 않는다).
+    """
+    crypto: AESEncryption
+    s3_service: S3Service
+    session_repository: SessionRepositoryImpl
+    token_blacklist: TokenBlacklistImpl
+    jwt_service: JWTTokenService
+    llm_chat_port: CallGPT
+    usage_meter: UsageMeterImpl
+    history_cache: DecryptedHistoryCache
+    summary_scheduler: RoomSummaryScheduler
+    stream_runner: ChatStreamRunner
+
+
+def _stream_usecase_factory(
+        crypto: AESEncryption,
+        s3_service: S3Service,
+        llm_chat_port: CallGPT,
+        usage_meter: UsageMeterImpl,
+        history_cache: DecryptedHistoryCache,
+        summary_scheduler: RoomSummaryScheduler,
+) -> Callable:
+    # 백그라운드 생성 태스크가 자기 세션으로 유스케이스를 만든다
+    def build(db, account_db):
+        from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
+        from app.conversation.application.usecase.stream_chat_usecase import StreamChatUsecase
+        from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
+        from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl
+        from app.conversation.infrastructure.repository.chat_room_summary_repository_impl import (
+            ChatRoomSummaryRepositoryImpl,
+        )
+        return StreamChatUsecase(
+            chat_room_repo=ChatRoomRepositoryImpl(db),
+            chat_message_repo=ChatMessageRepositoryImpl(db),
+            account_repo=AccountRepositoryImpl(account_db),  # account 도메인은 동기 세션 유지
+            llm_chat_port=llm_chat_port,
+            usage_meter=usage_meter,
+            crypto_service=crypto,
+            s3_service=s3_service,
+            summary_repo=ChatRoomSummaryRepositoryImpl(db),
+            summary_scheduler=summary_scheduler,
+            history_cache=history_cache,
+        )
+    return build
+
+
+def build_container() -> AppContainer:
+    from app.config.redis_config import get_async_redis, get_stream_read_redis
+    from app.config.settings import settings
+    from app.conversation.infrastructure.background.usage_event_writer import get_usage_event_writer
+    from app.conversation.infrastructure.observability.metrics import register_cache_stats
+    from app.conversation.infrastructure.stream.memory_stream_buffer import InMemoryStreamBuffer
+    from app.conversation.infrastructure.stream.redis_stream_buffer import RedisStreamBuffer
+
+    token_blacklist = TokenBlacklistImpl()
+    crypto = AESEncryption()
+    s3_service = S3Service()
+    llm_chat_port = CallGPT()
+    usage_meter = UsageMeterImpl(
+        get_async_redis(),
+        get_usage_event_writer(),
+        window_seconds=settings.USAGE_WINDOW_SECONDS,
+        bucket_seconds=settings.USAGE_BUCKET_SECONDS,
+    )
+    summary_scheduler = RoomSummaryScheduler(llm_chat_port, crypto)
+    history_cache = DecryptedHistoryCache(
+        max_rooms=settings.CHAT_HISTORY_CACHE_MAX_ROOMS,
+        max_messages_per_room=settings.CHAT_HISTORY_CACHE_MAX_MESSAGES,
+        redis_client=get_async_redis() if settings.CHAT_HISTORY_CACHE_REDIS_ENABLED else None,
+        redis_ttl_seconds=settings.CHAT_HISTORY_CACHE_REDIS_TTL_SECONDS,
+        encryption_key=crypto.key,
+    )
+    register_cache_stats("decrypted_history", history_cache.stats)
+
+    stream_runner = ChatStreamRunner(
+        buffer=(
+            InMemoryStreamBuffer(settings.STREAM_BUFFER_TTL_SECONDS)
+            if settings.STREAM_BUFFER_BACKEND == "memory"
+            else RedisStreamBuffer(
+                get_async_redis(), settings.STREAM_BUFFER_TTL_SECONDS, read_client=get_stream_read_redis()
+            )
+        ),
+        usecase_factory=_stream_usecase_factory(
+            crypto, s3_service, llm_chat_port, usage_meter, history_cache, summary_scheduler
+        ),
+        ttl_seconds=settings.STREAM_BUFFER_TTL_SECONDS,
+        attach_idle_timeout_seconds=settings.STREAM_ATTACH_IDLE_TIMEOUT_SECONDS,
+        # 쓰기 쪽도 읽기 쪽과 같은 창으로 델타를 묶는다
+        append_max_delay_seconds=settings.STREAM_COALESCE_MS / 1000,
+        append_max_bytes=settings.STREAM_COALESCE_BYTES,
+    )
+
+    return AppContainer(
+        crypto=crypto,
+        s3_service=s3_service,
+        session_repository=SessionRepositoryImpl(),
+        token_blacklist=token_blacklist,
+        jwt_service=JWTTokenService(blacklist=token_blacklist, token_cache=get_validated_token_cache()),
+        llm_chat_port=llm_chat_port,
+        usage_meter=usage_meter,
+        history_cache=history_cache,
+        summary_scheduler=summary_scheduler,
+        stream_runner=stream_runner,
+    )
+
+
+def get_container(request: Request) -> AppContainer:
+    """FastAPI 의존성: lifespan 에서 만든 컨테이너"""
+    return request.app.state.container
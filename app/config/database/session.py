@@ -1,8 +1,10 @@
 import os
 import urllib.parse
+from typing import AsyncIterator
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 load_dotenv()
@@ -15,6 +17,14 @@ DATABASE_URL = (
     f"?charset=utf8mb4"
 )
 
+# 비동기 드라이버(aiomysql) URL
+# 테스트/로컬에서는 ASYNC_DATABASE_URL=sqlite+aiosqlite:///./test.db 처럼 덮어쓸 수 있다.
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or (
+    f"mysql+aiomysql://{os.getenv('MYSQL_USER')}:{password}"
+    f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
+    f"?charset=utf8mb4"
+)
+
 engine = create_engine(
     DATABASE_URL,
     echo=True,
@@ -27,6 +37,32 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def _async_engine_options(url: str) -> dict:
+    """SQLite(aiosqlite)는 커넥션 풀 옵션을 지원하지 않으므로 분기한다."""
+    if url.startswith("sqlite"):
+        return {"echo": False}
+
+    return {
+        "echo": False,
+        "pool_pre_ping": True,
+        "pool_size": int(os.getenv("ASYNC_DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "20")),
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+    }
+
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_async_engine_options(ASYNC_DATABASE_URL))
+
+# expire_on_commit=False: commit 이후 속성 접근 시 lazy reload(I/O)가 일어나지 않도록 한다.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 def get_db_session():
@@ -36,3 +72,9 @@ def get_db_session():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db_session() -> AsyncIterator[AsyncSession]:
+    """이벤트 루프를 막지 않는 비동기 DB 세션 의존성"""
+    async with AsyncSessionLocal() as db:
+        yield db
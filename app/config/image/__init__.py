@@ -0,0 +1,9 @@
+# 워커 프로세스가 이 패키지를 import 하므로 settings 등 무거운 의존성은 지연 로딩한다.
+from app.config.image.pipeline import (
+    ImagePipeline,
+    ImagePipelineBusy,
+    ProcessedImage,
+    get_image_pipeline,
+)
+
+__all__ = ["ImagePipeline", "ImagePipelineBusy", "ProcessedImage", "get_image_pipeline"]
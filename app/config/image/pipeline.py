@@ -0,0 +1,101 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from app.conversation.infrastructure.observability.metrics import STAGE_SECONDS
+
+_FORMAT_META = {
+    "WEBP": (".webp", "image/webp"),
+    "JPEG": (".jpg", "image/jpeg"),
+}
+
+
+class ImagePipelineBusy(Exception):
+    """대기열이 가득 차 새 이미지를 받을 수 없음 (503 으로 응답)"""
+    pass
+
+
+@dataclass
+class ProcessedImage:
+    data: bytes
+    extension: str
+    content_type: str
+    timings: dict
+
+
+class ImagePipeline:
+    """
+    이벤트 루프 밖(프로세스 풀)에서 이미지 압축을 수행한다.
+    처리 중 + 대기 중 작업 수가 max_pending 을 넘으면 즉시 거절한다.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        max_side: int = 2048,
+        target_format: str = "JPEG",
+        quality: int = 95,
+    ):
+        target_format = target_format.upper()
+        if target_format not in _FORMAT_META:
+            raise ValueError(f"unsupported image format: {target_format}")
+
+        self.max_pending = max_pending
+        self.max_side = max_side
+        self.target_format = target_format
+        self.quality = quality
+
+        # fork 된 워커가 이벤트 루프/커넥션 상태를 물려받지 않도록 spawn 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._pending = 0
+
+    async def process(self, data: bytes) -> ProcessedImage:
+        if self._pending >= self.max_pending:
+            raise ImagePipelineBusy("이미지 처리 대기열이 가득 찼습니다.")
+
+        # Pillow 는 첫 이미지 업로드 때 로드 (기동 시간에서 제외)
+        from app.config.image.worker import compress_image
+
+        self._pending += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result, fmt, timings = await loop.run_in_executor(
+                self._executor, compress_image, data, self.max_side, self.target_format, self.quality
+            )
+        finally:
+            self._pending -= 1
+
+        # 워커 내부 단계 외 큐 대기 + 전송 시간
+        timings["queue"] = max(0.0, time.perf_counter() - started - sum(timings.values()))
+        for stage, seconds in timings.items():
+            STAGE_SECONDS.labels(flow="image_upload", stage=stage).observe(seconds)
+
+        extension, content_type = _FORMAT_META[fmt]
+        return ProcessedImage(result, extension, content_type, timings)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 이미지 파이프라인 인스턴스 (Singleton)
+_pipeline_instance = None
+
+
+def get_image_pipeline() -> ImagePipeline:
+    global _pipeline_instance
+    if _pipeline_instance is None:
+        from app.config.settings import settings
+        _pipeline_instance = ImagePipeline(
+            workers=settings.IMAGE_PIPELINE_WORKERS,
+            max_pending=settings.IMAGE_PIPELINE_MAX_PENDING,
+            max_side=settings.IMAGE_MAX_SIDE,
+            target_format=settings.IMAGE_TARGET_FORMAT,
+            quality=settings.IMAGE_TARGET_QUALITY,
+        )
+    return _pipeline_instance
@@ -0,0 +1,40 @@
+from app.config.llm.gateway import LlmGateway, LlmGatewayBusy
+from app.config.llm.provider import LlmProvider
+from app.conversation.application.port.out.llm_chat_port import LlmUsage
+
+# LLM 게이트웨이 인스턴스 (Singleton)
+_gateway_instance = None
+
+
+def get_llm_gateway() -> LlmGateway:
+    """LLM_PROVIDER 설정에 따라 프로세스 공용 게이트웨이를 반환"""
+    global _gateway_instance
+    if _gateway_instance is None:
+        from app.config.settings import settings
+
+        if settings.LLM_PROVIDER == "stub":
+            from app.config.llm.stub_provider import StubProvider
+            provider = StubProvider(
+                first_token_latency_ms=settings.LLM_STUB_FIRST_TOKEN_LATENCY_MS,
+                token_latency_ms=settings.LLM_STUB_TOKEN_LATENCY_MS,
+                token_count=settings.LLM_STUB_TOKEN_COUNT,
+            )
+        else:
+            from app.config.llm.openai_provider import OpenAIProvider
+            provider = OpenAIProvider(
+                api_key=settings.OPENAI_API_KEY,
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                timeout_seconds=settings.LLM_REQUEST_TIMEOUT_SECONDS,
+            )
+
+        _gateway_instance = LlmGateway(
+            provider=provider,
+            default_model=settings.LLM_MODEL,
+            max_concurrency_per_model=settings.LLM_MAX_CONCURRENCY_PER_MODEL,
+            queue_timeout_seconds=settings.LLM_QUEUE_TIMEOUT_SECONDS,
+        )
+    return _gateway_instance
+
+
+__all__ = ["LlmGateway", "LlmGatewayBusy", "LlmProvider", "LlmUsage", "get_llm_gateway"]
@@ -0,0 +1,126 @@
+import asyncio
+import time
+from typing import AsyncIterator, Callable, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.config.llm.provider import LlmProvider
+from app.conversation.application.port.out.llm_chat_port import LlmUsage
+
+LLM_QUEUE_WAIT = Histogram(
+    "llm_queue_wait_seconds",
+    "모델별 동시 실행 슬롯을 얻기까지 대기한 시간",
+    ["model"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+LLM_IN_FLIGHT = Gauge(
+    "llm_in_flight_streams",
+    "진행 중인 업스트림 스트림 수",
+    ["model"],
+    multiprocess_mode="livesum",
+)
+
+
+LLM_PROMPT_TOKENS = Counter(
+    "llm_prompt_tokens_total",
+    "업스트림이 보고한 프롬프트 토큰 수 (cache=cached 는 프롬프트 캐시로 처리된 토큰)",
+    ["model", "cache"],
+)
+
+LLM_COMPLETION_TOKENS = Counter(
+    "llm_completion_tokens_total",
+    "업스트림이 보고한 응답 토큰 수",
+    ["model"],
+)
+
+
+class LlmGatewayBusy(Exception):
+    """모델 동시 실행 슬롯을 queue_timeout 안에 얻지 못함"""
+
+    def __init__(self, message: str, retry_after: float = 1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LlmGateway:
+    """
+    모든 LLM 호출이 지나가는 단일 관문.
+    모델별 세마포어로 동시 업스트림 스트림 수를 제한하고 대기 시간을 기록한다.
+    슬롯은 스트림이 끝날 때까지 유지된다.
+    """
+
+    def __init__(
+        self,
+        provider: LlmProvider,
+        default_model: str,
+        max_concurrency_per_model: int,
+        queue_timeout_seconds: float,
+        temperature: float = 0,
+    ):
+        self.provider = provider
+        self.default_model = default_model
+        self.max_concurrency = max_concurrency_per_model
+        self.queue_timeout = queue_timeout_seconds
+        self.temperature = temperature
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, model: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(model)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[model] = semaphore
+        return semaphore
+
+    async def stream(
+        self,
+        messages: list[dict],
+        model: str | None = None,
+        max_tokens: int | None = None,
+        cache_key: str | None = None,
+        on_usage: Optional[Callable[[LlmUsage], None]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        텍스트 조각만 yield 한다. 업스트림 사용량은 지표로 기록하고 on_usage 로 넘긴다.
+        """
+        model = model or self.default_model
+        semaphore = self._semaphore(model)
+
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise LlmGatewayBusy(
+                f"LLM 동시 실행 한도 초과 (model={model})", retry_after=max(1.0, self.queue_timeout)
+            )
+        finally:
+            LLM_QUEUE_WAIT.labels(model=model).observe(time.perf_counter() - started)
+
+        LLM_IN_FLIGHT.labels(model=model).inc()
+        try:
+            async for chunk in self.provider.stream(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=self.temperature,
+                cache_key=cache_key,
+            ):
+                if isinstance(chunk, LlmUsage):
+                    self._record_usage(model, chunk)
+                    if on_usage is not None:
+                        on_usage(chunk)
+                    continue
+                yield chunk
+        finally:
+            LLM_IN_FLIGHT.labels(model=model).dec()
+            semaphore.release()
+
+    @staticmethod
+    def _record_usage(model: str, usage: LlmUsage) -> None:
+        cached = min(usage.cached_tokens, usage.prompt_tokens)
+        LLM_PROMPT_TOKENS.labels(model=model, cache="cached").inc(cached)
+        LLM_PROMPT_TOKENS.labels(model=model, cache="uncached").inc(usage.prompt_tokens - cached)
+        LLM_COMPLETION_TOKENS.labels(model=model).inc(usage.completion_tokens)
+
+    async def aclose(self) -> None:
+        await self.provider.aclose()
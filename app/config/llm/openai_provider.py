@@ -0,0 +1,65 @@
+from typing import AsyncIterator
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.config.llm.provider import LlmProvider
+from app.conversation.application.port.out.llm_chat_port import LlmUsage
+
+
+class OpenAIProvider(LlmProvider):
+    """
+    프로세스 공용 AsyncOpenAI 클라이언트.
+    httpx 커넥션 풀 크기를 명시해 동시 스트림 수에 맞춘다.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        max_connections: int,
+        max_keepalive_connections: int,
+        timeout_seconds: float,
+    ):
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=httpx.Timeout(timeout_seconds, connect=10.0),
+        )
+        self.client = AsyncOpenAI(api_key=api_key, http_client=self._http_client)
+
+    async def stream(
+        self,
+        model: str,
+        messages: list[dict],
+        max_tokens: int | None,
+        temperature: float,
+        cache_key: str | None = None,
+    ) -> AsyncIterator[str | LlmUsage]:
+        params = {"max_tokens": max_tokens} if max_tokens else {}
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            stream=True,
+            # 마지막 청크(choices 비어 있음)로 usage 를 받는다
+            stream_options={"include_usage": True},
+            # SDK 버전과 무관하게 전달되도록 extra_body 로 넘긴다
+            extra_body={"prompt_cache_key": cache_key} if cache_key else None,
+            **params,
+        )
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            usage = getattr(chunk, "usage", None)
+            if usage is not None:
+                details = getattr(usage, "prompt_tokens_details", None)
+                yield LlmUsage(
+                    prompt_tokens=usage.prompt_tokens or 0,
+                    completion_tokens=usage.completion_tokens or 0,
+                    cached_tokens=getattr(details, "cached_tokens", None) or 0,
+                )
+
+    async def aclose(self) -> None:
+        await self.client.close()
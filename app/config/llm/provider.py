@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+# 사용량 타입은 포트가 정의하고 provider 는 그에 맞춰 보고한다
+from app.conversation.application.port.out.llm_chat_port import LlmUsage
+
+
+class LlmProvider(ABC):
+    """업스트림 LLM 스트리밍 호출 (OpenAI / 로컬 stub)"""
+
+    @abstractmethod
+    def stream(
+        self,
+        model: str,
+        messages: list[dict],
+        max_tokens: int | None,
+        temperature: float,
+        cache_key: str | None = None,
+    ) -> AsyncIterator[str | LlmUsage]:
+        """
+        응답 텍스트 조각을 도착하는 대로 yield (max_tokens=None 이면 모델 기본값).
+        사용량을 알 수 있으면 마지막에 LlmUsage 를 한 번 yield 한다.
+        cache_key 는 같은 프롬프트 접두부를 쓰는 요청을 묶는 업스트림 캐시 힌트.
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """커넥션 풀 등 리소스 정리"""
+        pass
@@ -0,0 +1,41 @@
+import asyncio
+from typing import AsyncIterator
+
+from app.config.llm.provider import LlmProvider
+from app.conversation.application.port.out.llm_chat_port import LlmUsage
+
+_CANNED_TOKENS = (
+    "말씀해 주셔서 고마워요. ", "지금 많이 ", "속상하셨을 것 같아요. ",
+    "상대방의 ", "입장에서 ", "한 번 ", "생각해 보면 ", "어떨까요? ",
+)
+
+
+class StubProvider(LlmProvider):
+    """
+    업스트림 호출 없이 정해진 토큰을 정해진 지연으로 흘려보내는 로컬 provider.
+    처리량/백프레셔 부하 테스트용이며 같은 입력에 항상 같은 출력을 낸다.
+    """
+
+    def __init__(self, first_token_latency_ms: int, token_latency_ms: int, token_count: int):
+        self.first_token_latency = first_token_latency_ms / 1000
+        self.token_latency = token_latency_ms / 1000
+        self.token_count = token_count
+
+    async def stream(
+        self,
+        model: str,
+        messages: list[dict],
+        max_tokens: int | None,
+        temperature: float,
+        cache_key: str | None = None,
+    ) -> AsyncIterator[str | LlmUsage]:
+        await asyncio.sleep(self.first_token_latency)
+        count = min(self.token_count, max_tokens or self.token_count)
+        for i in range(count):
+            if i:
+                await asyncio.sleep(self.token_latency)
+            yield _CANNED_TOKENS[i % len(_CANNED_TOKENS)]
+
+        # 프롬프트 토큰은 글자 수 기반 추정 (캐시는 흉내 내지 않는다)
+        prompt_chars = sum(len(str(m.get("content", ""))) for m in messages)
+        yield LlmUsage(prompt_tokens=prompt_chars // 4, completion_tokens=count)
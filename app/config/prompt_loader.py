@@ -1,12 +1,130 @@
 # app/config/prompt_loader.py
 
-import yaml
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트에서 찾기 (app/config에서 3단계 위로)
+_CONFIG_PATH = Path(__file__).parent.parent.parent / "prompts.yaml"
+
+# 미리 컴파일되지 않은 조합(자유 입력 성별 등)을 스냅샷마다 캐시하는 최대 개수
+_ON_DEMAND_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """
+    완성된 시스템 프롬프트.
+    prefix_hash 는 text 의 sha256 앞부분으로, 같은 접두부를 쓰는 요청끼리 같은 값을 가진다
+    (업스트림 프롬프트 캐시 키 / 지표 라벨용).
+    """
+    text: str
+    prefix_hash: str
+
+    @classmethod
+    def of(cls, text: str) -> "CompiledPrompt":
+        return cls(text=text, prefix_hash=hashlib.sha256(text.encode("utf-8")).hexdigest()[:16])
+
+
+class CompiledPrompts:
+    """prompts.yaml 한 버전을 컴파일한 불변 스냅샷"""
+
+    def __init__(self, raw: dict, version: str):
+        self.version = version
+        self.base_prompt: str = raw["system_prompt"]["base"]
+        self._guides: dict = raw["mbti_guides"]
+        self._default_guide: str = raw["default_guide"]
+        self._counselor_cfg: dict = raw["counselor"]
+        self._persona_cfg: dict = raw["simulation_persona"]
+
+        mbtis = list(self._guides)
+        genders = list(raw.get("precompile_genders", []))
+
+        # 상담: (MBTI | None) x (성별 | None), 시뮬레이션: MBTI x 성별
+        self._counselor = MappingProxyType({
+            (mbti, gender): CompiledPrompt.of(self._compile_counselor(mbti, gender))
+            for mbti in [None, *mbtis]
+            for gender in [None, *genders]
+        })
+        self._persona = MappingProxyType({
+            (mbti, gender): CompiledPrompt.of(self._compile_persona(mbti, gender))
+            for mbti in mbtis
+            for gender in genders
+        })
+        self._on_demand: dict = {}
+
+    def mbti_guide(self, mbti: str) -> str:
+        return self._guides.get(mbti, self._default_guide)
+
+    def _compile_counselor(self, mbti: Optional[str], gender: Optional[str]) -> str:
+        cfg = self._counselor_cfg
+        lines = [cfg["instruction"]]
+        if mbti or gender:
+            lines.append(cfg["profile_header"])
+            if mbti:
+                lines.append(cfg["profile_mbti"].format(mbti=mbti, guide=self.mbti_guide(mbti)))
+            if gender:
+                lines.append(cfg["profile_gender"].format(gender=gender))
+            lines.append(cfg["profile_footer"])
+        return "\n".join(lines)
+
+    def _compile_persona(self, mbti: str, gender: str) -> str:
+        cfg = self._persona_cfg
+        style_guide = "\n".join(
+            trait["present"] if trait["letter"] in mbti else trait["absent"]
+            for trait in cfg["traits"]
+        )
+        return cfg["template"].format(mbti=mbti, gender=gender, style_guide=style_guide)
+
+    def _on_demand_lookup(self, key: tuple, compile_fn) -> CompiledPrompt:
+        compiled = self._on_demand.get(key)
+        if compiled is None:
+            compiled = CompiledPrompt.of(compile_fn(*key[1:]))
+            if len(self._on_demand) < _ON_DEMAND_CACHE_SIZE:
+                self._on_demand[key] = compiled
+        return compiled
+
+    def counselor(self, mbti: Optional[str] = None, gender: Optional[str] = None) -> CompiledPrompt:
+        """상담 채팅 시스템 프롬프트 (사용자 MBTI/성별 반영)"""
+        key = (mbti or None, gender or None)
+        compiled = self._counselor.get(key)
+        if compiled is None:
+            compiled = self._on_demand_lookup(("counselor", *key), self._compile_counselor)
+        return compiled
+
+    def persona(self, mbti: str, gender: str) -> CompiledPrompt:
+        """시뮬레이션 페르소나 프롬프트 (상황을 제외한 고정 접두부)"""
+        key = (mbti.upper(), gender)
+        compiled = self._persona.get(key)
+        if compiled is None:
+            compiled = self._on_demand_lookup(("persona", *key), self._compile_persona)
+        return compiled
+
+    def situation(self, topic: str) -> str:
+        """페르소나 뒤에 붙는 상황 설명 (사용자 입력)"""
+        return self._persona_cfg["situation"].format(topic=topic)
+
+    @property
+    def opening(self) -> str:
+        return self._persona_cfg["opening"]
 
 
 class PromptLoader:
+    """
+    prompts.yaml 을 컴파일해 CompiledPrompts 스냅샷으로 제공한다.
+    파일 mtime 을 최대 PROMPT_RELOAD_CHECK_SECONDS 마다 확인해 바뀌면 다시 컴파일한다.
+    컴파일에 실패하면 이전 스냅샷을 계속 쓴다.
+    """
     _instance = None
-    _prompts = None
+    _compiled = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -14,23 +132,64 @@ class PromptLoader:
         return cls._instance
 
     def __init__(self):
-        if self._prompts is None:
-            # 프로젝트 루트에서 찾기
-            project_root = Path(__file__).parent.parent.parent  # app/config에서 3단계 위로
-            config_path = project_root / "prompts.yaml"
+        if self._compiled is None:
+            from app.config.settings import settings
+
+            self._path = _CONFIG_PATH
+            self._check_interval = settings.PROMPT_RELOAD_CHECK_SECONDS
+            self._lock = threading.Lock()
+            self._mtime_ns = None
+            self._checked_at = 0.0
+            self._reload()
+
+    def _reload(self) -> None:
+        import yaml
 
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self._prompts = yaml.safe_load(f)
+        self._mtime_ns = os.stat(self._path).st_mtime_ns
+        with open(self._path, 'rb') as f:
+            content = f.read()
+        compiled = CompiledPrompts(yaml.safe_load(content), hashlib.sha256(content).hexdigest()[:12])
+        self._compiled = compiled
+        logger.info("prompts compiled: version=%s", compiled.version)
+
+    def templates(self) -> CompiledPrompts:
+        if self._check_interval > 0:
+            now = time.monotonic()
+            if now - self._checked_at >= self._check_interval:
+                self._checked_at = now
+                self._reload_if_changed()
+        return self._compiled
+
+    def _reload_if_changed(self) -> None:
+        try:
+            if os.stat(self._path).st_mtime_ns == self._mtime_ns:
+                return
+        except OSError:
+            return
+        with self._lock:
+            try:
+                self._reload()
+            except Exception:
+                logger.exception("prompts.yaml reload failed, keeping version=%s", self._compiled.version)
 
     def get_base_prompt(self) -> str:
-        return self._prompts['system_prompt']['base']
+        return self.templates().base_prompt
 
     def get_mbti_guide(self, mbti: str) -> str:
-        return self._prompts['mbti_guides'].get(
-            mbti,
-            self._prompts['default_guide']
-        )
+        return self.templates().mbti_guide(mbti)
+
+
+# 싱글톤 인스턴스 (import 시점이 아닌 첫 get_prompt_templates() 호출 / warm-up 에서 컴파일)
+_loader_instance: Optional[PromptLoader] = None
+
+
+def get_prompt_loader() -> PromptLoader:
+    global _loader_instance
+    if _loader_instance is None:
+        _loader_instance = PromptLoader()
+    return _loader_instance
 
 
-# 싱글톤 인스턴스
-prompt_loader = PromptLoader()
\ No newline at end of file
+def get_prompt_templates() -> CompiledPrompts:
+    """현재 컴파일된 프롬프트 스냅샷 (필요 시 hot reload)"""
+    return get_prompt_loader().templates()
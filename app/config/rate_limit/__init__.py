@@ -0,0 +1,42 @@
+from app.config.rate_limit.admission import AdmissionController, AdmissionRejected
+from app.config.rate_limit.token_bucket import InMemoryTokenBucket, RedisTokenBucket, retry_after_header
+
+# 프로세스 공용 인스턴스 (Singleton)
+_limiter_instance = None
+_admission_instance = None
+
+
+def get_rate_limiter() -> RedisTokenBucket | InMemoryTokenBucket:
+    """RATE_LIMIT_BACKEND 설정에 따라 토큰 버킷 리미터를 반환"""
+    global _limiter_instance
+    if _limiter_instance is None:
+        from app.config.settings import settings
+
+        if settings.RATE_LIMIT_BACKEND == "memory":
+            _limiter_instance = InMemoryTokenBucket()
+        else:
+            from app.config.redis_config import get_async_redis
+            _limiter_instance = RedisTokenBucket(get_async_redis(), InMemoryTokenBucket())
+    return _limiter_instance
+
+
+def get_admission_controller() -> AdmissionController:
+    global _admission_instance
+    if _admission_instance is None:
+        from app.config.settings import settings
+        _admission_instance = AdmissionController(
+            max_in_flight=settings.LLM_ADMISSION_MAX_IN_FLIGHT,
+            queue_timeout_seconds=settings.LLM_ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        )
+    return _admission_instance
+
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionRejected",
+    "InMemoryTokenBucket",
+    "RedisTokenBucket",
+    "get_admission_controller",
+    "get_rate_limiter",
+    "retry_after_header",
+]
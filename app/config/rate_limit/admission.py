@@ -0,0 +1,118 @@
+import asyncio
+import time
+from typing import AsyncIterator, Callable
+
+from prometheus_client import Counter, Gauge, Histogram
+
+ADMISSION_IN_FLIGHT = Gauge(
+    "llm_admission_in_flight",
+    "입장 허가를 받아 진행 중인 LLM 스트림 수",
+    multiprocess_mode="livesum",  # 살아 있는 워커 합계
+)
+
+ADMISSION_WAIT = Histogram(
+    "llm_admission_wait_seconds",
+    "입장 허가를 받기까지 대기한 시간",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+ADMISSION_REJECTED = Counter(
+    "llm_admission_rejected_total",
+    "동시 스트림 한도 초과로 거절된 요청 수",
+)
+
+
+class AdmissionRejected(Exception):
+    """queue_timeout 안에 입장 허가를 얻지 못함 (draining 이면 워커 종료 중)"""
+
+    def __init__(self, retry_after: float, draining: bool = False):
+        super().__init__("워커 종료 중" if draining else "동시 응답 생성 한도 초과")
+        self.retry_after = retry_after
+        self.draining = draining
+
+
+class AdmissionController:
+    """
+    프로세스 전체의 진행 중 LLM 스트림 수를 max_in_flight 로 제한한다.
+    한도에 닿으면 queue_timeout 동안 줄을 세우고, 그래도 자리가 없으면 거절(shed)한다.
+    허가는 스트림이 끝날 때 leave() 로 반납한다.
+    """
+
+    def __init__(self, max_in_flight: int, queue_timeout_seconds: float):
+        self.max_in_flight = max_in_flight
+        self.queue_timeout = queue_timeout_seconds
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self.in_flight = 0
+        self.draining = False
+
+    def start_draining(self) -> None:
+        """종료 시작: 이후 enter() 는 모두 거절된다 (진행 중인 스트림은 유지)"""
+        self.draining = True
+
+    async def enter(self) -> None:
+        if self.draining:
+            ADMISSION_REJECTED.inc()
+            raise AdmissionRejected(retry_after=1.0, draining=True)
+
+        started = time.perf_counter()
+        try:
+            if self.queue_timeout <= 0:
+                if self._semaphore.locked():
+                    raise asyncio.TimeoutError
+                await self._semaphore.acquire()
+            else:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            ADMISSION_REJECTED.inc()
+            raise AdmissionRejected(retry_after=max(1.0, self.queue_timeout))
+        finally:
+            ADMISSION_WAIT.observe(time.perf_counter() - started)
+        self.in_flight += 1
+        ADMISSION_IN_FLIGHT.inc()
+
+    def leave(self) -> None:
+        self.in_flight -= 1
+        ADMISSION_IN_FLIGHT.dec()
+        self._semaphore.release()
+
+    def guard(self, source: AsyncIterator) -> "AdmittedStream":
+        """source 가 끝나거나 닫힐 때 허가를 반납하는 스트림으로 감싼다"""
+        return AdmittedStream(source, self.leave)
+
+
+class AdmittedStream:
+    """
+    응답 본문이 한 번도 소비되지 않고 버려져도 허가가 반납되도록
+    async generator 대신 직접 구현한 이터레이터.
+    """
+
+    def __init__(self, source: AsyncIterator, release: Callable[[], None]):
+        self._iterator = source.__aiter__()
+        self._release = release
+        self._released = False
+
+    def _done(self) -> None:
+        if not self._released:
+            self._released = True
+            self._release()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self._iterator.__anext__()
+        except BaseException:
+            self._done()
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            aclose = getattr(self._iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        finally:
+            self._done()
+
+    def __del__(self):
+        self._done()
@@ -0,0 +1,109 @@
+import logging
+import math
+import time
+from collections import OrderedDict
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# KEYS[i] 마다 (rate, burst) 쌍을 받아 모든 버킷에 토큰이 있을 때만 하나씩 차감한다.
+# 하나라도 부족하면 아무 것도 차감하지 않고 가장 긴 대기 시간(초)을 돌려준다.
+_ACQUIRE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local levels = {}
+local retry = 0
+for i = 1, #KEYS do
+    local rate = tonumber(ARGV[i * 2])
+    local burst = tonumber(ARGV[i * 2 + 1])
+    local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or burst
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+    if tokens < 1 then
+        retry = math.max(retry, (1 - tokens) / rate)
+    end
+    levels[i] = tokens
+end
+if retry > 0 then
+    return tostring(retry)
+end
+for i = 1, #KEYS do
+    local rate = tonumber(ARGV[i * 2])
+    local burst = tonumber(ARGV[i * 2 + 1])
+    redis.call('HSET', KEYS[i], 'tokens', tostring(levels[i] - 1), 'ts', tostring(now))
+    redis.call('EXPIRE', KEYS[i], math.ceil(burst / rate) + 1)
+end
+return '0'
+"""
+
+
+class InMemoryTokenBucket:
+    """
+    프로세스 내 토큰 버킷 (Redis 미사용/장애 시 대체).
+    워커마다 따로 계산되므로 한도가 워커 수만큼 느슨해진다.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def acquire(self, limits: list[tuple[str, float, float]]) -> float:
+        """
+        limits: [(key, rate_per_second, burst), ...]
+        모두 통과하면 0, 아니면 재시도까지 남은 초.
+        """
+        now = time.monotonic()
+        levels = []
+        retry = 0.0
+        for key, rate, burst in limits:
+            tokens, ts = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + max(0.0, now - ts) * rate)
+            if tokens < 1:
+                retry = max(retry, (1 - tokens) / rate)
+            levels.append(tokens)
+
+        if retry > 0:
+            return retry
+
+        for (key, _, _), tokens in zip(limits, levels):
+            self._buckets[key] = (tokens - 1, now)
+            self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return 0.0
+
+
+class RedisTokenBucket:
+    """
+    Redis 토큰 버킷 (워커 간 공유, EVALSHA 1회).
+    Redis 오류가 나면 fallback_seconds 동안 프로세스 내 버킷으로 판단한다.
+    """
+
+    KEY_PREFIX = "rate_limit:"
+
+    def __init__(self, redis_client: aioredis.Redis, fallback: InMemoryTokenBucket, fallback_seconds: float = 5.0):
+        self.fallback = fallback
+        self.fallback_seconds = fallback_seconds
+        self._acquire = redis_client.register_script(_ACQUIRE_SCRIPT)
+        self._redis_down_until = 0.0
+
+    async def acquire(self, limits: list[tuple[str, float, float]]) -> float:
+        if time.monotonic() < self._redis_down_until:
+            return await self.fallback.acquire(limits)
+
+        args: list = [time.time()]
+        for _, rate, burst in limits:
+            args.extend([rate, burst])
+        try:
+            retry = await self._acquire(keys=[f"{self.KEY_PREFIX}{key}" for key, _, _ in limits], args=args)
+        except RedisError:
+            logger.warning("rate limit falling back to in-process buckets", exc_info=True)
+            self._redis_down_until = time.monotonic() + self.fallback_seconds
+            return await self.fallback.acquire(limits)
+        return float(retry)
+
+
+def retry_after_header(seconds: float) -> str:
+    return str(max(1, math.ceil(seconds)))
@@ -1,6 +1,7 @@
 import os
 
 import redis
+import redis.asyncio as aioredis
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,9 +10,21 @@ REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = int(os.getenv("REDIS_PORT"))
 REDIS_DB = int(os.getenv("REDIS_DB"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+# redis | fake (fakeredis, 오프라인 개발/테스트용)
+REDIS_BACKEND = os.getenv("REDIS_BACKEND", "redis")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "100"))
+REDIS_SOCKET_TIMEOUT_SECONDS = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "5"))
+REDIS_HEALTH_CHECK_INTERVAL_SECONDS = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL_SECONDS", "30"))
+# 스트림 재생(XREAD BLOCK) 전용 풀: 붙어 있는 클라이언트 수만큼 커넥션을 점유한다
+REDIS_STREAM_READ_MAX_CONNECTIONS = int(os.getenv("REDIS_STREAM_READ_MAX_CONNECTIONS", "200"))
+REDIS_STREAM_READ_POOL_TIMEOUT_SECONDS = float(os.getenv("REDIS_STREAM_READ_POOL_TIMEOUT_SECONDS", "10"))
 
 # Redis 인스턴스 생성 (Singleton)
 _redis_instance = None
+_async_redis_instance = None
+_async_pool = None
+_stream_read_instance = None
+_stream_read_pool = None
 
 def get_redis() -> redis.Redis:
     global _redis_instance
@@ -24,3 +37,72 @@ def get_redis() -> redis.Redis:
             decode_responses=True
         )
     return _redis_instance
+
+
+def get_async_redis() -> aioredis.Redis:
+    """
+    이벤트 루프를 막지 않는 redis.asyncio 클라이언트 (Singleton).
+    프로세스 공용 커넥션 풀을 쓰며, REDIS_BACKEND=fake 면 fakeredis 로 대체한다.
+    """
+    global _async_redis_instance, _async_pool
+    if _async_redis_instance is None:
+        if REDIS_BACKEND == "fake":
+            from fakeredis import aioredis as fake_aioredis
+            _async_redis_instance = fake_aioredis.FakeRedis(decode_responses=True)
+        else:
+            _async_pool = aioredis.ConnectionPool(
+                host=REDIS_HOST,
+                port=REDIS_PORT,
+                db=REDIS_DB,
+                password=REDIS_PASSWORD,
+                decode_responses=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+                health_check_interval=REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+            )
+            _async_redis_instance = aioredis.Redis(connection_pool=_async_pool)
+    return _async_redis_instance
+
+
+def get_stream_read_redis() -> aioredis.Redis:
+    """
+    XREAD BLOCK 전용 비동기 클라이언트 (Singleton).
+    BlockingConnectionPool 이라 한도에 닿으면 에러 대신 커넥션이 반납될 때까지 기다리고,
+    공용 풀(get_async_redis)과 분리되어 있어 다른 Redis 사용자에게 영향을 주지 않는다.
+    """
+    global _stream_read_instance, _stream_read_pool
+    if REDIS_BACKEND == "fake":
+        return get_async_redis()
+    if _stream_read_instance is None:
+        _stream_read_pool = aioredis.BlockingConnectionPool(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=REDIS_DB,
+            password=REDIS_PASSWORD,
+            decode_responses=True,
+            max_connections=REDIS_STREAM_READ_MAX_CONNECTIONS,
+            timeout=REDIS_STREAM_READ_POOL_TIMEOUT_SECONDS,
+            socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        )
+        _stream_read_instance = aioredis.Redis(connection_pool=_stream_read_pool)
+    return _stream_read_instance
+
+
+async def close_async_redis() -> None:
+    """종료 시 비동기 클라이언트와 커넥션 풀 정리"""
+    global _async_redis_instance, _async_pool, _stream_read_instance, _stream_read_pool
+    if _stream_read_instance is not None:
+        await _stream_read_instance.aclose()
+        _stream_read_instance = None
+    if _stream_read_pool is not None:
+        await _stream_read_pool.disconnect()
+        _stream_read_pool = None
+    if _async_redis_instance is not None:
+        await _async_redis_instance.aclose()
+        _async_redis_instance = None
+    if _async_pool is not None:
+        await _async_pool.disconnect()
+        _async_pool = None
@@ -1,80 +1,205 @@
-import boto3
 import asyncio
+import base64
+import codecs
+import json
+import threading
 import uuid
 import datetime
-from io import BytesIO
-from PIL import Image
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from pathlib import Path
 from fastapi import UploadFile
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
-from botocore.signers import CloudFrontSigner
 from app.config.settings import settings
+from app.config.image import ImagePipelineBusy, get_image_pipeline
+from app.config.storage import get_object_storage, iter_upload_file
+
+
+@lru_cache(maxsize=4)
+def _load_private_key(key_path: str):
+    """PEM 파싱은 비싸므로 프로세스 당 한 번만 수행한다."""
+    try:
+        with open(key_path, 'rb') as f:
+            return serialization.load_pem_private_key(f.read().strip(), password=None)
+    except Exception as e:
+        print(f"❌ Key Load Error: {str(e)}")
+        return None
+
+
+def _url_b64encode(data: bytes) -> str:
+    """CloudFront 용 URL-safe base64 (+ → -, = → _, / → ~)"""
+    return (
+        base64.b64encode(data).decode('utf-8')
+        .replace('+', '-').replace('=', '_').replace('/', '~')
+    )
+
+
+class _SignedUrlCache:
+    """
+    경로별 서명 URL 캐시 (프로세스 공용 LRU).
+    만료까지 refresh_slack 이상 남은 URL 만 재사용한다.
+    """
+
+    def __init__(self, max_size: int, refresh_slack_seconds: int):
+        self._items: "OrderedDict[str, tuple[str, datetime.datetime]]" = OrderedDict()
+        self._max_size = max_size
+        self._slack = datetime.timedelta(seconds=refresh_slack_seconds)
+        self._lock = threading.Lock()
+
+    def get(self, path: str, now: datetime.datetime) -> str | None:
+        with self._lock:
+            item = self._items.get(path)
+            if item is None:
+                return None
+            url, expires_at = item
+            if expires_at - now <= self._slack:
+                del self._items[path]
+                return None
+            self._items.move_to_end(path)
+            return url
+
+    def put(self, path: str, url: str, expires_at: datetime.datetime) -> None:
+        with self._lock:
+            self._items[path] = (url, expires_at)
+            self._items.move_to_end(path)
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+
+class _TextCache:
+    """오브젝트 키별 추출 텍스트 LRU (업로드 파일은 UUID 키라 내용이 바뀌지 않는다)"""
+
+    def __init__(self, max_size: int):
+        self._items: "OrderedDict[str, str]" = OrderedDict()
+        self._max_size = max_size
+
+    def get(self, key: str) -> str | None:
+        text = self._items.get(key)
+        if text is not None:
+            self._items.move_to_end(key)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        self._items[key] = text
+        self._items.move_to_end(key)
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+
+_attachment_text_cache = _TextCache(settings.ATTACHMENT_TEXT_CACHE_SIZE)
+
+_signed_url_cache = _SignedUrlCache(
+    max_size=settings.CLOUDFRONT_SIGNED_URL_CACHE_SIZE,
+    refresh_slack_seconds=settings.CLOUDFRONT_SIGNED_URL_REFRESH_SLACK_SECONDS,
+)
 
 
 class S3Service:
     def __init__(self):
-        self.s3 = boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_REGION
-        )
-        self.bucket = settings.AWS_S3_BUCKET
-
         self.cf_domain = settings.CLOUDFRONT_DOMAIN
         self.cf_key_id = settings.CLOUDFRONT_KEY_ID
 
         self.key_path = settings.CLOUDFRONT_PRIVATE_KEY_PATH
 
-        try:
-            with open(self.key_path, 'r') as f:
-                self.private_key_content = f.read().strip()
-        except Exception as e:
-            print(f"❌ Key Load Error: {str(e)}")
-            self.private_key_content = ""
+    @property
+    def storage(self):
+        # 프로세스 공용 저장소 (커넥션 풀 공유). boto3 는 첫 사용 시점에 로드된다.
+        return get_object_storage()
+
+    @cached_property
+    def signer(self):
+        # botocore 는 import 비용이 커서 첫 단건 서명 때 로드
+        from botocore.signers import CloudFrontSigner
+        return CloudFrontSigner(self.cf_key_id, self._rsa_signer)
 
     def _rsa_signer(self, message):
-        """환경 변수로부터 프라이빗 키를 로드하여 메시지에 서명합니다."""
-        private_key = serialization.load_pem_private_key(
-            self.private_key_content.encode('utf-8'),
-            password=None
-        )
+        """프로세스 당 한 번 로드된 프라이빗 키로 메시지에 서명합니다."""
+        private_key = _load_private_key(self.key_path)
+        if private_key is None:
+            raise ValueError("CloudFront private key is not loaded")
         return private_key.sign(
             message,
             padding.PKCS1v15(),
             hashes.SHA1()
         )
 
+    def _normalize_path(self, file_path: str) -> str | None:
+        """CloudFront 경로로 정규화. 다른 도메인의 URL 이면 None."""
+        if file_path.startswith("http"):
+            # CloudFront 도메인이 이미 포함되어 있다면 경로만 떼어냄
+            if self.cf_domain not in file_path:
+                return None
+            file_path = file_path.split(f"{self.cf_domain}/")[-1]
+        return file_path.lstrip("/")
+
     def get_signed_url(self, file_path: str, expire_minutes: int = 60) -> str:
         if not file_path:
             return ""
+        return self.sign_many([file_path], expire_minutes=expire_minutes)[0]
 
-        try:
-            if file_path.startswith("http"):
-                # CloudFront 도메인이 이미 포함되어 있다면 경로만 떼어냄
-                if self.cf_domain in file_path:
-                    path = file_path.split(f"{self.cf_domain}/")[-1]
-                else:
-                    return file_path  # 다른 도메인이면 그대로 반환
-            else:
-                path = file_path
+    def sign_many(self, file_paths: list[str], expire_minutes: int = 60) -> list[str]:
+        """
+        여러 경로를 한 번에 서명합니다 (입력 순서 유지).
+        캐시에 없는 경로 중 같은 디렉터리에 속한 것들은 `dir/*` 커스텀 정책
+        하나로 서명하여 RSA 서명 횟수를 디렉터리 수만큼으로 줄입니다.
+        """
+        now = datetime.datetime.utcnow()
+        expire_date = now + datetime.timedelta(minutes=expire_minutes)
 
-            path = path.lstrip("/")
-            url = f"https://{self.cf_domain}/{path}"
+        results: list[str] = list(file_paths)
+        pending: dict[str, list[tuple[int, str]]] = {}
 
-            expire_date = datetime.datetime.utcnow() + datetime.timedelta(minutes=expire_minutes)
-            signer = CloudFrontSigner(self.cf_key_id, self._rsa_signer)
+        for i, file_path in enumerate(file_paths):
+            if not file_path:
+                results[i] = ""
+                continue
+            path = self._normalize_path(file_path)
+            if path is None:
+                continue  # 다른 도메인이면 그대로 반환
 
-            signed_url = signer.generate_presigned_url(url, date_less_than=expire_date)
+            cached = _signed_url_cache.get(path, now)
+            if cached:
+                results[i] = cached
+                continue
 
-            print(f"--- Generated Signed URL: {signed_url}")
+            directory = path.rsplit("/", 1)[0] if "/" in path else ""
+            pending.setdefault(directory, []).append((i, path))
 
-            return signed_url
+        for directory, items in pending.items():
+            try:
+                if len(items) == 1 or not directory:
+                    for i, path in items:
+                        url = self.signer.generate_presigned_url(
+                            f"https://{self.cf_domain}/{path}", date_less_than=expire_date
+                        )
+                        _signed_url_cache.put(path, url, expire_date)
+                        results[i] = url
+                    continue
 
-        except Exception as e:
-            print(f"--- Signed URL Error: {str(e)}")
-            return file_path
+                # 같은 디렉터리의 파일들은 와일드카드 정책 + 서명 1회로 처리
+                policy = json.dumps({
+                    "Statement": [{
+                        "Resource": f"https://{self.cf_domain}/{directory}/*",
+                        "Condition": {"DateLessThan": {"AWS:EpochTime": int(
+                            expire_date.replace(tzinfo=datetime.timezone.utc).timestamp()
+                        )}},
+                    }]
+                }, separators=(',', ':')).encode('utf-8')
+                query = (
+                    f"Policy={_url_b64encode(policy)}"
+                    f"&Signature={_url_b64encode(self._rsa_signer(policy))}"
+                    f"&Key-Pair-Id={self.cf_key_id}"
+                )
+                for i, path in items:
+                    url = f"https://{self.cf_domain}/{path}?{query}"
+                    _signed_url_cache.put(path, url, expire_date)
+                    results[i] = url
+
+            except Exception as e:
+                print(f"--- Signed URL Error: {str(e)}")
+
+        return results
 
     async def upload_file(self, file: UploadFile, account_id: int) -> str:
         file_ext = Path(file.filename).suffix.lower()
@@ -87,74 +212,101 @@ class S3Service:
         now = datetime.datetime.now(kst)
 
         partition_path = now.strftime("%Y/%m/%d")
-        file_name = f"{uuid.uuid4()}{file_ext}"
-        full_path = f"chat/{partition_path}/{account_id}/{file_name}"
-
-        # 이미지 압축 로직
-        content = await file.read()
-        if file_ext in ['.jpg', '.jpeg', '.png', '.webp']:
-            content = self._compress_image(content)
+        content_type = file.content_type or "image/jpeg"
 
         try:
-            # 1. S3에 Private하게 업로드 (기본값이 Private입니다)
-            self.s3.put_object(
-                Bucket=self.bucket,
-                Key=full_path,
-                Body=content,
-                ContentType=file.content_type or "image/jpeg",
-                StorageClass='INTELLIGENT_TIERING'
-            )
+            if file_ext in ['.jpg', '.jpeg', '.png', '.webp']:
+                # 이미지 압축 로직 (프로세스 풀에서 실행, 결과 포맷에 맞게 확장자 변경)
+                content = await file.read()
+                try:
+                    processed = await get_image_pipeline().process(content)
+                    content = processed.data
+                    file_ext = processed.extension
+                    content_type = processed.content_type
+                except ImagePipelineBusy:
+                    raise
+                except Exception:
+                    # 압축 실패 시 원본 업로드 (손상된 이미지 등)
+                    pass
+
+                full_path = f"chat/{partition_path}/{account_id}/{uuid.uuid4()}{file_ext}"
+                await self.storage.put_bytes(full_path, content, content_type)
+            else:
+                # 그 외 파일은 청크 단위로 스트리밍 업로드 (본문 전체를 메모리에 올리지 않음)
+                full_path = f"chat/{partition_path}/{account_id}/{uuid.uuid4()}{file_ext}"
+                await self.storage.upload_stream(
+                    full_path,
+                    iter_upload_file(file, settings.UPLOAD_READ_CHUNK_SIZE),
+                    content_type,
+                )
 
             return full_path
 
+        except ImagePipelineBusy:
+            raise
         except Exception as e:
             print(f"S3 Upload Error Detail: {str(e)}")
             raise Exception(f"S3 업로드 및 서명 생성 실패: {str(e)}")
 
-    def _compress_image(self, image_bytes: bytes) -> bytes:
-        """이미지 용량을 줄여서 S3 비용 및 GPT 토큰 사용량을 아낍니다."""
+    async def read_file_content(self, file_path: str) -> str:
+        """확장자 불문, 텍스트 기반 파일의 내용을 최대한 읽어옵니다 (앞부분 ATTACHMENT_MAX_BYTES 까지)."""
+        if not file_path: return ""
         try:
-            img = Image.open(BytesIO(image_bytes))
+            path = file_path.split(f"{self.cf_domain}/")[-1] if self.cf_domain in file_path else file_path
+            path = path.lstrip("/")
 
-            if img.mode in ("RGBA", "P"):
-                img = img.convert("RGB")
+            cached = _attachment_text_cache.get(path)
+            if cached is not None:
+                return cached
 
-            # GPT Vision 모델 권장 해상도에 맞춰 리사이징
-            try:
-                # 최신 버전 (Pillow 10+)
-                resampling_method = Image.Resampling.LANCZOS
-            except AttributeError:
-                # 이전 버전
-                resampling_method = Image.LANCZOS
+            text = await self._read_text(path)
+            if text is None:
+                # 텍스트로 읽기 실패 시 (바이너리 등)
+                return f"[알림: {file_path} 파일은 텍스트로 읽을 수 없는 형식이거나 손상되었습니다.]"
 
-            img.thumbnail((2048, 2048), resampling_method)
+            _attachment_text_cache.put(path, text)
+            return text
+        except Exception as e:
+            return f"[파일 로드 실패: {str(e)}]"
 
-            buffer = BytesIO()
-            img.save(buffer, format="JPEG", quality=95, optimize=True)
-            return buffer.getvalue()
-        except Exception:
-            # 압축 실패 시 원본 반환 (이미지가 아닌 파일 대비)
-            return image_bytes
+    async def read_many_file_contents(self, file_paths: list[str]) -> list[str]:
+        """여러 파일을 동시에(ATTACHMENT_FETCH_CONCURRENCY 개씩) 읽어 입력 순서대로 반환"""
+        semaphore = asyncio.Semaphore(settings.ATTACHMENT_FETCH_CONCURRENCY)
 
-    async def read_file_content(self, file_path: str) -> str:
-        """확장자 불문, 텍스트 기반 파일의 내용을 최대한 읽어옵니다."""
-        if not file_path: return ""
-        try:
-            path = file_path.split(f"{self.cf_domain}/")[-1] if self.cf_domain in file_path else file_path
-            path = path.lstrip("/")
+        async def _read(file_path: str) -> str:
+            async with semaphore:
+                return await self.read_file_content(file_path)
+
+        return list(await asyncio.gather(*[_read(p) for p in file_paths]))
 
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, lambda: self.s3.get_object(Bucket=self.bucket, Key=path))
-            raw_content = response['Body'].read()
+    async def _read_text(self, path: str) -> str | None:
+        """
+        청크를 받는 대로 utf-8 로 점진 디코딩.
+        utf-8 이 아니면 받아 둔 바이트로 cp949 -> euc-kr 순으로 재시도.
+        max_bytes 에서 잘린 멀티바이트 문자의 꼬리는 버린다.
+        """
+        raw = bytearray()
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        parts = []
+        utf8_ok = True
 
-            # 인코딩 자동 감지 시도 (utf-8 -> cp949 -> euc-kr)
-            for enc in ['utf-8', 'cp949', 'euc-kr']:
+        async for chunk in self.storage.iter_chunks(
+            path, chunk_size=64 * 1024, max_bytes=settings.ATTACHMENT_MAX_BYTES
+        ):
+            raw.extend(chunk)
+            if utf8_ok:
                 try:
-                    return raw_content.decode(enc)
+                    parts.append(decoder.decode(chunk))
                 except UnicodeDecodeError:
-                    continue
+                    utf8_ok = False
 
-            # 텍스트로 읽기 실패 시 (바이너리 등)
-            return f"[알림: {file_path} 파일은 텍스트로 읽을 수 없는 형식이거나 손상되었습니다.]"
-        except Exception as e:
-            return f"[파일 로드 실패: {str(e)}]"
\ No newline at end of file
+        if utf8_ok:
+            return "".join(parts)
+
+        # 인코딩 자동 감지 시도 (cp949 -> euc-kr)
+        for enc in ['cp949', 'euc-kr']:
+            try:
+                return codecs.getincrementaldecoder(enc)().decode(bytes(raw))
+            except UnicodeDecodeError:
+                continue
+        return None
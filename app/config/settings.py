@@ -20,6 +20,10 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str = ""
+    REDIS_BACKEND: str = "redis"  # redis | fake (fakeredis, 오프라인 개발/테스트용)
+    REDIS_MAX_CONNECTIONS: int = 100  # 비동기 커넥션 풀 크기
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 5.0
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS: int = 30
 
     # CORS
     CORS_ALLOWED_FRONTEND_URL: str
@@ -61,6 +65,26 @@ class Settings(BaseSettings):
     # Session (legacy - kept for backward compatibility)
     SESSION_TTL_SECONDS: int = 86400  # 24 hours
 
+    # Conversation history window
+    CHAT_HISTORY_WINDOW_SIZE: int = 20  # 프롬프트에 포함할 최근 메시지 수
+    CHAT_PROMPT_TOKEN_BUDGET: int = 6000  # 프롬프트 전체 토큰 상한
+    CHAT_SUMMARY_TOKEN_BUDGET: int = 800  # 롤링 요약에 할당할 토큰 상한
+    CHAT_SUMMARY_MIN_BATCH: int = 4  # 요약 갱신을 시작할 최소 미요약 메시지 수
+    CHAT_SUMMARY_MAX_BATCH: int = 40  # 한 번의 요약 갱신에 접는 최대 메시지 수
+
+    # Decrypted history cache
+    CHAT_HISTORY_CACHE_MAX_ROOMS: int = 1000  # 프로세스 내 LRU 에 유지할 방 수
+    CHAT_HISTORY_CACHE_MAX_MESSAGES: int = 200  # 방 당 유지할 복호화 메시지 수
+    CHAT_HISTORY_CACHE_REDIS_ENABLED: bool = False  # Redis 2차 캐시 사용 여부
+    CHAT_HISTORY_CACHE_REDIS_TTL_SECONDS: int = 3600
+
+    # Simulation context (가상 대화 프롬프트)
+    SIMULATION_PROMPT_TOKEN_BUDGET: int = 3000  # 시스템 프롬프트 + 대화 기록 토큰 상한
+    SIMULATION_HISTORY_FETCH_BATCH: int = 20  # 최신순으로 한 번에 읽어 복호화하는 메시지 수
+
+    # Prompt templates (prompts.yaml 컴파일 / hot reload)
+    PROMPT_RELOAD_CHECK_SECONDS: float = 2.0  # prompts.yaml 변경 확인 간격 (0 이면 reload 안 함)
+
     # Frontend URL for redirects after OAuth
     FRONTEND_URL: str
 
@@ -80,6 +104,78 @@ class Settings(BaseSettings):
     CLOUDFRONT_DOMAIN: str
     CLOUDFRONT_KEY_ID: str
     CLOUDFRONT_PRIVATE_KEY_PATH: str
+    CLOUDFRONT_SIGNED_URL_CACHE_SIZE: int = 10000  # 서명 URL 캐시 최대 항목 수
+    CLOUDFRONT_SIGNED_URL_REFRESH_SLACK_SECONDS: int = 300  # 만료까지 이보다 적게 남으면 재서명
+
+    # Object storage
+    OBJECT_STORAGE_BACKEND: str = "s3"  # s3 | local
+    LOCAL_STORAGE_ROOT: str = "./.storage"  # local 백엔드 저장 경로
+    S3_MAX_POOL_CONNECTIONS: int = 32  # boto3 커넥션 풀 및 전용 스레드 풀 크기
+    S3_MULTIPART_PART_SIZE: int = 8 * 1024 * 1024  # 멀티파트 파트 크기 (최소 5MB)
+    UPLOAD_READ_CHUNK_SIZE: int = 1024 * 1024  # UploadFile 에서 한 번에 읽는 크기
+
+    # LLM gateway
+    OPENAI_API_KEY: str = ""
+    LLM_PROVIDER: str = "openai"  # openai | stub (부하 테스트용 로컬 응답)
+    LLM_MODEL: str = "gpt-4.1"
+    LLM_MAX_CONNECTIONS: int = 100  # httpx 커넥션 풀 크기
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_REQUEST_TIMEOUT_SECONDS: float = 120.0
+    LLM_MAX_CONCURRENCY_PER_MODEL: int = 32  # 모델 당 동시 업스트림 스트림 수
+    LLM_QUEUE_TIMEOUT_SECONDS: float = 10.0  # 슬롯 대기 한도
+    LLM_STUB_FIRST_TOKEN_LATENCY_MS: int = 300
+    LLM_STUB_TOKEN_LATENCY_MS: int = 20
+    LLM_STUB_TOKEN_COUNT: int = 50
+
+    # Streaming response (SSE / text)
+    STREAM_COALESCE_MS: int = 20  # 델타를 묶어 보내는 최대 지연
+    STREAM_COALESCE_BYTES: int = 256  # 이 크기 이상 모이면 즉시 전송
+    STREAM_HEARTBEAT_SECONDS: float = 15.0  # SSE 유휴 시 주석 heartbeat 간격
+    STREAM_BUFFER_BACKEND: str = "redis"  # redis | memory (memory 는 단일 워커 전용)
+    STREAM_BUFFER_TTL_SECONDS: int = 600  # 생성이 끝난 뒤 재연결을 허용하는 시간
+    STREAM_ATTACH_IDLE_TIMEOUT_SECONDS: float = 120.0  # 새 델타 없이 붙어 있는 최대 시간
+
+    # Usage metering (계정별 토큰 쿼터 / 사용량 이벤트 배치 저장)
+    USAGE_WINDOW_SECONDS: int = 86400  # 슬라이딩 윈도우 길이 (한도는 RolePolicy)
+    USAGE_BUCKET_SECONDS: int = 3600  # 윈도우를 나누는 버킷 크기
+    USAGE_EVENT_BATCH_SIZE: int = 200
+    USAGE_EVENT_FLUSH_INTERVAL_SECONDS: float = 5.0
+    USAGE_EVENT_MAX_BUFFER: int = 10000  # DB 장애 시 메모리에 보관하는 최대 이벤트 수
+
+    # Auth caches (검증된 JWT payload 캐시, 블랙리스트 로컬 미러)
+    JWT_CACHE_MAX_ENTRIES: int = 50_000
+    JWT_CACHE_TTL_SECONDS: float = 60.0
+    BLACKLIST_MIRROR_ENABLED: bool = True  # 끄면 블랙리스트 확인마다 Redis EXISTS
+
+    # Rate limiting / admission control (LLM 엔드포인트, 한도는 RolePolicy)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "redis"  # redis | memory (memory 는 워커별로 계산)
+    LLM_ADMISSION_MAX_IN_FLIGHT: int = 64  # 워커 당 동시 LLM 스트림 수
+    LLM_ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0  # 자리 대기 한도 (0 이면 즉시 거절)
+
+    # Startup (스키마는 alembic upgrade head 로 관리)
+    STARTUP_BUDGET_SECONDS: float = 5.0  # 초과 시 단계별 소요 시간을 경고 로그로 남김
+    DB_CREATE_ALL_ON_STARTUP: bool = False  # 로컬 개발용. 운영에서는 마이그레이션 사용
+    STARTUP_WARMUP_ENABLED: bool = True  # 워커마다 트래픽 받기 전 LLM 클라이언트/토크나이저 등 미리 로드
+
+    # Production server (python -m app.server)
+    WEB_CONCURRENCY: int = 1  # 워커 프로세스 수 (보통 코어 수)
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: float = 30.0  # 종료 신호 후 열린 연결(스트림 포함)을 기다리는 시간
+    SERVER_DRAIN_TIMEOUT_SECONDS: float = 30.0  # 그 뒤 백그라운드 채팅 생성/저장을 기다리는 시간
+    PROMETHEUS_MULTIPROC_DIR: str = "/tmp/prometheus_multiproc"  # 워커 2개 이상일 때 지표 파일 디렉터리 (기동 시 비움)
+    METRICS_CACHE_STATS_INTERVAL_SECONDS: float = 15.0  # 워커별 캐시 통계를 지표로 내보내는 주기
+
+    # Chat attachments
+    ATTACHMENT_FETCH_CONCURRENCY: int = 4  # 요청 당 동시에 읽는 첨부파일 수
+    ATTACHMENT_MAX_BYTES: int = 256 * 1024  # 첨부파일 당 읽는 최대 바이트
+    ATTACHMENT_TEXT_CACHE_SIZE: int = 256  # 추출 텍스트 캐시 항목 수
+
+    # Image pipeline (업로드 이미지 압축 프로세스 풀)
+    IMAGE_PIPELINE_WORKERS: int = 2
+    IMAGE_PIPELINE_MAX_PENDING: int = 8  # 초과 시 503 으로 거절
+    IMAGE_MAX_SIDE: int = 2048
+    IMAGE_TARGET_FORMAT: str = "JPEG"  # JPEG | WEBP (WEBP 는 저장 포맷과 확장자가 바뀐다)
+    IMAGE_TARGET_QUALITY: int = 95
 
     @property
     def is_production(self) -> bool:
@@ -0,0 +1,79 @@
+import inspect
+import logging
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+from prometheus_client import Gauge
+
+logger = logging.getLogger(__name__)
+
+STARTUP_PHASE_SECONDS = Gauge(
+    "app_startup_phase_seconds",
+    "기동 단계별 소요 시간",
+    ["phase"],
+    multiprocess_mode="max",  # 가장 느린 워커 기준
+)
+
+# 인터프리터가 이 모듈을 처음 읽은 시각 (app.main 최상단에서 import)
+_process_started = time.perf_counter()
+
+
+class StartupTimer:
+    """
+    기동 단계(import, 컨테이너 구성, 백그라운드 태스크 시작 등)별 시간을 기록한다.
+    합계가 budget_seconds 를 넘으면 경고 로그를 남긴다.
+    """
+
+    def __init__(self, budget_seconds: float):
+        self.budget = budget_seconds
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float) -> None:
+        self.phases[name] = seconds
+        STARTUP_PHASE_SECONDS.labels(phase=name).set(seconds)
+
+    def mark_imports_done(self) -> None:
+        """app.main 모듈 import 완료 시점까지를 imports 단계로 기록"""
+        self.record("imports", time.perf_counter() - _process_started)
+
+    def finish(self) -> float:
+        total = sum(self.phases.values())
+        STARTUP_PHASE_SECONDS.labels(phase="total").set(total)
+        summary = ", ".join(f"{name}={seconds * 1000:.0f}ms" for name, seconds in self.phases.items())
+        if total > self.budget:
+            logger.warning("startup took %.2fs (budget %.2fs): %s", total, self.budget, summary)
+        else:
+            logger.info("startup took %.2fs: %s", total, summary)
+        return total
+
+
+# 워커마다 lifespan 시작 시 실행할 warm-up 훅 (name, fn). fn 은 sync/async 모두 가능
+_warmup_hooks: list[tuple[str, Callable]] = []
+
+
+def register_warmup(name: str, fn: Callable) -> None:
+    _warmup_hooks.append((name, fn))
+
+
+async def run_warmups(timer: StartupTimer) -> None:
+    """
+    등록된 warm-up 훅을 순서대로 실행한다.
+    warm-up 실패는 기동을 막지 않는다 (첫 요청에서 다시 시도됨).
+    """
+    for name, fn in _warmup_hooks:
+        with timer.phase(f"warmup_{name}"):
+            try:
+                result = fn()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.warning("warm-up %s failed", name, exc_info=True)
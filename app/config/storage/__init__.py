@@ -0,0 +1,28 @@
+from app.config.settings import settings
+from app.config.storage.object_storage import ObjectStorage, iter_upload_file
+
+# 저장소 인스턴스 (Singleton)
+_storage_instance = None
+
+
+def get_object_storage() -> ObjectStorage:
+    """OBJECT_STORAGE_BACKEND 설정에 따라 프로세스 공용 저장소를 반환"""
+    global _storage_instance
+    if _storage_instance is None:
+        if settings.OBJECT_STORAGE_BACKEND == "local":
+            from app.config.storage.local_object_storage import LocalObjectStorage
+            _storage_instance = LocalObjectStorage(settings.LOCAL_STORAGE_ROOT)
+        else:
+            from app.config.storage.s3_object_storage import S3ObjectStorage
+            _storage_instance = S3ObjectStorage(
+                bucket=settings.AWS_S3_BUCKET,
+                region_name=settings.AWS_REGION,
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                part_size=settings.S3_MULTIPART_PART_SIZE,
+            )
+    return _storage_instance
+
+
+__all__ = ["ObjectStorage", "get_object_storage", "iter_upload_file"]
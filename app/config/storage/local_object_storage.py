@@ -0,0 +1,69 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncIterator
+
+from app.config.storage.object_storage import ObjectStorage
+
+
+class LocalObjectStorage(ObjectStorage):
+    """
+    로컬 파일시스템 저장소 (개발/테스트용 S3 대체).
+    key 는 root 아래의 상대 경로로 저장된다.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root).resolve()
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key.lstrip("/")).resolve()
+        # ../ 로 root 밖을 가리키는 key 차단
+        if self.root not in path.parents:
+            raise ValueError(f"invalid storage key: {key}")
+        return path
+
+    async def put_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        path = self._path(key)
+
+        def _write():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+
+        await asyncio.to_thread(_write)
+
+    async def upload_stream(self, key: str, chunks: AsyncIterator[bytes], content_type: str) -> int:
+        path = self._path(key)
+        tmp_path = path.with_name(path.name + ".part")
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+
+        total = 0
+        f = await asyncio.to_thread(open, tmp_path, "wb")
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(f.write, chunk)
+                total += len(chunk)
+        except BaseException:
+            await asyncio.to_thread(f.close)
+            await asyncio.to_thread(tmp_path.unlink, True)
+            raise
+        await asyncio.to_thread(f.close)
+        await asyncio.to_thread(os.replace, tmp_path, path)
+        return total
+
+    async def get_bytes(self, key: str) -> bytes:
+        return await asyncio.to_thread(self._path(key).read_bytes)
+
+    async def iter_chunks(self, key: str, chunk_size: int, max_bytes: int | None = None) -> AsyncIterator[bytes]:
+        f = await asyncio.to_thread(open, self._path(key), "rb")
+        remaining = max_bytes
+        try:
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await asyncio.to_thread(f.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(f.close)
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+
+class ObjectStorage(ABC):
+    """
+    파일 저장소 추상화 (S3 / 로컬 파일시스템).
+    모든 메서드는 이벤트 루프를 막지 않는다.
+    """
+
+    @abstractmethod
+    async def put_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        """작은 객체를 한 번에 저장"""
+        pass
+
+    @abstractmethod
+    async def upload_stream(self, key: str, chunks: AsyncIterator[bytes], content_type: str) -> int:
+        """청크 스트림을 전체 본문을 메모리에 올리지 않고 저장. 저장한 바이트 수를 반환"""
+        pass
+
+    @abstractmethod
+    async def get_bytes(self, key: str) -> bytes:
+        """객체 전체를 읽어 반환"""
+        pass
+
+    @abstractmethod
+    def iter_chunks(self, key: str, chunk_size: int, max_bytes: int | None = None) -> AsyncIterator[bytes]:
+        """객체 앞부분 최대 max_bytes 를 chunk_size 단위로 스트리밍"""
+        pass
+
+
+async def iter_upload_file(file, chunk_size: int) -> AsyncIterator[bytes]:
+    """UploadFile 을 chunk_size 단위로 읽는 비동기 이터레이터"""
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
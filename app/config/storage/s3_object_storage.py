@@ -0,0 +1,150 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import AsyncIterator
+
+import boto3
+from botocore.config import Config
+
+from app.config.storage.object_storage import ObjectStorage
+
+# S3 멀티파트 업로드의 최소 파트 크기 (마지막 파트 제외)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class S3ObjectStorage(ObjectStorage):
+    """
+    프로세스 공용 boto3 클라이언트 + 전용 스레드 풀.
+    boto3 는 블로킹이므로 모든 호출을 풀에서 실행한다.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        region_name: str,
+        aws_access_key_id: str,
+        aws_secret_access_key: str,
+        max_pool_connections: int = 32,
+        part_size: int = 8 * 1024 * 1024,
+        storage_class: str = "INTELLIGENT_TIERING",
+    ):
+        self.bucket = bucket
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.storage_class = storage_class
+        # boto3 클라이언트는 스레드 안전하므로 하나를 공유한다.
+        self.client = boto3.client(
+            "s3",
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=region_name,
+            config=Config(max_pool_connections=max_pool_connections),
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_pool_connections, thread_name_prefix="s3-io"
+        )
+
+    async def _run(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def put_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        await self._run(
+            self.client.put_object,
+            Bucket=self.bucket,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+            StorageClass=self.storage_class,
+        )
+
+    async def upload_stream(self, key: str, chunks: AsyncIterator[bytes], content_type: str) -> int:
+        buffer = bytearray()
+        upload_id = None
+        parts = []
+        total = 0
+
+        try:
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                total += len(chunk)
+                if len(buffer) < self.part_size:
+                    continue
+
+                # 첫 파트가 찼을 때 비로소 멀티파트 업로드를 시작한다.
+                if upload_id is None:
+                    created = await self._run(
+                        self.client.create_multipart_upload,
+                        Bucket=self.bucket,
+                        Key=key,
+                        ContentType=content_type,
+                        StorageClass=self.storage_class,
+                    )
+                    upload_id = created["UploadId"]
+
+                parts.append(await self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                buffer.clear()
+
+            if upload_id is None:
+                # 파트 크기보다 작은 파일은 단일 PUT 으로 충분하다.
+                await self.put_bytes(key, bytes(buffer), content_type)
+                return total
+
+            if buffer:
+                parts.append(await self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+
+            await self._run(
+                self.client.complete_multipart_upload,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+            return total
+
+        except BaseException:
+            if upload_id is not None:
+                try:
+                    await self._run(
+                        self.client.abort_multipart_upload,
+                        Bucket=self.bucket,
+                        Key=key,
+                        UploadId=upload_id,
+                    )
+                except Exception:
+                    pass
+            raise
+
+    async def _upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> dict:
+        response = await self._run(
+            self.client.upload_part,
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    async def get_bytes(self, key: str) -> bytes:
+        def _get():
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+            return response["Body"].read()
+
+        return await self._run(_get)
+
+    async def iter_chunks(self, key: str, chunk_size: int, max_bytes: int | None = None) -> AsyncIterator[bytes]:
+        params = {"Bucket": self.bucket, "Key": key}
+        if max_bytes is not None:
+            # Range 요청으로 필요한 앞부분만 전송받는다.
+            params["Range"] = f"bytes=0-{max_bytes - 1}"
+
+        response = await self._run(self.client.get_object, **params)
+        body = response["Body"]
+        try:
+            while True:
+                chunk = await self._run(body.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
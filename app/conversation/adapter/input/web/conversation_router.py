@@ -1,13 +1,14 @@
-from fastapi import APIRouter, Depends, Body, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, Body, HTTPException, UploadFile, File, Query, Request
+from typing import List, Optional
 import uuid
 
 from app.account.adapter.input.web.account_router import get_current_account_id
-from app.config.database.session import get_db_session
+from app.config.database.session import get_async_db_session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-# 전역 객체는 상태가 없는 것들만 유지
-from app.config.call_gpt import CallGPT
-from app.config.s3_service import S3Service
+from app.config.container import AppContainer, get_container
+from app.config.image import ImagePipelineBusy
 from app.conversation.adapter.input.web.request.chat_feedback_request import ChatFeedbackRequest
 from app.conversation.application.usecase.end_chat_usecase import EndChatUseCase
 from app.conversation.application.usecase.get_chat_room_status_usecase import GetChatRoomStatusUseCase
@@ -15,15 +16,14 @@ from app.conversation.application.usecase.delete_chat_usecase import DeleteChatU
 from app.conversation.application.usecase.get_chat_message_usecase import GetChatMessagesUseCase
 from app.conversation.application.usecase.get_chat_room_usecase import GetChatRoomsUseCase
 from app.conversation.application.usecase.insert_chat_feedback_usecase import ChatFeedbackUsecase
+from app.conversation.domain.conversation.aggregate import Conversation
 from app.conversation.infrastructure.repository.chat_feedback_repository_impl import ChatFeedbackRepositoryImpl
 from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl
-from app.conversation.infrastructure.repository.usage_meter_impl import UsageMeterImpl
-from app.config.security.message_crypto import AESEncryption
 from app.conversation.adapter.output.stream.stream_adapter import StreamAdapter
+from app.conversation.adapter.input.web.rate_limit_dependency import LlmCaller, admit_llm_stream, enforce_llm_quota
+from app.config.rate_limit import get_admission_controller
 
-crypto_service = AESEncryption()
-llm_chat_port = CallGPT()
-usage_meter = UsageMeterImpl()
+# 공용 서비스(암호화, S3, LLM, 사용량, 캐시, 스트림 러너)는 lifespan 에서 만든 AppContainer 에서 꺼내 쓴다
 
 conversation_router = APIRouter(tags=["conversation"])
 
@@ -31,26 +31,28 @@ conversation_router = APIRouter(tags=["conversation"])
 @conversation_router.post("/upload")
 async def upload_file(
     file: UploadFile = File(...),
-    account_id: int = Depends(get_current_account_id)
+    account_id: int = Depends(get_current_account_id),
+    container: AppContainer = Depends(get_container),
 ):
     """
     S3에 저장 후, 화면에서 보여줄 수 있는 URL을 반환합니다.
     """
-    s3_service = S3Service()
     try:
-        file_path = await s3_service.upload_file(file, account_id)
-        signed_url = s3_service.get_signed_url(file_path)
+        file_path = await container.s3_service.upload_file(file, account_id)
+        signed_url = container.s3_service.get_signed_url(file_path)
         return {
             "file_url": signed_url,
             "file_path": file_path
         }
+    except ImagePipelineBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 업로드 실패: {str(e)}")
 
 @conversation_router.get("/rooms")
 async def get_my_rooms(
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)  # 1. 세션 주입 필요
+        db: AsyncSession = Depends(get_async_db_session)  # 1. 세션 주입 필요
 ):
     # 2. 레포지토리에 현재 세션을 넣어서 생성
     room_repo = ChatRoomRepositoryImpl(db)
@@ -62,22 +64,53 @@ async def get_my_rooms(
 
 @conversation_router.post("/chat/stream-auto")
 async def stream_chat_auto(
-        account_id: int = Depends(get_current_account_id),
+        request: Request,
+        caller: LlmCaller = Depends(enforce_llm_quota),
         message: str = Body(..., embed=True),
         room_id: str | None = Body(default=None, embed=True),
         file_urls: list[str] = Body(default=[], embed=True),
         contents_type: str = Body(default="TEXT", embed=True),
-        db: Session = Depends(get_db_session)
+        db: AsyncSession = Depends(get_async_db_session),
+        container: AppContainer = Depends(get_container),
 ):
-    from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl
-    from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
-    from app.conversation.application.usecase.stream_chat_usecase import StreamChatUsecase
-    from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl  # 추가
-    chat_room_repo = ChatRoomRepositoryImpl(db)
-    chat_message_repo = ChatMessageRepositoryImpl(db)
-    account_repo = AccountRepositoryImpl(db)  # 추가
-    s3_service = S3Service()
+    """
+    응답 생성은 백그라운드 태스크에서 진행되고, 이 응답은 그 버퍼에 붙어서 재생한다.
+    연결이 끊기면 X-Stream-Id 로 GET /chat/stream/{stream_id} 에 다시 붙을 수 있다.
+    """
+    account_id = caller.account_id
+
+    # 동시 스트림 한도: 거절되면 방을 만들기 전에 429
+    await admit_llm_stream()
+    admission = get_admission_controller()
+    try:
+        current_room_id = await _resolve_room(ChatRoomRepositoryImpl(db), account_id, room_id, message)
+
+        # 2. 생성 시작 (허가는 생성 태스크가 끝날 때 반납)
+        stream_id = await container.stream_runner.start(
+            account_id,
+            on_finish=admission.leave,
+            account=caller.account,
+            room_id=current_room_id,
+            message=message,
+            contents_type=contents_type,
+            file_urls=file_urls,
+        )
+    except BaseException:
+        admission.leave()
+        raise
+
+    return await StreamAdapter.to_checked_response(
+        container.stream_runner.attach(stream_id),
+        request,
+        headers={
+            "X-Room-Id": current_room_id,
+            "X-Stream-Id": stream_id,
+            "Access-Control-Expose-Headers": "X-Room-Id, X-Stream-Id",
+        },
+    )
 
+
+async def _resolve_room(chat_room_repo, account_id: int, room_id: str | None, message: str) -> str:
     # 1. room_id 판단 로직 보정
     # 프론트에서 'null' 문자열이 오거나 아예 없을 때를 대비
     is_new_room = room_id is None or room_id == "" or room_id == "null"
@@ -97,30 +130,42 @@ async def stream_chat_auto(
     else:
         current_room_id = room_id
         # 기존 방 존재 여부 확인
-        room_exists = await chat_room_repo.find_by_id(current_room_id)
-        if not room_exists:
+        room = await chat_room_repo.find_by_id(current_room_id)
+        if not room:
             raise HTTPException(status_code=404, detail="Room not found")
+        # 생성을 시작하기 전에 거절 (백그라운드에서 실패하면 text/plain 클라이언트는 원인을 알 수 없다)
+        if not Conversation(room=room, messages=[]).is_active():
+            raise HTTPException(status_code=400, detail="채팅방이 활성 상태가 아닙니다.")
 
-    # 2. UseCase 생성 (이미 검증된 current_room_id 사용)
-    usecase = StreamChatUsecase(
-        chat_room_repo=chat_room_repo,
-        chat_message_repo=chat_message_repo,
-        account_repo=account_repo,  # mbti, gender 활용 위한 추가
-        llm_chat_port=llm_chat_port,
-        usage_meter=usage_meter,
-        crypto_service=crypto_service,
-        s3_service=s3_service
-    )
+    return current_room_id
 
-    generator = usecase.execute(
-        room_id=current_room_id,
-        account_id=account_id,
-        message=message,
-        contents_type=contents_type,
-        file_urls=file_urls,
-    )
 
-    return StreamAdapter.to_streaming_response(generator)
+@conversation_router.get("/chat/stream/{stream_id}")
+async def resume_chat_stream(
+        stream_id: str,
+        request: Request,
+        offset: int = Query(0, ge=0),
+        account_id: int = Depends(get_current_account_id),
+        container: AppContainer = Depends(get_container),
+):
+    """
+    진행 중이거나 최근에 끝난 응답 스트림에 다시 붙는다.
+    text/plain 은 offset(이미 받은 글자 수) 이후부터, SSE 는 Last-Event-ID 이후부터 재생한다.
+    """
+    stream_runner = container.stream_runner
+    owner = await stream_runner.buffer.get_owner(stream_id)
+    if owner is None:
+        raise HTTPException(status_code=404, detail="Stream not found")
+    if owner != account_id:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    # SSE 는 어댑터가 Last-Event-ID 기준으로 건너뛴다
+    from_offset = 0 if StreamAdapter.wants_sse(request) else offset
+    return await StreamAdapter.to_checked_response(
+        stream_runner.attach(stream_id, from_offset),
+        request,
+        headers={"X-Stream-Id": stream_id, "Access-Control-Expose-Headers": "X-Stream-Id"},
+    )
 
 
 # 피드백 생성 (POST)
@@ -128,7 +173,7 @@ async def stream_chat_auto(
 async def add_feedback(
         feedback_req: ChatFeedbackRequest,
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        db: AsyncSession = Depends(get_async_db_session)
 ):
     chat_feedback_repo = ChatFeedbackRepositoryImpl(db)
     use_case = ChatFeedbackUsecase(chat_feedback_repo)
@@ -146,7 +191,7 @@ async def add_feedback(
 async def update_feedback(
         feedback_req: ChatFeedbackRequest,
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        db: AsyncSession = Depends(get_async_db_session)
 ):
     chat_feedback_repo = ChatFeedbackRepositoryImpl(db)
     use_case = ChatFeedbackUsecase(chat_feedback_repo)
@@ -165,11 +210,12 @@ async def update_feedback(
 async def delete_chat_room(
         room_id: str,
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        db: AsyncSession = Depends(get_async_db_session),
+        container: AppContainer = Depends(get_container),
 ):
     chat_room_repo = ChatRoomRepositoryImpl(db)
 
-    usecase = DeleteChatUseCase(chat_room_repo)
+    usecase = DeleteChatUseCase(chat_room_repo, container.history_cache)
 
     # 3. 실행
     success = await usecase.execute(room_id=room_id, account_id=account_id)
@@ -184,7 +230,7 @@ async def delete_chat_room(
 async def end_chat(
     room_id: str,
     account_id: int = Depends(get_current_account_id),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     room_repo = ChatRoomRepositoryImpl(db)
     uc = EndChatUseCase(room_repo)
@@ -196,7 +242,7 @@ async def end_chat(
 async def get_room_status(
     room_id: str,
     account_id: int = Depends(get_current_account_id),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     repo = ChatRoomRepositoryImpl(db)
     uc = GetChatRoomStatusUseCase(repo)
@@ -206,41 +252,50 @@ async def get_room_status(
 @conversation_router.get("/rooms/{room_id}/messages")
 async def get_room_messages(
         room_id: str,
+        before_id: Optional[int] = Query(None, ge=1),
+        limit: Optional[int] = Query(None, ge=1, le=200),
+        known_ids: List[int] = Query([]),
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        db: AsyncSession = Depends(get_async_db_session),
+        container: AppContainer = Depends(get_container),
 ):
+    """
+    before_id/limit 로 keyset 페이지네이션 (limit 미지정 시 전체 조회).
+    known_ids 의 메시지는 본문을 내려주지 않는다 (content=None).
+    """
     from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
     chat_message_repo = ChatMessageRepositoryImpl(db)
-    s3_service = S3Service()
 
-    uc = GetChatMessagesUseCase(chat_message_repo, crypto_service)
-    messages = await uc.execute(room_id, account_id)
+    uc = GetChatMessagesUseCase(chat_message_repo, container.crypto, container.history_cache)
+    messages = await uc.execute(
+        room_id,
+        account_id,
+        before_id=before_id,
+        limit=limit,
+        known_ids=known_ids[:200],
+    )
+
+    # 방 전체 첨부파일을 한 번에 서명 (디렉터리 단위로 서명 공유 + 캐시)
+    all_urls = [
+        u for msg in messages
+        if isinstance(msg.get("file_urls"), list)
+        for u in msg["file_urls"]
+    ]
+    signed = dict(zip(all_urls, container.s3_service.sign_many(all_urls))) if all_urls else {}
 
     result = []
     for msg in messages:
-        if isinstance(msg, dict):
-            role = msg.get("role")
-            content = msg.get("content")
-            message_id = msg.get("message_id") or msg.get("id")
-            user_feedback = msg.get("user_feedback")
-            raw_urls = msg.get("file_urls", [])
-        else:
-            role = getattr(msg, "role", None)
-            content = getattr(msg, "content", None)
-            message_id = getattr(msg, "message_id", getattr(msg, "id", None))
-            user_feedback = getattr(msg, "user_feedback", None)
-            raw_urls = getattr(msg, "file_urls", [])
-
+        raw_urls = msg.get("file_urls", [])
         converted_urls = []
         if raw_urls and isinstance(raw_urls, list):
-            converted_urls = [s3_service.get_signed_url(u) for u in raw_urls]
+            converted_urls = [signed.get(u, u) for u in raw_urls]
 
         result.append({
-            "message_id": message_id,
-            "role": role,
-            "content": content,
-            "user_feedback": user_feedback,
+            "message_id": msg.get("message_id"),
+            "role": msg.get("role"),
+            "content": msg.get("content"),
+            "user_feedback": msg.get("user_feedback"),
             "file_urls": converted_urls
         })
 
-    return result
\ No newline at end of file
+    return result
@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.account.adapter.input.web.account_router import get_current_account_id
+from app.account.domain.entity.account import Account
+from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
+from app.config.container import AppContainer, get_container
+from app.config.database.session import get_db_session
+from app.config.rate_limit import AdmissionRejected, get_admission_controller, get_rate_limiter, retry_after_header
+from app.config.settings import settings
+from app.conversation.application.exception.quota_exception import QuotaExceededException
+from app.conversation.application.policy.role_policy import RolePolicy
+
+
+@dataclass(frozen=True)
+class LlmCaller:
+    """LLM 엔드포인트 호출자. 계정은 요청당 한 번만 조회하고 유스케이스까지 그대로 넘긴다"""
+    account_id: int
+    account: Optional[Account]
+    role: str
+
+
+async def get_llm_caller(
+        account_id: int = Depends(get_current_account_id),
+        account_db: Session = Depends(get_db_session),
+) -> LlmCaller:
+    # account 도메인은 동기 세션이라 이벤트 루프를 막지 않도록 스레드풀에서 조회
+    account = await run_in_threadpool(AccountRepositoryImpl(account_db).find_by_id, account_id)
+    return LlmCaller(account_id=account_id, account=account, role=RolePolicy.resolve_role(account))
+
+
+async def enforce_llm_rate_limit(caller: LlmCaller = Depends(get_llm_caller)) -> LlmCaller:
+    """
+    LLM 을 호출하는 엔드포인트용 계정/요금제 토큰 버킷.
+    통과하면 호출자(계정, 역할)를 반환한다.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return caller
+
+    retry_after = await get_rate_limiter().acquire(RolePolicy.rate_limits(caller.role, caller.account_id))
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=429,
+            detail="요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": retry_after_header(retry_after)},
+        )
+    return caller
+
+
+
+async def enforce_llm_quota(
+        caller: LlmCaller = Depends(enforce_llm_rate_limit),
+        container: AppContainer = Depends(get_container),
+) -> LlmCaller:
+    """
+    요청 빈도 제한 + 토큰 쿼터. 스트림을 시작하기 전에 검사해서 초과하면 429 (Retry-After) 로 응답한다.
+    """
+    try:
+        await container.usage_meter.check_available(caller.account_id, caller.role)
+    except QuotaExceededException as e:
+        raise HTTPException(
+            status_code=429,
+            detail=e.message,
+            headers={"Retry-After": str(e.retry_after or 1)},
+        )
+    return caller
+
+
+async def admit_llm_stream() -> None:
+    """
+    전역 동시 스트림 한도에 대한 입장 허가.
+    허가를 받은 호출자는 스트림이 끝날 때 get_admission_controller().leave() 로 반납해야 한다.
+    """
+    try:
+        await get_admission_controller().enter()
+    except AdmissionRejected as e:
+        if e.draining:
+            # 다른 워커/인스턴스로 재시도하도록 503
+            raise HTTPException(
+                status_code=503,
+                detail="서버가 재시작 중입니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": retry_after_header(e.retry_after)},
+            )
+        raise HTTPException(
+            status_code=429,
+            detail="현재 요청이 많아 응답을 생성할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": retry_after_header(e.retry_after)},
+        )
@@ -1,8 +1,218 @@
+import asyncio
+import json
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException, Request
 from fastapi.responses import StreamingResponse
 
+from app.config.settings import settings
+from app.conversation.domain.conversation.stream_event import StreamCompleted, StreamFailed
+
+_DATA = "data"
+_DONE = "done"
+_ERROR = "error"
+_HEARTBEAT = "heartbeat"
+
+
+async def _coalesce(
+    source: AsyncIterator,
+    max_delay: float,
+    max_bytes: int,
+    heartbeat_interval: float,
+) -> AsyncIterator[tuple]:
+    """
+    LLM 델타를 max_delay 초 또는 max_bytes 바이트 단위로 묶어서 내보낸다.
+    대기 중 heartbeat_interval 동안 아무 것도 없으면 heartbeat 를 낸다.
+    yield: (kind, payload) — (data, str) | (done, StreamCompleted) | (error, StreamFailed) | (heartbeat, None)
+    """
+    loop = asyncio.get_running_loop()
+    iterator = source.__aiter__()
+    parts: list[str] = []
+    size = 0
+    deadline = None
+    pending = None
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+
+            timeout = heartbeat_interval if not parts else max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+
+            if not done:
+                if parts:
+                    yield _DATA, "".join(parts)
+                    parts, size, deadline = [], 0, None
+                else:
+                    yield _HEARTBEAT, None
+                continue
+
+            task, pending = pending, None
+            try:
+                item = task.result()
+            except StopAsyncIteration:
+                break
+
+            if isinstance(item, (StreamCompleted, StreamFailed)):
+                if parts:
+                    yield _DATA, "".join(parts)
+                    parts, size, deadline = [], 0, None
+                yield (_DONE if isinstance(item, StreamCompleted) else _ERROR), item
+                continue
+
+            if isinstance(item, (bytes, bytearray)):
+                size += len(item)
+                item = item.decode("utf-8")
+            else:
+                size += len(item.encode("utf-8"))
+            if not item:
+                continue
+
+            if not parts:
+                deadline = loop.time() + max_delay
+            parts.append(item)
+
+            if size >= max_bytes:
+                yield _DATA, "".join(parts)
+                parts, size, deadline = [], 0, None
+
+        if parts:
+            yield _DATA, "".join(parts)
+    finally:
+        # 클라이언트 연결 종료 등으로 중단되면 원본 생성기도 정리
+        if pending is not None:
+            pending.cancel()
+            try:
+                await pending
+            except BaseException:
+                pass
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _sse_event(event: str, data: str, event_id: Optional[int] = None) -> bytes:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    # 여러 줄 데이터는 줄마다 data: 필드로 (EventSource 가 \n 으로 다시 합친다)
+    # \r, \r\n 도 SSE 에서는 줄 끝이라 먼저 \n 으로 정규화한다
+    normalized = data.replace("\r\n", "\n").replace("\r", "\n")
+    lines.extend(f"data: {line}" for line in normalized.split("\n"))
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
 
 class StreamAdapter:
 
     @staticmethod
-    def to_streaming_response(generator):
-        return StreamingResponse(generator, media_type="text/plain")
+    def wants_sse(request: Optional[Request]) -> bool:
+        return bool(request) and "text/event-stream" in request.headers.get("accept", "")
+
+    @staticmethod
+    def to_streaming_response(generator, request: Optional[Request] = None, headers: Optional[dict] = None):
+        """
+        Accept 헤더가 text/event-stream 이면 SSE, 아니면 기존처럼 text/plain 으로 응답.
+        두 경우 모두 델타를 시간/크기 창으로 묶어서 쓴다.
+        """
+        headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no", **(headers or {})}
+
+        if StreamAdapter.wants_sse(request):
+            last_event_id = request.headers.get("last-event-id")
+            resume_from = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+            return StreamingResponse(
+                StreamAdapter._sse(generator, resume_from),
+                media_type="text/event-stream",
+                headers=headers,
+            )
+
+        return StreamingResponse(
+            StreamAdapter._plain(generator),
+            media_type="text/plain; charset=utf-8",
+            headers=headers,
+        )
+
+    @staticmethod
+    async def to_checked_response(generator, request: Optional[Request] = None, headers: Optional[dict] = None):
+        """
+        to_streaming_response 와 같되, text/plain 은 실패를 본문에 실을 수 없으므로
+        첫 항목이 실패면 HTTP 상태 코드(+ Retry-After)로 응답한다. SSE 는 error 이벤트로 전달.
+        """
+        if not StreamAdapter.wants_sse(request):
+            failure, generator = await StreamAdapter.take_failure(generator)
+            if failure is not None:
+                raise HTTPException(
+                    status_code=failure.status_code,
+                    detail=failure.detail,
+                    headers={"Retry-After": str(failure.retry_after)} if failure.retry_after else None,
+                )
+        return StreamAdapter.to_streaming_response(generator, request=request, headers=headers)
+
+    @staticmethod
+    async def take_failure(generator) -> tuple[Optional[StreamFailed], Optional[AsyncIterator]]:
+        """
+        첫 항목을 미리 읽는다. 첫 항목이 StreamFailed 면 (이벤트, None),
+        아니면 (None, 첫 항목부터 다시 내보내는 생성기).
+        text/plain 은 본문보다 상태 코드가 먼저 나가므로, 시작 전에 실패한 생성은 이걸로 HTTP 상태 코드가 된다.
+        """
+        iterator = generator.__aiter__()
+        aclose = getattr(iterator, "aclose", None)
+        try:
+            first = await iterator.__anext__()
+        except StopAsyncIteration:
+            first = None
+
+        if isinstance(first, StreamFailed):
+            if aclose is not None:
+                await aclose()
+            return first, None
+
+        async def replay():
+            try:
+                if first is not None:
+                    yield first
+                    async for item in iterator:
+                        yield item
+            finally:
+                if aclose is not None:
+                    await aclose()
+
+        return None, replay()
+
+    @staticmethod
+    def _window():
+        return (
+            settings.STREAM_COALESCE_MS / 1000,
+            settings.STREAM_COALESCE_BYTES,
+            settings.STREAM_HEARTBEAT_SECONDS,
+        )
+
+    @staticmethod
+    async def _plain(generator) -> AsyncIterator[bytes]:
+        async for kind, payload in _coalesce(generator, *StreamAdapter._window()):
+            if kind == _DATA:
+                yield payload.encode("utf-8")
+
+    @staticmethod
+    async def _sse(generator, resume_from: int = 0) -> AsyncIterator[bytes]:
+        """
+        이벤트 id 는 지금까지 보낸 누적 글자 수(offset).
+        Last-Event-ID 로 재연결하면 해당 offset 이전 내용은 건너뛴다.
+        """
+        offset = 0
+        async for kind, payload in _coalesce(generator, *StreamAdapter._window()):
+            if kind == _HEARTBEAT:
+                yield b": ping\n\n"
+            elif kind == _DONE:
+                yield _sse_event("done", json.dumps(payload.to_payload(), ensure_ascii=False), offset)
+            elif kind == _ERROR:
+                yield _sse_event("error", json.dumps(payload.to_payload(), ensure_ascii=False))
+            else:
+                start = offset
+                offset += len(payload)
+                if offset <= resume_from:
+                    continue
+                if start < resume_from:
+                    payload = payload[resume_from - start:]
+                yield _sse_event("delta", payload, offset)
@@ -0,0 +1,9 @@
+from app.conversation.application.exception.application_exception import ApplicationException
+
+
+class LlmBusyException(ApplicationException):
+    """LLM 동시 실행 한도에 걸려 지금은 호출할 수 없음 (잠시 후 재시도)"""
+
+    def __init__(self, message: str = "LLM is busy", retry_after: int | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
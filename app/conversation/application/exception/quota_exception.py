@@ -4,5 +4,6 @@ from app.conversation.application.exception.application_exception import Applica
 class QuotaExceededException(ApplicationException):
     """유저 사용량 초과"""
 
-    def __init__(self, message: str = "Usage quota exceeded"):
+    def __init__(self, message: str = "Usage quota exceeded", retry_after: int | None = None):
         super().__init__(message)
+        self.retry_after = retry_after
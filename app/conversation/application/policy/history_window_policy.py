@@ -0,0 +1,49 @@
+from app.config.settings import settings
+from app.conversation.application.policy.usage_policy import UsagePolicy
+
+
+class HistoryWindowPolicy:
+    """
+    프롬프트에 들어가는 대화 기록의 크기 규칙.
+    방이 아무리 오래되어도 프롬프트가 토큰 상한을 넘지 않도록 한다.
+    """
+
+    WINDOW_SIZE = settings.CHAT_HISTORY_WINDOW_SIZE
+    PROMPT_TOKEN_BUDGET = settings.CHAT_PROMPT_TOKEN_BUDGET
+    SUMMARY_TOKEN_BUDGET = settings.CHAT_SUMMARY_TOKEN_BUDGET
+    SUMMARY_MIN_BATCH = settings.CHAT_SUMMARY_MIN_BATCH
+    SUMMARY_MAX_BATCH = settings.CHAT_SUMMARY_MAX_BATCH
+    # 한국어는 대략 글자당 1 토큰 이상이라 요약 길이는 토큰 예산과 같은 글자 수로 요청한다
+    SUMMARY_MAX_CHARS = settings.CHAT_SUMMARY_TOKEN_BUDGET
+
+    @staticmethod
+    def payload_text(item: dict) -> str:
+        """to_llm_payload 항목에서 텍스트만 추출 (user 는 content 가 파트 리스트)"""
+        content = item.get("content")
+        if isinstance(content, list):
+            return "".join(p.get("text", "") for p in content if p.get("type") == "text")
+        return content or ""
+
+    @classmethod
+    def clip_text(cls, text: str, max_tokens: int) -> str:
+        """토큰 상한을 넘는 텍스트는 앞부분만 남긴다."""
+        return UsagePolicy.truncate_to_tokens(text, max_tokens)
+
+    @classmethod
+    def fit_history(cls, history_payload: list, max_tokens: int) -> list:
+        """최신 메시지부터 거꾸로 채워서 max_tokens 안에 들어가는 만큼만 남긴다."""
+        kept = []
+        used = 0
+        for item in reversed(history_payload):
+            tokens = UsagePolicy.calculate_token(cls.payload_text(item))
+            if used + tokens > max_tokens:
+                break
+            kept.append(item)
+            used += tokens
+        kept.reverse()
+        return kept
+
+    @classmethod
+    def needs_summary_refresh(cls, window_messages: list) -> bool:
+        """윈도우가 가득 찼다면 윈도우 밖으로 밀려난 메시지가 있을 수 있다."""
+        return len(window_messages) >= cls.WINDOW_SIZE
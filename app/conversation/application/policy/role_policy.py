@@ -4,17 +4,55 @@ class RolePolicy:
         "FREE": {
             "max_rooms": 1,
             "max_message_length": 500,
+            "window_tokens": 50_000,
+            "requests_per_minute": 6,  # 계정 당 LLM 요청 토큰 버킷
+            "burst": 3,
+            "plan_requests_per_minute": 600,  # 요금제 전체 합산 한도
         },
         "PAID": {
             "max_rooms": 10,
             "max_message_length": 4000,
+            "window_tokens": 1_000_000,
+            "requests_per_minute": 30,
+            "burst": 10,
+            "plan_requests_per_minute": 3000,
         },
         "ADMIN": {
             "max_rooms": 999,
             "max_message_length": 10000,
+            "window_tokens": 100_000_000,
+            "requests_per_minute": 600,
+            "burst": 100,
+            "plan_requests_per_minute": 100_000,
         },
     }
 
+    @staticmethod
+    def resolve_role(account) -> str:
+        """계정 권한/요금제로 정책 역할을 결정 (계정이 없으면 FREE)"""
+        if account is None:
+            return "FREE"
+        if account.is_admin():
+            return "ADMIN"
+        if account.has_paid_plan() and not account.is_plan_expired():
+            return "PAID"
+        return "FREE"
+
     @classmethod
     def max_message_length(cls, role: str) -> int:
         return cls.ROLE_LIMITS[role]["max_message_length"]
+
+    @classmethod
+    def window_tokens(cls, role: str) -> int:
+        """USAGE_WINDOW_SECONDS 동안 사용할 수 있는 토큰 수"""
+        return cls.ROLE_LIMITS[role]["window_tokens"]
+
+    @classmethod
+    def rate_limits(cls, role: str, account_id: int) -> list[tuple[str, float, float]]:
+        """(버킷 키, 초당 충전량, 버킷 크기) — 계정 버킷과 요금제 합산 버킷"""
+        limits = cls.ROLE_LIMITS[role]
+        plan_rate = limits["plan_requests_per_minute"] / 60
+        return [
+            (f"account:{account_id}", limits["requests_per_minute"] / 60, limits["burst"]),
+            (f"plan:{role}", plan_rate, max(1.0, plan_rate * 10)),
+        ]
@@ -1,6 +1,51 @@
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # tokenizer 미설치 환경에서는 길이 기반 추정으로 대체
+    tiktoken = None
+
+
+@lru_cache(maxsize=4)
+def _get_encoder(model: str):
+    """모델별 인코더는 로딩 비용이 커서 한 번만 만든다 (실패 시 None)"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # BPE 파일을 받을 수 없는 환경 등
+        return None
+
+
+def _encoder():
+    from app.config.settings import settings
+    return _get_encoder(settings.LLM_MODEL)
+
+
 class UsagePolicy:
 
     @staticmethod
     def calculate_token(text: str) -> int:
-        # 단순 예시 (실제로는 tokenizer 연동)
-        return len(text) // 4
+        if not text:
+            return 0
+        encoder = _encoder()
+        if encoder is None:
+            return len(text) // 4
+        return len(encoder.encode(text, disallowed_special=()))
+
+    @staticmethod
+    def truncate_to_tokens(text: str, max_tokens: int) -> str:
+        """앞에서부터 max_tokens 토큰까지만 남긴다 (calculate_token 과 같은 인코더 기준)"""
+        if max_tokens <= 0 or not text:
+            return ""
+        encoder = _encoder()
+        if encoder is None:
+            return text[: max_tokens * 4]
+        tokens = encoder.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        # 잘린 위치의 멀티바이트 문자 조각은 버린다
+        return encoder.decode_bytes(tokens[:max_tokens]).decode("utf-8", errors="ignore")
@@ -7,10 +7,35 @@ class ChatMessageRepositoryPort(ABC):
         """유저/AI 구분 없이 메시지를 저장하고 생성된 객체를 반환"""
         pass
 
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
     @abstractmethod
     async def find_by_room_id(self, room_id: str):
         pass
 
     @abstractmethod
-    async def find_by_room_id_with_feedback(self, room_id: str, account_id: int):
-        pass
\ No newline at end of file
+    async def find_by_room_id_with_feedback(
+        self,
+        room_id: str,
+        account_id: int,
+        before_id: int | None = None,
+        limit: int | None = None,
+        known_ids: list[int] | None = None,
+    ):
+        """
+        메시지 컬럼 + 피드백(satisfaction)을 한 번의 조인으로 오래된 순으로 반환.
+        known_ids 에 포함된 메시지는 content_enc 가 None 으로 채워진다.
+        """
+        pass
+
+    @abstractmethod
+    async def find_recent_by_room_id(self, room_id: str, limit: int, before_id: int | None = None):
+        """id 기준 keyset 으로 최근 limit 개를 조회하여 오래된 순으로 반환"""
+        pass
+
+    @abstractmethod
+    async def find_between(self, room_id: str, after_id: int, before_id: int, limit: int):
+        """after_id < id < before_id 범위의 메시지를 오래된 순으로 최대 limit 개 반환"""
+        pass
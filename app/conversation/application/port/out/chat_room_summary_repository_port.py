@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+
+class ChatRoomSummaryRepositoryPort(ABC):
+
+    @abstractmethod
+    async def find_by_room_id(self, room_id: str):
+        pass
+
+    @abstractmethod
+    async def upsert(
+        self,
+        room_id: str,
+        summary_enc: bytes,
+        iv: bytes,
+        enc_version: int,
+        last_message_id: int,
+    ) -> None:
+        pass
@@ -1,5 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import AsyncIterator
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Optional
+
+
+@dataclass(frozen=True)
+class LlmUsage:
+    """업스트림이 보고한 토큰 사용량 (cached_tokens 는 prompt_tokens 중 프롬프트 캐시로 처리된 양)"""
+    prompt_tokens: int
+    completion_tokens: int
+    cached_tokens: int = 0
 
 
 class LlmChatPort(ABC):
@@ -8,11 +17,18 @@ class LlmChatPort(ABC):
     async def stream_chat(
         self,
         messages: list[dict],
+        cache_key: Optional[str] = None,
+        on_usage: Optional[Callable[[LlmUsage], None]] = None,
     ) -> AsyncIterator[str]:
         """
-        messages:
+        messages: 역할이 구분된 chat-completions 메시지
         [
-          {"role": "system|user|assistant", "content": "..."}
+          {"role": "system", "content": "고정 지시 + 사용자 프로필 (바이트 단위로 안정적인 접두부)"},
+          {"role": "user|assistant", "content": "..."},  # 대화 기록
+          {"role": "user", "content": "..." | [{"type": "text"|"image_url", ...}]},  # 현재 턴
         ]
+        cache_key: 같은 시스템 접두부를 쓰는 요청을 묶는 업스트림 프롬프트 캐시 힌트
+        on_usage: 업스트림이 사용량(cached_tokens 포함)을 보고하면 스트림 끝에 호출된다
+        동시 실행 한도로 호출하지 못하면 LlmBusyException
         """
         pass
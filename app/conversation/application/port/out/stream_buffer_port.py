@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+
+# 버퍼 항목 종류
+DELTA = "delta"
+DONE = "done"
+ERROR = "error"
+
+
+class StreamBufferPort(ABC):
+    """
+    생성 중인 응답 델타를 HTTP 연결과 분리해서 보관하는 버퍼.
+    항목은 (entry_id, kind, data) 이며 entry_id 는 버퍼 내에서 증가한다.
+    """
+
+    @abstractmethod
+    async def create(self, stream_id: str, account_id: int, ttl_seconds: int) -> None:
+        """스트림을 만들고 소유자를 기록"""
+        pass
+
+    @abstractmethod
+    async def get_owner(self, stream_id: str) -> int | None:
+        """소유자 account_id (없거나 만료되면 None)"""
+        pass
+
+    @abstractmethod
+    async def append(self, stream_id: str, kind: str, data: str) -> None:
+        pass
+
+    @abstractmethod
+    async def read(self, stream_id: str, after_id: str | None, block_ms: int) -> list[tuple[str, str, str]]:
+        """
+        after_id 이후 항목을 반환 (None 이면 처음부터).
+        새 항목이 없으면 최대 block_ms 동안 기다린 뒤 빈 리스트를 반환.
+        """
+        pass
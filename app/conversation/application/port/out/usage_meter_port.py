@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from app.common.domain.stream_accumulator import StreamAccumulator
+
 
 class UsageMeterPort(ABC):
 
@@ -7,8 +9,9 @@ class UsageMeterPort(ABC):
     async def check_available(
         self,
         account_id: int,
+        role: str = "FREE",
     ) -> None:
-        """쿼터 초과 시 Exception"""
+        """쿼터 초과 시 QuotaExceededException"""
         pass
 
     @abstractmethod
@@ -17,5 +20,16 @@ class UsageMeterPort(ABC):
         account_id: int,
         input_tokens: int,
         token_count: int,
+        room_id: str | None = None,
     ) -> None:
         pass
+
+    async def record_stream_usage(
+        self,
+        account_id: int,
+        input_tokens: int,
+        reply: StreamAccumulator,
+        room_id: str | None = None,
+    ) -> None:
+        """스트리밍 응답의 출력 토큰은 누적기에서 계산"""
+        await self.record_usage(account_id, input_tokens, reply.token_count, room_id)
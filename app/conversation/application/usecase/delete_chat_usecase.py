@@ -1,6 +1,7 @@
 class DeleteChatUseCase:
-    def __init__(self, chat_room_repo):
+    def __init__(self, chat_room_repo, history_cache=None):
         self.chat_room_repo = chat_room_repo
+        self.history_cache = history_cache
 
     async def execute(self, room_id: str, account_id: int) -> bool:
         room = await self.chat_room_repo.find_by_id(room_id)
@@ -11,4 +12,7 @@ class DeleteChatUseCase:
         if room.account_id != account_id:
             return False
 
-        return await self.chat_room_repo.delete_by_room_id(room_id)
\ No newline at end of file
+        deleted = await self.chat_room_repo.delete_by_room_id(room_id)
+        if deleted and self.history_cache:
+            await self.history_cache.invalidate(room_id)
+        return deleted
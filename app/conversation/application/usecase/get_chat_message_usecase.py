@@ -1,59 +1,77 @@
-from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
-from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
+from app.conversation.application.port.out.chat_message_repository_port import ChatMessageRepositoryPort
 from app.config.security.message_crypto import AESEncryption
 
 class GetChatMessagesUseCase:
-    def __init__(self, chat_message_repo: ChatMessageRepositoryImpl, crypto_service: AESEncryption):
+    def __init__(self, chat_message_repo: ChatMessageRepositoryPort, crypto_service: AESEncryption, history_cache=None):
         self.chat_message_repo = chat_message_repo
         self.crypto_service = crypto_service
+        self.history_cache = history_cache
 
-    async def execute(self, room_id: str, account_id: int):
+    async def execute(
+        self,
+        room_id: str,
+        account_id: int,
+        before_id: int | None = None,
+        limit: int | None = None,
+        known_ids: list[int] | None = None,
+    ):
         """
         채팅방의 메시지를 조회하고 복호화하여 반환합니다.
+        limit 이 없으면 방 전체를, 있으면 before_id 이전의 최근 limit 개를 반환합니다.
+        known_ids 에 포함된 메시지는 content 를 None 으로 돌려줍니다 (클라이언트가 이미 보유).
         """
-        # 1. DB에서 해당 방의 모든 메시지 조회
-        messages = await self.chat_message_repo.find_by_room_id(room_id)
-        decrypted = []
-
-        for m in messages:
-            content_text = ""
-
-            fb = self.chat_message_repo.db.query(ChatFeedbackOrm).filter(
-                ChatFeedbackOrm.message_id == getattr(m, 'id', None),
-                ChatFeedbackOrm.account_id == account_id
-            ).first()
-            user_feedback_value = fb.satisfaction.value if fb else None
+        # 1. 메시지 + 피드백을 단일 조인 쿼리로 조회
+        rows = await self.chat_message_repo.find_by_room_id_with_feedback(
+            room_id,
+            account_id,
+            before_id=before_id,
+            limit=limit,
+            known_ids=known_ids,
+        )
+        known = set(known_ids or [])
 
-            # ORM 객체(m)에서 직접 컬럼에 접근 (getattr를 활용해 안전하게 추출)
-            # m.content_enc, m.iv, m.message_id 등의 필드명을 가정합니다.
-            content_enc = getattr(m, 'content_enc', None)
-            iv = getattr(m, 'iv', None)
+        # 캐시에 있는 메시지는 복호화를 생략
+        cached = {}
+        if self.history_cache:
+            cached = await self.history_cache.get_many(
+                room_id, [r.id for r in rows if r.id not in known]
+            )
+        newly_decrypted = {}
+        decrypted = []
 
+        for r in rows:
             # 2. 메시지 복호화 로직
-            if not content_enc:
+            if r.id in known:
+                content_text = None
+            elif r.id in cached:
+                content_text = cached[r.id]
+            elif not r.content_enc:
                 content_text = ""
             else:
                 try:
-                    target_iv = iv if (iv and len(iv) == 16) else None
+                    target_iv = r.iv if (r.iv and len(r.iv) == 16) else None
                     content_text = self.crypto_service.decrypt(
-                        ciphertext=content_enc,
+                        ciphertext=r.content_enc,
                         iv=target_iv
                     )
-                except Exception as e:
-                    msg_id = getattr(m, 'message_id', getattr(m, 'id', 'unknown'))
+                    newly_decrypted[r.id] = content_text
+                except Exception:
                     content_text = "[복호화 오류]"
 
             # 3. 반환 데이터 조립
             decrypted.append({
-                "message_id": getattr(m, 'message_id', getattr(m, 'id', None)),
-                "room_id": m.room_id,
-                "account_id": m.account_id,
-                "role": m.role.value if hasattr(m.role, 'value') else str(m.role),
+                "message_id": r.id,
+                "room_id": r.room_id,
+                "account_id": r.account_id,
+                "role": r.role.value if hasattr(r.role, 'value') else str(r.role),
                 "content": content_text,
-                "contents_type": getattr(m, 'contents_type', getattr(m, 'content_type', 'TEXT')),
-                "created_at": m.created_at,
-                "user_feedback": user_feedback_value,
-                "file_urls": getattr(m, 'file_urls', []) or [],
+                "contents_type": r.contents_type or 'TEXT',
+                "created_at": r.created_at,
+                "user_feedback": r.satisfaction.value if r.satisfaction else None,
+                "file_urls": r.file_urls or [],
             })
 
-        return decrypted
\ No newline at end of file
+        if self.history_cache:
+            await self.history_cache.put_many(room_id, newly_decrypted)
+
+        return decrypted
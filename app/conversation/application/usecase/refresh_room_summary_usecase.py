@@ -0,0 +1,92 @@
+from app.common.domain.stream_accumulator import StreamAccumulator
+from app.conversation.application.policy.history_window_policy import HistoryWindowPolicy
+from app.conversation.application.port.out.chat_message_repository_port import ChatMessageRepositoryPort
+from app.conversation.application.port.out.chat_room_summary_repository_port import ChatRoomSummaryRepositoryPort
+
+
+class RefreshRoomSummaryUseCase:
+    """
+    최근 윈도우 밖으로 밀려난 메시지를 기존 요약에 접어 넣는다.
+    요청 경로가 아닌 백그라운드에서 실행된다.
+    """
+
+    def __init__(
+        self,
+        chat_message_repo: ChatMessageRepositoryPort,
+        summary_repo: ChatRoomSummaryRepositoryPort,
+        llm_chat_port,
+        crypto_service,
+    ):
+        self.chat_message_repo = chat_message_repo
+        self.summary_repo = summary_repo
+        self.llm_chat_port = llm_chat_port
+        self.crypto_service = crypto_service
+
+    async def execute(self, room_id: str) -> bool:
+        window = await self.chat_message_repo.find_recent_by_room_id(
+            room_id, limit=HistoryWindowPolicy.WINDOW_SIZE
+        )
+        if not HistoryWindowPolicy.needs_summary_refresh(window):
+            return False
+
+        summary = await self.summary_repo.find_by_room_id(room_id)
+        summarized_until = summary.last_message_id if summary else 0
+
+        # 요약 이후 ~ 윈도우 시작 전까지의 메시지만 가져온다.
+        pending = await self.chat_message_repo.find_between(
+            room_id,
+            after_id=summarized_until,
+            before_id=window[0].id,
+            limit=HistoryWindowPolicy.SUMMARY_MAX_BATCH,
+        )
+        if len(pending) < HistoryWindowPolicy.SUMMARY_MIN_BATCH:
+            return False
+
+        previous_summary = ""
+        if summary:
+            previous_summary = self._decrypt(summary.summary_enc, summary.iv)
+
+        turns = []
+        for m in pending:
+            text = self._decrypt(m.content_enc, m.iv)
+            if text is None:
+                continue
+            role_label = "상담사" if str(m.role).upper() == "ASSISTANT" else "사용자"
+            turns.append(f"{role_label}: {text}")
+
+        max_chars = HistoryWindowPolicy.SUMMARY_MAX_CHARS
+        prompt = (
+            "다음은 관계 상담 대화의 기존 요약과 그 이후에 오간 대화입니다.\n"
+            "사용자의 핵심 고민, 감정 변화, 관계 상황, 상담사가 제시한 조언을 중심으로 "
+            f"기존 요약을 갱신하여 {max_chars}자 이내의 한국어 요약문만 출력하세요.\n\n"
+            f"[기존 요약]\n{previous_summary or '없음'}\n\n"
+            "[이후 대화]\n" + "\n".join(turns)
+        )
+
+        reply = StreamAccumulator()
+        async for chunk in self.llm_chat_port.call_gpt(prompt=prompt):
+            reply.append(chunk)
+        new_summary = HistoryWindowPolicy.clip_text(
+            reply.text.strip(), HistoryWindowPolicy.SUMMARY_TOKEN_BUDGET
+        )
+        if not new_summary:
+            return False
+
+        summary_enc, iv = self.crypto_service.encrypt(new_summary)
+        await self.summary_repo.upsert(
+            room_id=room_id,
+            summary_enc=summary_enc,
+            iv=iv,
+            enc_version=self.crypto_service.get_version(),
+            last_message_id=pending[-1].id,
+        )
+        return True
+
+    def _decrypt(self, ciphertext: bytes, iv: bytes) -> str | None:
+        try:
+            return self.crypto_service.decrypt(
+                ciphertext=ciphertext,
+                iv=iv if (iv and len(iv) == 16) else None,
+            )
+        except Exception:
+            return None
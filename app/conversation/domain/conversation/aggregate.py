@@ -1,7 +1,10 @@
 class Conversation:
-    def __init__(self, room, messages):
+    def __init__(self, room, messages, summary=None):
         self.room = room
+        # 최근 윈도우의 메시지만 담긴다 (전체 방 메시지가 아님)
         self.messages = messages
+        # 윈도우 밖 오래된 대화의 롤링 요약 (ChatRoomSummaryOrm)
+        self.summary = summary
 
     def get_last_id(self) -> int | None:
         """현재 방의 마지막 메시지 ID 추출 (다음 메시지의 부모)"""
@@ -10,6 +13,36 @@ class Conversation:
         # ORM 객체의 id 필드 기준
         return max([m.id for m in self.messages])
 
+    def get_summary_text(self, crypto_service) -> str:
+        """윈도우 밖 대화의 요약을 복호화하여 반환"""
+        if not self.summary:
+            return ""
+        try:
+            return crypto_service.decrypt(
+                ciphertext=self.summary.summary_enc,
+                iv=self.summary.iv if (self.summary.iv and len(self.summary.iv) == 16) else None
+            )
+        except Exception:
+            return ""
+
+    def decrypt_messages(self, crypto_service, known: dict | None = None) -> dict:
+        """
+        윈도우 메시지를 {message_id: 평문} 으로 복호화.
+        known 에 이미 있는 메시지(캐시 적중)는 다시 복호화하지 않는다.
+        """
+        decrypted = dict(known or {})
+        for m in self.messages:
+            if m.id in decrypted:
+                continue
+            try:
+                decrypted[m.id] = crypto_service.decrypt(
+                    ciphertext=m.content_enc,
+                    iv=m.iv if (m.iv and len(m.iv) == 16) else None
+                )
+            except Exception:
+                continue
+        return decrypted
+
     def is_active(self) -> bool:
         # ChatRoomOrm의 status 필드 확인
         return getattr(self.room, "status", "ACTIVE") == "ACTIVE"
@@ -33,19 +66,21 @@ class Conversation:
                 continue
         return context
 
-    def to_llm_payload(self, crypto_service) -> list:
+    def to_llm_payload(self, crypto_service, decrypted: dict | None = None) -> list:
         """
         이미지는 'image_url' 객체로, 텍스트는 'text' 객체로 변환.
+        decrypted 가 주어지면 복호화 대신 해당 평문을 사용한다.
         """
         ai_context = []
         sorted_msgs = sorted(self.messages, key=lambda x: x.id)
+        if decrypted is None:
+            decrypted = self.decrypt_messages(crypto_service)
 
         for m in sorted_msgs:
             try:
-                decrypted_txt = crypto_service.decrypt(
-                    ciphertext=m.content_enc,
-                    iv=m.iv if (m.iv and len(m.iv) == 16) else None
-                )
+                if m.id not in decrypted:
+                    continue
+                decrypted_txt = decrypted[m.id]
                 role = "assistant" if str(m.role).upper() == "ASSISTANT" else "user"
 
                 file_urls = getattr(m, 'file_urls', [])
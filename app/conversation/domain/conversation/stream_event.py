@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class StreamCompleted:
+    """
+    스트리밍 생성기가 마지막에 yield 하는 완료 이벤트.
+    본문 청크가 아니므로 text/plain 응답에서는 버려지고, SSE 에서는 done 이벤트가 된다.
+    """
+    message_id: Optional[int] = None
+    usage: dict = field(default_factory=dict)
+    extra: dict = field(default_factory=dict)
+
+    def to_payload(self) -> dict:
+        return {"message_id": self.message_id, "usage": self.usage, **self.extra}
+
+
+@dataclass(frozen=True)
+class StreamFailed:
+    """
+    백그라운드 생성이 실패했을 때 재생 스트림 끝에 오는 이벤트.
+    SSE 에서는 error 이벤트가 되고, text/plain 응답은 첫 항목이면 HTTP 상태 코드로 응답한다.
+    """
+    status_code: int = 500
+    detail: str = ""
+    retry_after: Optional[int] = None
+
+    def to_payload(self) -> dict:
+        payload = {"status_code": self.status_code, "detail": self.detail}
+        if self.retry_after is not None:
+            payload["retry_after"] = self.retry_after
+        return payload
@@ -0,0 +1,209 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import AsyncIterator, Callable, Optional
+
+from fastapi import HTTPException
+
+from app.config.database.session import AsyncSessionLocal, SessionLocal
+from app.conversation.application.exception.llm_exception import LlmBusyException
+from app.conversation.application.exception.quota_exception import QuotaExceededException
+from app.conversation.application.port.out.stream_buffer_port import DELTA, DONE, ERROR, StreamBufferPort
+from app.conversation.domain.conversation.stream_event import StreamCompleted, StreamFailed
+
+logger = logging.getLogger(__name__)
+
+
+class _DeltaBatcher:
+    """
+    델타를 max_delay 초 또는 max_bytes 바이트 단위로 묶어서 버퍼에 쓴다 (델타마다 XADD 하지 않도록).
+    쓰기는 락으로 직렬화되어 완료/실패 이벤트는 항상 앞선 델타 뒤에 붙는다.
+    """
+
+    def __init__(self, buffer: StreamBufferPort, stream_id: str, max_delay: float, max_bytes: int):
+        self.buffer = buffer
+        self.stream_id = stream_id
+        self.max_delay = max_delay
+        self.max_bytes = max_bytes
+        self._parts: list[str] = []
+        self._size = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+
+    async def add(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text.encode("utf-8"))
+        if self._size >= self.max_bytes:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush_later)
+
+    def _flush_later(self) -> None:
+        self._timer = None
+        task = asyncio.create_task(self.flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._parts:
+            return
+        data = "".join(self._parts)
+        self._parts, self._size = [], 0
+        async with self._lock:
+            await self.buffer.append(self.stream_id, DELTA, data)
+
+    async def event(self, kind: str, data: str) -> None:
+        """남은 델타를 먼저 쓰고 완료/실패 이벤트를 붙인다"""
+        await self.flush()
+        async with self._lock:
+            await self.buffer.append(self.stream_id, kind, data)
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+
+class ChatStreamRunner:
+    """
+    채팅 응답 생성을 HTTP 연결과 분리된 백그라운드 태스크로 실행한다.
+    델타는 StreamBufferPort 에 쌓이고, 클라이언트는 stream_id 로 붙었다 떨어졌다 할 수 있다.
+    클라이언트가 끊겨도 생성과 assistant 메시지 저장은 끝까지 진행된다.
+    """
+
+    def __init__(
+            self,
+            buffer: StreamBufferPort,
+            usecase_factory: Callable,
+            ttl_seconds: int,
+            attach_idle_timeout_seconds: float,
+            append_max_delay_seconds: float = 0.02,
+            append_max_bytes: int = 256,
+    ):
+        # usecase_factory(db: AsyncSession, account_db: Session) -> StreamChatUsecase
+        self.buffer = buffer
+        self.usecase_factory = usecase_factory
+        self.ttl = ttl_seconds
+        self.idle_timeout = attach_idle_timeout_seconds
+        self.append_max_delay = append_max_delay_seconds
+        self.append_max_bytes = append_max_bytes
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def active_count(self) -> int:
+        return len(self._tasks)
+
+    async def start(self, account_id: int, on_finish: Optional[Callable[[], None]] = None, **execute_kwargs) -> str:
+        """on_finish 는 생성 태스크가 끝나면 (성공/실패 무관) 호출된다"""
+        stream_id = uuid.uuid4().hex
+        await self.buffer.create(stream_id, account_id, self.ttl)
+
+        task = asyncio.create_task(self._run(stream_id, account_id, execute_kwargs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if on_finish is not None:
+            task.add_done_callback(lambda _: on_finish())
+        return stream_id
+
+    async def drain(self, timeout_seconds: float) -> int:
+        """
+        진행 중인 생성 태스크가 끝나기를 (assistant 메시지 저장 포함) 최대 timeout_seconds 기다린다.
+        기한을 넘긴 태스크는 취소하고 (버퍼에 503 실패 이벤트를 남김), 취소한 개수를 반환한다.
+        """
+        if not self._tasks:
+            return 0
+
+        logger.info("draining %d chat stream(s), timeout=%.1fs", len(self._tasks), timeout_seconds)
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout_seconds)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning("cancelled %d chat stream(s) after drain timeout", len(pending))
+        return len(pending)
+
+    async def _run(self, stream_id: str, account_id: int, execute_kwargs: dict) -> None:
+        # 요청 세션은 응답이 끝나면 닫히므로 별도 세션을 연다.
+        account_db = SessionLocal()
+        batcher = _DeltaBatcher(self.buffer, stream_id, self.append_max_delay, self.append_max_bytes)
+        try:
+            async with AsyncSessionLocal() as db:
+                usecase = self.usecase_factory(db, account_db)
+                async for item in usecase.execute(account_id=account_id, **execute_kwargs):
+                    if isinstance(item, StreamCompleted):
+                        await batcher.event(DONE, json.dumps(item.to_payload(), ensure_ascii=False))
+                        continue
+                    if isinstance(item, (bytes, bytearray)):
+                        item = item.decode("utf-8")
+                    if item:
+                        await batcher.add(item)
+        except QuotaExceededException as e:
+            await self._fail(batcher, StreamFailed(status_code=429, detail=e.message, retry_after=e.retry_after))
+        except LlmBusyException as e:
+            await self._fail(batcher, StreamFailed(status_code=503, detail=e.message, retry_after=e.retry_after))
+        except asyncio.CancelledError:
+            # drain 기한 초과로 취소됨: 다른 워커에서 이어 받는 클라이언트가 idle timeout 까지 기다리지 않도록 종료 이벤트를 남긴다
+            await self._fail(
+                batcher,
+                StreamFailed(status_code=503, detail="서버가 종료되어 응답이 중단되었습니다.", retry_after=1),
+            )
+            raise
+        except HTTPException as e:
+            await self._fail(batcher, StreamFailed(status_code=e.status_code, detail=str(e.detail)))
+        except Exception:
+            logger.exception("chat stream failed: stream=%s", stream_id)
+            await self._fail(batcher, StreamFailed(status_code=500, detail="응답 생성 중 오류가 발생했습니다."))
+        finally:
+            try:
+                await batcher.close()
+            except Exception:
+                logger.exception("chat stream flush failed: stream=%s", stream_id)
+            account_db.close()
+
+    @staticmethod
+    async def _fail(batcher: _DeltaBatcher, event: StreamFailed) -> None:
+        try:
+            await batcher.event(ERROR, json.dumps(event.to_payload(), ensure_ascii=False))
+        except Exception:
+            logger.exception("chat stream error write failed: stream=%s", batcher.stream_id)
+
+    async def attach(self, stream_id: str, from_offset: int = 0) -> AsyncIterator[str | StreamCompleted | StreamFailed]:
+        """
+        버퍼를 처음부터 읽어 from_offset(글자 수) 이후의 델타를 내보낸다.
+        완료/실패 이벤트를 만나거나 idle_timeout 동안 새 항목이 없으면 끝난다.
+        """
+        loop = asyncio.get_running_loop()
+        last_id = None
+        offset = 0
+        idle_since = loop.time()
+
+        while True:
+            entries = await self.buffer.read(stream_id, last_id, block_ms=1000)
+            if not entries:
+                if loop.time() - idle_since >= self.idle_timeout:
+                    return
+                continue
+            idle_since = loop.time()
+
+            for entry_id, kind, data in entries:
+                last_id = entry_id
+                if kind == DONE:
+                    payload = json.loads(data)
+                    message_id = payload.pop("message_id", None)
+                    usage = payload.pop("usage", {})
+                    yield StreamCompleted(message_id=message_id, usage=usage, extra=payload)
+                    return
+                if kind == ERROR:
+                    yield StreamFailed(**json.loads(data))
+                    return
+
+                start = offset
+                offset += len(data)
+                if offset <= from_offset:
+                    continue
+                yield data[from_offset - start:] if start < from_offset else data
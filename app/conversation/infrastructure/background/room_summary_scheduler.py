@@ -0,0 +1,43 @@
+import asyncio
+import logging
+
+from app.config.database.session import AsyncSessionLocal
+from app.conversation.application.usecase.refresh_room_summary_usecase import RefreshRoomSummaryUseCase
+from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
+from app.conversation.infrastructure.repository.chat_room_summary_repository_impl import ChatRoomSummaryRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+class RoomSummaryScheduler:
+    """
+    방 요약 갱신을 응답 스트림과 분리된 백그라운드 태스크로 실행한다.
+    같은 방에 대한 갱신은 동시에 하나만 돈다.
+    """
+
+    def __init__(self, llm_chat_port, crypto_service):
+        self.llm_chat_port = llm_chat_port
+        self.crypto_service = crypto_service
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+    def schedule(self, room_id: str) -> None:
+        if room_id in self._in_flight:
+            return
+
+        task = asyncio.create_task(self._run(room_id))
+        self._in_flight[room_id] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(room_id, None))
+
+    async def _run(self, room_id: str) -> None:
+        # 요청 세션은 응답이 끝나면 닫히므로 별도 세션을 연다.
+        try:
+            async with AsyncSessionLocal() as db:
+                usecase = RefreshRoomSummaryUseCase(
+                    chat_message_repo=ChatMessageRepositoryImpl(db),
+                    summary_repo=ChatRoomSummaryRepositoryImpl(db),
+                    llm_chat_port=self.llm_chat_port,
+                    crypto_service=self.crypto_service,
+                )
+                await usecase.execute(room_id)
+        except Exception:
+            logger.exception("room summary refresh failed: room=%s", room_id)
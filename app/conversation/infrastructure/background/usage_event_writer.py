@@ -0,0 +1,103 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from app.config.database.session import AsyncSessionLocal
+from app.conversation.infrastructure.orm.usage_event_orm import UsageEventOrm
+
+logger = logging.getLogger(__name__)
+
+
+class UsageEventWriter:
+    """
+    사용량 이벤트를 메모리에 모았다가 batch_size 개 또는 flush_interval 초마다 한 번에 INSERT 한다.
+    응답 경로에서는 add() 만 호출하므로 DB 왕복이 없다.
+    """
+
+    def __init__(self, batch_size: int, flush_interval_seconds: float, max_buffer: int):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_seconds
+        self.max_buffer = max_buffer
+        self._buffer: list[dict] = []
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    def add(self, account_id: int, input_tokens: int, output_tokens: int, room_id: str | None = None) -> None:
+        if len(self._buffer) >= self.max_buffer:
+            logger.warning("usage event buffer full, dropping event: account=%s", account_id)
+            return
+
+        self._buffer.append({
+            "account_id": account_id,
+            "room_id": room_id,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "created_at": datetime.utcnow(),
+        })
+
+        if not self._closing and (self._task is None or self._task.done()):
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        while self._buffer:
+            batch = self._buffer[:self.batch_size]
+            del self._buffer[:self.batch_size]
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(insert(UsageEventOrm), batch)
+                    await db.commit()
+            except Exception:
+                logger.exception("usage event flush failed: %d events", len(batch))
+                # 다음 주기에 다시 시도 (버퍼 상한 안에서만)
+                self._requeue(batch)
+                return
+            except BaseException:
+                # INSERT 도중 취소돼도 배치를 잃지 않도록 되돌려 놓는다
+                self._requeue(batch)
+                raise
+
+    def _requeue(self, batch: list[dict]) -> None:
+        room = max(0, self.max_buffer - len(self._buffer))
+        self._buffer[:0] = batch[:room]
+
+    async def aclose(self) -> None:
+        # 취소하지 않고 진행 중인 flush 가 끝나도록 루프를 멈춘 뒤 기다린다
+        self._closing = True
+        if self._task is not None:
+            self._wakeup.set()
+            try:
+                await self._task
+            except Exception:
+                logger.exception("usage event writer loop failed")
+            self._task = None
+        await self.flush()
+
+
+_writer_instance: UsageEventWriter | None = None
+
+
+def get_usage_event_writer() -> UsageEventWriter:
+    global _writer_instance
+    if _writer_instance is None:
+        from app.config.settings import settings
+        _writer_instance = UsageEventWriter(
+            batch_size=settings.USAGE_EVENT_BATCH_SIZE,
+            flush_interval_seconds=settings.USAGE_EVENT_FLUSH_INTERVAL_SECONDS,
+            max_buffer=settings.USAGE_EVENT_MAX_BUFFER,
+        )
+    return _writer_instance
@@ -0,0 +1,199 @@
+import logging
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+import redis.asyncio as aioredis
+
+from app.common.infrastructure.encryption import AESEncryption as TransportEncryption
+
+logger = logging.getLogger(__name__)
+
+# 방 해시에 쓰고 TTL 을 갱신한 뒤, 메시지 수가 한도를 넘으면 가장 오래된(가장 작은 id) 것부터 지운다.
+# KEYS[1]=방 해시, ARGV = {ttl, max_messages, id1, value1, id2, value2, ...}
+_PUT_SCRIPT = """
+for i = 3, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+local limit = tonumber(ARGV[2])
+local size = redis.call('HLEN', KEYS[1])
+if size > limit then
+    local ids = redis.call('HKEYS', KEYS[1])
+    table.sort(ids, function(a, b) return tonumber(a) < tonumber(b) end)
+    for i = 1, size - limit do
+        redis.call('HDEL', KEYS[1], ids[i])
+    end
+end
+return 1
+"""
+
+
+class _RoomEntry:
+    __slots__ = ("last_message_id", "messages")
+
+    def __init__(self):
+        self.last_message_id = 0
+        self.messages: "OrderedDict[int, str]" = OrderedDict()
+
+
+class DecryptedHistoryCache:
+    """
+    방별 복호화 메시지 캐시.
+    1단계는 프로세스 내 LRU, 2단계(선택)는 방마다 Redis 해시 (값은 랜덤 IV 로 다시 암호화해 평문이 남지 않는다).
+    메시지는 쓰고 나면 바뀌지 않으므로 방 삭제로 무효화될 때까지 뒤에 붙기만 하고,
+    두 단계 모두 방마다 최신 max_messages_per_room 개만 유지한다.
+    """
+
+    KEY_PREFIX = "chat_history:"
+
+    def __init__(
+        self,
+        max_rooms: int,
+        max_messages_per_room: int,
+        redis_client: Optional[aioredis.Redis] = None,
+        redis_ttl_seconds: int = 3600,
+        encryption_key: Optional[bytes] = None,
+    ):
+        # redis_client 와 encryption_key(AES-256) 가 모두 있을 때만 Redis 단계를 쓴다
+        self._rooms: "OrderedDict[str, _RoomEntry]" = OrderedDict()
+        self._max_rooms = max_rooms
+        self._max_messages = max_messages_per_room
+        self._redis = redis_client if (redis_client is not None and encryption_key) else None
+        self._redis_ttl = redis_ttl_seconds
+        self._key = encryption_key
+        self._put_script = self._redis.register_script(_PUT_SCRIPT) if self._redis is not None else None
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _make_key(self, room_id: str) -> str:
+        return f"{self.KEY_PREFIX}{room_id}"
+
+    def _entry(self, room_id: str, create: bool = False) -> Optional[_RoomEntry]:
+        entry = self._rooms.get(room_id)
+        if entry is not None:
+            self._rooms.move_to_end(room_id)
+            return entry
+        if not create:
+            return None
+
+        entry = _RoomEntry()
+        self._rooms[room_id] = entry
+        while len(self._rooms) > self._max_rooms:
+            self._rooms.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def _store_local(self, entry: _RoomEntry, message_id: int, content: str) -> None:
+        entry.messages[message_id] = content
+        if message_id > entry.last_message_id:
+            entry.last_message_id = message_id
+        while len(entry.messages) > self._max_messages:
+            # 가장 오래된(가장 작은 id) 메시지부터 버린다.
+            oldest = min(entry.messages)
+            del entry.messages[oldest]
+
+    def last_message_id(self, room_id: str) -> int:
+        """방에 캐시된 가장 최신 메시지 id (없으면 0)"""
+        entry = self._rooms.get(room_id)
+        return entry.last_message_id if entry else 0
+
+    async def get_many(self, room_id: str, message_ids: Iterable[int]) -> dict[int, str]:
+        """캐시된 본문 조회. 결과에 없는 id 는 호출자가 복호화해야 한다"""
+        message_ids = list(message_ids)
+        found: dict[int, str] = {}
+
+        entry = self._entry(room_id)
+        if entry is not None:
+            for mid in message_ids:
+                content = entry.messages.get(mid)
+                if content is not None:
+                    found[mid] = content
+
+        missing = [mid for mid in message_ids if mid not in found]
+        self.hits += len(found)
+
+        if missing and self._redis is not None:
+            remote = await self._get_remote(room_id, missing)
+            if remote:
+                entry = self._entry(room_id, create=True)
+                for mid, content in remote.items():
+                    self._store_local(entry, mid, content)
+                found.update(remote)
+                self.redis_hits += len(remote)
+
+        self.misses += len(message_ids) - len(found)
+        return found
+
+    async def put_many(self, room_id: str, items: dict[int, str]) -> None:
+        """새로 복호화한 본문 저장"""
+        if not items:
+            return
+        entry = self._entry(room_id, create=True)
+        for mid in sorted(items):
+            self._store_local(entry, mid, items[mid])
+        await self._put_remote(room_id, items)
+
+    async def append(self, room_id: str, message_id: int, content: str) -> None:
+        """새로 저장된 USER/ASSISTANT 메시지를 이어 붙인다"""
+        entry = self._entry(room_id, create=True)
+        if message_id <= entry.last_message_id and message_id in entry.messages:
+            return
+        self._store_local(entry, message_id, content)
+        await self._put_remote(room_id, {message_id: content})
+
+    async def invalidate(self, room_id: str) -> None:
+        """방의 캐시 전체 삭제 (방 삭제 시)"""
+        self._rooms.pop(room_id, None)
+        if self._redis is not None:
+            try:
+                await self._redis.delete(self._make_key(room_id))
+            except Exception:
+                logger.warning("history cache redis invalidate failed: room=%s", room_id)
+
+    def stats(self) -> dict:
+        """캐시 크기 조정용 적중/미스 카운터"""
+        lookups = self.hits + self.misses
+        return {
+            "rooms": len(self._rooms),
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    async def _get_remote(self, room_id: str, message_ids: list[int]) -> dict[int, str]:
+        try:
+            values = await self._redis.hmget(self._make_key(room_id), [str(m) for m in message_ids])
+        except Exception:
+            logger.warning("history cache redis read failed: room=%s", room_id)
+            return {}
+
+        found = {}
+        for mid, raw in zip(message_ids, values):
+            if not raw:
+                continue
+            try:
+                iv_b64, data_b64 = raw.split(":", 1)
+                found[mid] = TransportEncryption.decrypt(data_b64, iv_b64, self._key)
+            except Exception:
+                continue
+        return found
+
+    async def _put_remote(self, room_id: str, items: dict[int, str]) -> None:
+        if self._redis is None:
+            return
+
+        args = [self._redis_ttl, self._max_messages]
+        # 로컬 LRU 와 같은 기준으로, 한도보다 오래된 메시지는 애초에 쓰지 않는다
+        for mid in sorted(items)[-self._max_messages:]:
+            data_b64, iv_b64 = TransportEncryption.encrypt(items[mid], self._key)
+            args.extend((str(mid), f"{iv_b64}:{data_b64}"))
+
+        try:
+            await self._put_script(keys=[self._make_key(room_id)], args=args)
+        except Exception:
+            logger.warning("history cache redis write failed: room=%s", room_id)
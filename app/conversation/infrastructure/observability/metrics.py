@@ -0,0 +1,130 @@
+"""Prometheus 지표 정의.
+
+단계별 지연 시간은 하나의 히스토그램에 (flow, stage) 라벨로 기록한다.
+flow: conversation | simulation | auth | image_upload
+"""
+import asyncio
+import os
+from typing import Callable
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+
+# 1ms ~ 60s
+_LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0,
+)
+
+# 청크 간 간격은 대부분 수~수십 ms 이므로 더 촘촘하게
+_GAP_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.02, 0.035, 0.05, 0.075, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+STAGE_SECONDS = Histogram(
+    "chat_stage_duration_seconds",
+    "채팅 요청 단계별 소요 시간",
+    ["flow", "stage"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+LLM_TIME_TO_FIRST_TOKEN = Histogram(
+    "chat_llm_time_to_first_token_seconds",
+    "LLM 호출부터 첫 청크 수신까지의 시간",
+    ["flow"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+STREAM_CHUNK_GAP = Histogram(
+    "chat_stream_chunk_gap_seconds",
+    "스트리밍 청크 사이 간격",
+    ["flow"],
+    buckets=_GAP_BUCKETS,
+)
+
+STREAM_TOTAL_SECONDS = Histogram(
+    "chat_stream_total_seconds",
+    "스트림 시작부터 마지막 청크까지의 시간",
+    ["flow"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+STREAM_OUTPUT_BYTES = Histogram(
+    "chat_stream_output_bytes",
+    "스트림 한 번에 내보낸 응답 바이트 수",
+    ["flow"],
+    buckets=(256, 1024, 4096, 8192, 16384, 32768, 65536, 131072),
+)
+
+STREAM_OUTPUT_TOKENS = Histogram(
+    "chat_stream_output_tokens",
+    "스트림 한 번의 추정 출력 토큰 수",
+    ["flow"],
+    buckets=(16, 64, 128, 256, 512, 1024, 2048, 4096),
+)
+
+STREAM_ERRORS = Counter(
+    "chat_stream_errors_total",
+    "스트리밍 중 발생한 오류 수",
+    ["flow"],
+)
+
+
+CACHE_STAT = Gauge(
+    "app_cache_stat",
+    "프로세스 내 캐시 통계",
+    ["cache", "stat"],
+    multiprocess_mode="liveall",  # 워커마다 따로 (pid 라벨)
+)
+
+_cache_stats_sources: dict[str, Callable[[], dict]] = {}
+
+
+def register_cache_stats(name: str, stats_fn: Callable[[], dict]) -> None:
+    """stats() 가 숫자 dict 를 반환하는 캐시를 /metrics 에 노출"""
+    _cache_stats_sources[name] = stats_fn
+
+
+def refresh_cache_stats() -> None:
+    """등록된 캐시의 stats() 를 읽어 게이지에 반영"""
+    for name, stats_fn in _cache_stats_sources.items():
+        try:
+            stats = stats_fn()
+        except Exception:
+            continue
+        for key, value in stats.items():
+            if isinstance(value, (int, float)):
+                CACHE_STAT.labels(cache=name, stat=key).set(value)
+
+
+def is_multiprocess() -> bool:
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+async def publish_cache_stats_forever(interval_seconds: float) -> None:
+    """
+    멀티프로세스 모드에서는 /metrics 를 받은 워커만 자기 캐시를 읽을 수 있으므로
+    각 워커가 주기적으로 게이지 파일에 써 둔다.
+    """
+    while True:
+        refresh_cache_stats()
+        await asyncio.sleep(interval_seconds)
+
+
+def render_latest() -> bytes:
+    """
+    /metrics 응답 본문.
+    PROMETHEUS_MULTIPROC_DIR 가 있으면 모든 워커의 지표 파일을 합산한다.
+    """
+    refresh_cache_stats()
+    if not is_multiprocess():
+        return generate_latest()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_process_dead(pid: int) -> None:
+    """워커 종료 시 live* 게이지 파일 정리"""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid)
@@ -1,12 +1,52 @@
 import time
 from contextlib import contextmanager
+from typing import AsyncIterator
+
+from app.conversation.infrastructure.observability.metrics import (
+    LLM_TIME_TO_FIRST_TOKEN,
+    STAGE_SECONDS,
+    STREAM_CHUNK_GAP,
+    STREAM_ERRORS,
+    STREAM_OUTPUT_BYTES,
+    STREAM_OUTPUT_TOKENS,
+    STREAM_TOTAL_SECONDS,
+)
 
 
 @contextmanager
-def trace_span(name: str):
-    start = time.time()
+def trace_span(name: str, flow: str = "conversation"):
+    """블록 실행 시간을 chat_stage_duration_seconds{flow, stage=name} 에 기록"""
+    start = time.perf_counter()
     try:
         yield
     finally:
-        elapsed = (time.time() - start) * 1000
-        print(f"[TRACE] {name} took {elapsed:.2f}ms")
+        STAGE_SECONDS.labels(flow=flow, stage=name).observe(time.perf_counter() - start)
+
+
+async def trace_stream(chunks: AsyncIterator, flow: str = "conversation") -> AsyncIterator:
+    """
+    LLM 스트림을 감싸 첫 청크까지의 시간, 청크 간 간격, 전체 시간을 기록.
+    청크는 그대로 통과시킨다.
+    """
+    start = time.perf_counter()
+    last = None
+    try:
+        async for chunk in chunks:
+            now = time.perf_counter()
+            if last is None:
+                LLM_TIME_TO_FIRST_TOKEN.labels(flow=flow).observe(now - start)
+            else:
+                STREAM_CHUNK_GAP.labels(flow=flow).observe(now - last)
+            last = now
+            yield chunk
+    except Exception:
+        STREAM_ERRORS.labels(flow=flow).inc()
+        raise
+    finally:
+        STREAM_TOTAL_SECONDS.labels(flow=flow).observe(time.perf_counter() - start)
+
+
+def record_stream_size(reply, flow: str = "conversation") -> None:
+    """StreamAccumulator 의 응답 크기(바이트/토큰)를 기록"""
+    STREAM_OUTPUT_BYTES.labels(flow=flow).observe(reply.byte_count)
+    STREAM_OUTPUT_TOKENS.labels(flow=flow).observe(reply.token_count)
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, Integer, DateTime, LargeBinary, ForeignKey
+from datetime import datetime
+from app.config.database.session import Base
+
+
+class ChatRoomSummaryOrm(Base):
+    """
+    윈도우 밖으로 밀려난 오래된 대화의 롤링 요약 (방 당 1행)
+    """
+    __tablename__ = "chat_room_summary"
+
+    room_id = Column(
+        String(36),
+        ForeignKey("chat_room.room_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    summary_enc = Column(LargeBinary, nullable=False)
+    iv = Column(LargeBinary, nullable=False)
+    enc_version = Column(Integer)
+    # 요약에 반영된 마지막 chat_msg.id
+    last_message_id = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, Index
+from datetime import datetime
+from app.config.database.session import Base
+
+
+class UsageEventOrm(Base):
+    """
+    LLM 호출 당 토큰 사용 기록 (append-only, 배치로 적재)
+    """
+    __tablename__ = "usage_event"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    account_id = Column(Integer, nullable=False)
+    room_id = Column(String(36), nullable=True)
+    input_tokens = Column(Integer, nullable=False, default=0)
+    output_tokens = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_usage_event_account_created", "account_id", "created_at"),
+    )
@@ -1,5 +1,5 @@
-from sqlalchemy.orm import Session
-from sqlalchemy.future import select
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.conversation.application.port.out.chat_feedback_repository_port import ChatFeedbackRepository
 from app.conversation.domain.chat_feedback.entity import ChatFeedback
@@ -7,7 +7,7 @@ from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFe
 
 
 class ChatFeedbackRepositoryImpl(ChatFeedbackRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
     async def add_feedback(self, feedback: ChatFeedback) -> str:
@@ -19,11 +19,11 @@ class ChatFeedbackRepositoryImpl(ChatFeedbackRepository):
             comment=feedback.comment
         )
         self.session.add(orm)
-        self.session.commit()
+        await self.session.commit()
         return "SUCCESS"
 
     async def updated_feedback(self, feedback: ChatFeedback) -> str:
-        result = self.session.execute(
+        result = await self.session.execute(
             select(ChatFeedbackOrm).filter_by(message_id=feedback.message_id, account_id=feedback.account_id)
         )
         orm = result.scalars().first()
@@ -31,11 +31,11 @@ class ChatFeedbackRepositoryImpl(ChatFeedbackRepository):
             orm.satisfaction = feedback.satisfaction
             orm.reason = feedback.reason
             orm.comment = feedback.comment
-            self.session.commit()
+            await self.session.commit()
         return "SUCCESS"
 
     async def find_by_message_and_account(self, message_id: int, account_id: int) -> ChatFeedback | None:
-        result = self.session.execute(
+        result = await self.session.execute(
             select(ChatFeedbackOrm).filter_by(message_id=message_id, account_id=account_id)
         )
         orm = result.scalars().first()
@@ -50,4 +50,4 @@ class ChatFeedbackRepositoryImpl(ChatFeedbackRepository):
             reason=orm.reason,
             comment=orm.comment,
             created_at=orm.created_at
-        )
\ No newline at end of file
+        )
@@ -1,12 +1,14 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import case, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from Crypto.Random import get_random_bytes
 
+from app.conversation.application.port.out.chat_message_repository_port import ChatMessageRepositoryPort
 from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
 from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
 
 
-class ChatMessageRepositoryImpl:
-    def __init__(self, session: Session):
+class ChatMessageRepositoryImpl(ChatMessageRepositoryPort):
+    def __init__(self, session: AsyncSession):
         self.db = session
 
     async def save_message(self, **kwargs):
@@ -18,7 +20,9 @@ class ChatMessageRepositoryImpl:
             # 2. parent_id 유효성 검사
             parent_id = kwargs.get('parent_id')
             if parent_id is not None:
-                exists = self.db.query(ChatMessageOrm).filter(ChatMessageOrm.id == parent_id).first()
+                exists = await self.db.scalar(
+                    select(ChatMessageOrm.id).where(ChatMessageOrm.id == parent_id)
+                )
                 if not exists:
                     kwargs['parent_id'] = None
 
@@ -29,32 +33,90 @@ class ChatMessageRepositoryImpl:
             # 4. 객체 생성 및 저장
             msg = ChatMessageOrm(**kwargs)
             self.db.add(msg)
-            self.db.flush()
+            await self.db.flush()
             return msg
 
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise e
 
+    async def commit(self) -> None:
+        await self.db.commit()
+
     async def find_by_room_id(self, room_id: str):
-        return (
-            self.db.query(ChatMessageOrm)
-            .filter(ChatMessageOrm.room_id == room_id)
+        result = await self.db.execute(
+            select(ChatMessageOrm)
+            .where(ChatMessageOrm.room_id == room_id)
             .order_by(ChatMessageOrm.id.asc())
-            .all()
         )
+        return result.scalars().all()
 
-    async def find_by_room_id_with_feedback(self, room_id: str, account_id: int):
-        from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
+    async def find_by_room_id_with_feedback(
+        self,
+        room_id: str,
+        account_id: int,
+        before_id: int | None = None,
+        limit: int | None = None,
+        known_ids: list[int] | None = None,
+    ):
+        # ORM 엔티티 대신 필요한 컬럼만 조회하고, 피드백은 outer join 한 번으로 함께 가져온다.
+        # 클라이언트가 이미 가진 메시지(known_ids)는 content_enc 를 NULL 로 돌려 전송량을 줄인다.
+        content_col = ChatMessageOrm.content_enc
+        if known_ids:
+            content_col = case(
+                (ChatMessageOrm.id.in_(known_ids), null()),
+                else_=ChatMessageOrm.content_enc,
+            )
 
-        return (
-            self.db.query(ChatMessageOrm, ChatFeedbackOrm.satisfaction)
+        stmt = (
+            select(
+                ChatMessageOrm.id,
+                ChatMessageOrm.room_id,
+                ChatMessageOrm.account_id,
+                ChatMessageOrm.role,
+                content_col.label("content_enc"),
+                ChatMessageOrm.iv,
+                ChatMessageOrm.contents_type,
+                ChatMessageOrm.file_urls,
+                ChatMessageOrm.created_at,
+                ChatFeedbackOrm.satisfaction,
+            )
             .outerjoin(
                 ChatFeedbackOrm,
                 (ChatMessageOrm.id == ChatFeedbackOrm.message_id) &
                 (ChatFeedbackOrm.account_id == account_id)
             )
-            .filter(ChatMessageOrm.room_id == room_id)
+            .where(ChatMessageOrm.room_id == room_id)
+        )
+        if before_id is not None:
+            stmt = stmt.where(ChatMessageOrm.id < before_id)
+
+        if limit is None:
+            result = await self.db.execute(stmt.order_by(ChatMessageOrm.id.asc()))
+            return result.all()
+
+        # (room_id, id) 인덱스를 역순으로 타서 최근 limit 개만 읽고 오래된 순으로 뒤집는다.
+        result = await self.db.execute(stmt.order_by(ChatMessageOrm.id.desc()).limit(limit))
+        return list(reversed(result.all()))
+
+    async def find_recent_by_room_id(self, room_id: str, limit: int, before_id: int | None = None):
+        # (room_id, id) 인덱스를 역순으로 타므로 방 크기와 무관하게 limit 만큼만 읽는다.
+        stmt = select(ChatMessageOrm).where(ChatMessageOrm.room_id == room_id)
+        if before_id is not None:
+            stmt = stmt.where(ChatMessageOrm.id < before_id)
+
+        result = await self.db.execute(stmt.order_by(ChatMessageOrm.id.desc()).limit(limit))
+        return list(reversed(result.scalars().all()))
+
+    async def find_between(self, room_id: str, after_id: int, before_id: int, limit: int):
+        result = await self.db.execute(
+            select(ChatMessageOrm)
+            .where(
+                ChatMessageOrm.room_id == room_id,
+                ChatMessageOrm.id > after_id,
+                ChatMessageOrm.id < before_id,
+            )
             .order_by(ChatMessageOrm.id.asc())
-            .all()
-        )
\ No newline at end of file
+            .limit(limit)
+        )
+        return result.scalars().all()
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.conversation.application.port.out.chat_room_summary_repository_port import ChatRoomSummaryRepositoryPort
+from app.conversation.infrastructure.orm.chat_room_summary_orm import ChatRoomSummaryOrm
+
+
+class ChatRoomSummaryRepositoryImpl(ChatRoomSummaryRepositoryPort):
+
+    def __init__(self, session: AsyncSession):
+        self.db: AsyncSession = session
+
+    async def find_by_room_id(self, room_id: str):
+        return await self.db.get(ChatRoomSummaryOrm, room_id)
+
+    async def upsert(self, room_id, summary_enc, iv, enc_version, last_message_id) -> None:
+        try:
+            summary = await self.db.get(ChatRoomSummaryOrm, room_id)
+            if summary is None:
+                summary = ChatRoomSummaryOrm(room_id=room_id)
+                self.db.add(summary)
+
+            summary.summary_enc = summary_enc
+            summary.iv = iv
+            summary.enc_version = enc_version
+            summary.last_message_id = last_message_id
+            summary.updated_at = datetime.utcnow()
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise e
@@ -1,10 +1,96 @@
+import logging
+import time
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.conversation.application.exception.quota_exception import QuotaExceededException
+from app.conversation.application.policy.role_policy import RolePolicy
 from app.conversation.application.port.out.usage_meter_port import UsageMeterPort
+from app.conversation.infrastructure.background.usage_event_writer import UsageEventWriter
+
+logger = logging.getLogger(__name__)
+
+# 버킷 해시(field=버킷 시작 시각, value=토큰 수)로 슬라이딩 윈도우 사용량을 계산한다.
+# 만료된 버킷은 읽는 김에 지운다.
+# return {허용 여부, 사용량, 재시도까지 남은 초}
+_CHECK_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local bucket = tonumber(ARGV[3])
+local limit = tonumber(ARGV[4])
+local oldest = now - window
+local entries = redis.call('HGETALL', KEYS[1])
+local used = 0
+local first = nil
+for i = 1, #entries, 2 do
+    local start = tonumber(entries[i])
+    if start + bucket <= oldest then
+        redis.call('HDEL', KEYS[1], entries[i])
+    else
+        used = used + tonumber(entries[i + 1])
+        if first == nil or start < first then
+            first = start
+        end
+    end
+end
+if used >= limit then
+    local retry = bucket
+    if first ~= nil then
+        retry = first + bucket + window - now
+    end
+    return {0, used, retry}
+end
+return {1, used, 0}
+"""
+
+_RECORD_SCRIPT = """
+redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
 
 
 class UsageMeterImpl(UsageMeterPort):
+    """
+    계정별 토큰 쿼터를 Redis 슬라이딩 윈도우로 관리한다 (체크/기록 모두 EVALSHA 1회).
+    사용량 이벤트는 UsageEventWriter 가 모아서 MySQL 에 배치로 저장한다.
+    Redis 장애 시에는 쿼터 검사를 건너뛴다 (fail-open).
+    """
+
+    KEY_PREFIX = "usage_window:"
 
-    async def check_available(self, account_id: int) -> None:
-        # TODO: Redis / quota 체크
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        event_writer: UsageEventWriter,
+        window_seconds: int,
+        bucket_seconds: int,
+    ):
+        self.event_writer = event_writer
+        self.window = window_seconds
+        self.bucket = bucket_seconds
+        self._check = redis_client.register_script(_CHECK_SCRIPT)
+        self._record = redis_client.register_script(_RECORD_SCRIPT)
+
+    def _key(self, account_id: int) -> str:
+        return f"{self.KEY_PREFIX}{account_id}"
+
+    async def check_available(self, account_id: int, role: str = "FREE") -> None:
+        try:
+            allowed, used, retry_after = await self._check(
+                keys=[self._key(account_id)],
+                args=[int(time.time()), self.window, self.bucket, RolePolicy.window_tokens(role)],
+            )
+        except RedisError:
+            logger.warning("usage quota check skipped: account=%s", account_id, exc_info=True)
+            return None
+
+        if not int(allowed):
+            raise QuotaExceededException(
+                "사용량 한도를 초과했습니다. 잠시 후 다시 시도해 주세요.",
+                retry_after=max(1, int(retry_after)),
+            )
         return None
 
     async def record_usage(
@@ -12,7 +98,17 @@ class UsageMeterImpl(UsageMeterPort):
         account_id: int,
         input_tokens: int,
         output_tokens: int,
+        room_id: str | None = None,
     ) -> None:
         total = input_tokens + output_tokens
-        # TODO: DB 저장 or 차감
+        now = int(time.time())
+        try:
+            await self._record(
+                keys=[self._key(account_id)],
+                args=[now - now % self.bucket, total, self.window + self.bucket],
+            )
+        except RedisError:
+            logger.warning("usage quota record failed: account=%s", account_id, exc_info=True)
+
+        self.event_writer.add(account_id, input_tokens, output_tokens, room_id)
         return None
@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+from app.conversation.application.port.out.stream_buffer_port import StreamBufferPort
+
+
+class _Stream:
+    __slots__ = ("owner", "entries", "expires_at", "changed")
+
+    def __init__(self, owner: int, expires_at: float):
+        self.owner = owner
+        self.entries: list[tuple[str, str]] = []
+        self.expires_at = expires_at
+        self.changed = asyncio.Condition()
+
+
+class InMemoryStreamBuffer(StreamBufferPort):
+    """
+    프로세스 내 버퍼 (개발/테스트용 Redis 대체).
+    워커가 여러 개면 다른 워커에서 재연결할 수 없다.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl = ttl_seconds
+        self._streams: dict[str, _Stream] = {}
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        for stream_id in [sid for sid, s in self._streams.items() if s.expires_at <= now]:
+            del self._streams[stream_id]
+
+    def _get(self, stream_id: str) -> _Stream | None:
+        stream = self._streams.get(stream_id)
+        if stream is None or stream.expires_at <= time.monotonic():
+            return None
+        return stream
+
+    async def create(self, stream_id: str, account_id: int, ttl_seconds: int) -> None:
+        self._purge_expired()
+        self._streams[stream_id] = _Stream(account_id, time.monotonic() + ttl_seconds)
+
+    async def get_owner(self, stream_id: str) -> int | None:
+        stream = self._get(stream_id)
+        return stream.owner if stream else None
+
+    async def append(self, stream_id: str, kind: str, data: str) -> None:
+        stream = self._get(stream_id)
+        if stream is None:
+            return
+        stream.entries.append((kind, data))
+        stream.expires_at = time.monotonic() + self.ttl
+        async with stream.changed:
+            stream.changed.notify_all()
+
+    async def read(self, stream_id: str, after_id: str | None, block_ms: int) -> list[tuple[str, str, str]]:
+        stream = self._get(stream_id)
+        if stream is None:
+            return []
+
+        # entry_id 는 1 부터 시작하는 순번
+        start = int(after_id) if after_id else 0
+        if start >= len(stream.entries) and block_ms > 0:
+            async with stream.changed:
+                try:
+                    await asyncio.wait_for(
+                        stream.changed.wait_for(lambda: len(stream.entries) > start),
+                        timeout=block_ms / 1000,
+                    )
+                except asyncio.TimeoutError:
+                    return []
+
+        return [
+            (str(i), kind, data)
+            for i, (kind, data) in enumerate(stream.entries[start:], start=start + 1)
+        ]
@@ -0,0 +1,54 @@
+import redis.asyncio as aioredis
+
+from app.conversation.application.port.out.stream_buffer_port import StreamBufferPort
+
+
+class RedisStreamBuffer(StreamBufferPort):
+    """
+    Redis Stream 기반 버퍼 (워커 간 공유).
+    XADD 로 쓰고, XREAD BLOCK 으로 새 항목을 기다린다.
+    XREAD BLOCK 은 대기하는 동안 커넥션을 붙잡으므로 read_client 에는 공용 풀과 분리된 풀을 쓴다
+    (붙어 있는 클라이언트가 많아도 인증/레이트 리밋/쿼터가 쓰는 공용 풀이 고갈되지 않도록).
+    """
+
+    KEY_PREFIX = "chat_stream:"
+    OWNER_PREFIX = "chat_stream_owner:"
+
+    def __init__(self, redis_client: aioredis.Redis, ttl_seconds: int, read_client: aioredis.Redis | None = None):
+        self.redis = redis_client
+        self.read_redis = read_client or redis_client
+        self.ttl = ttl_seconds
+
+    def _key(self, stream_id: str) -> str:
+        return f"{self.KEY_PREFIX}{stream_id}"
+
+    def _owner_key(self, stream_id: str) -> str:
+        return f"{self.OWNER_PREFIX}{stream_id}"
+
+    async def create(self, stream_id: str, account_id: int, ttl_seconds: int) -> None:
+        await self.redis.set(self._owner_key(stream_id), str(account_id), ex=ttl_seconds)
+
+    async def get_owner(self, stream_id: str) -> int | None:
+        owner = await self.redis.get(self._owner_key(stream_id))
+        return int(owner) if owner is not None else None
+
+    async def append(self, stream_id: str, kind: str, data: str) -> None:
+        key = self._key(stream_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.xadd(key, {"kind": kind, "data": data})
+            pipe.expire(key, self.ttl)
+            # 소유자 키도 함께 연장해야 재연결 가능 시간이 생성 시간만큼 줄지 않는다
+            pipe.expire(self._owner_key(stream_id), self.ttl)
+            await pipe.execute()
+
+    async def read(self, stream_id: str, after_id: str | None, block_ms: int) -> list[tuple[str, str, str]]:
+        response = await self.read_redis.xread(
+            {self._key(stream_id): after_id or "0-0"},
+            count=256,
+            block=block_ms,
+        )
+        if not response:
+            return []
+
+        _, entries = response[0]
+        return [(entry_id, fields["kind"], fields.get("data", "")) for entry_id, fields in entries]
@@ -1,9 +1,14 @@
 """FastAPI application entry point."""
 
+import asyncio
+import os
 from contextlib import asynccontextmanager
 
+# 기동 시간 측정 기준점이 되도록 가장 먼저 import
+from app.config.startup import StartupTimer, register_warmup, run_warmups
+
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.conversation.adapter.input.web.conversation_router import conversation_router
@@ -19,25 +24,122 @@ from app.inquiry.adapter.input.web.inquiry_router import router as inquiry_route
 from app.faq.adapter.input.web.faq_router import router as faq_router
 from app.survey.adapter.input.web.survey_router import router as survey_router
 
-from app.account.infrastructure.orm.account_model import AccountModel  # noqa: F401
-from app.inquiry.infrastructure.orm.inquiry_model import InquiryModel  # noqa: F401
-from app.inquiry.infrastructure.orm.inquiry_reply_model import InquiryReplyModel  # noqa: F401
-from app.faq.infrastructure.orm.faq_model import FAQModel  # noqa: F401
-from app.config.database.session import Base, engine
 from app.config.settings import settings
 
+startup_timer = StartupTimer(settings.STARTUP_BUDGET_SECONDS)
+startup_timer.mark_imports_done()
+
+
+# =============================
+# 워커별 warm-up 훅 (첫 요청이 지연 로딩 비용을 떠안지 않도록)
+# =============================
+def _warm_llm_gateway():
+    from app.config.llm import get_llm_gateway
+    get_llm_gateway()
+
+
+def _warm_tokenizer():
+    from app.conversation.application.policy.usage_policy import UsagePolicy
+    UsagePolicy.calculate_token("warm-up")
+
+
+def _warm_prompts():
+    # prompts.yaml 의 모든 상담/페르소나 조합을 미리 컴파일
+    from app.config.prompt_loader import get_prompt_templates
+    get_prompt_templates()
+
+
+async def _warm_redis():
+    from app.config.redis_config import get_async_redis
+    await get_async_redis().ping()
+
+
+register_warmup("llm_gateway", _warm_llm_gateway)
+register_warmup("tokenizer", _warm_tokenizer)
+register_warmup("prompts", _warm_prompts)
+register_warmup("redis", _warm_redis)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler.
 
-    Startup: Initialize database tables.
-    Shutdown: Cleanup resources if needed.
+    Startup: Build shared services, start background tasks and run warm-up hooks (timed per phase).
+    Shutdown: Drain in-flight chat streams, then release resources.
+
+    Schema is managed by Alembic (`alembic upgrade head`), not by the serving process.
     """
     # Startup
-    Base.metadata.create_all(bind=engine)
+    if settings.DB_CREATE_ALL_ON_STARTUP:
+        # 로컬 개발 전용
+        with startup_timer.phase("create_all"):
+            from app.config.database.session import Base, engine
+            Base.metadata.create_all(bind=engine)
+
+    # 요청마다 만들던 무상태 서비스를 한 번만 생성
+    with startup_timer.phase("container"):
+        from app.config.container import build_container
+        app.state.container = build_container()
+
+    # 블랙리스트 로컬 미러 (pub/sub 구독 + 초기 로드) 및 JWT 캐시 지표
+    from app.auth.infrastructure.cache.blacklist_mirror import get_blacklist_mirror
+    with startup_timer.phase("auth_cache"):
+        from app.auth.infrastructure.cache.validated_token_cache import get_validated_token_cache
+        from app.config.redis_config import get_async_redis
+        from app.conversation.infrastructure.observability.metrics import register_cache_stats
+        register_cache_stats("jwt_payload", get_validated_token_cache().stats)
+        if settings.BLACKLIST_MIRROR_ENABLED:
+            get_blacklist_mirror().start(get_async_redis())
+
+    if settings.STARTUP_WARMUP_ENABLED:
+        await run_warmups(startup_timer)
+
+    # 종료 신호를 받는 즉시 새 LLM 스트림 거절 (uvicorn 이 열린 연결을 기다리는 동안에도)
+    from app.config.rate_limit import get_admission_controller
+    from app.server import install_drain_signal_handler
+    install_drain_signal_handler(get_admission_controller().start_draining)
+
+    # 멀티프로세스 지표: 워커별 캐시 통계를 주기적으로 기록
+    from app.conversation.infrastructure.observability import metrics as app_metrics
+    cache_stats_task = None
+    if app_metrics.is_multiprocess():
+        cache_stats_task = asyncio.create_task(
+            app_metrics.publish_cache_stats_forever(settings.METRICS_CACHE_STATS_INTERVAL_SECONDS)
+        )
+
+    startup_timer.finish()
+
     yield
-    # Shutdown (cleanup if needed)
+
+    # Shutdown: 신호 없이 끝나는 경우도 거절로 전환하고, 진행 중인 채팅 생성/저장은 기한까지 마무리
+    get_admission_controller().start_draining()
+    await app.state.container.stream_runner.drain(settings.SERVER_DRAIN_TIMEOUT_SECONDS)
+
+    if cache_stats_task is not None:
+        cache_stats_task.cancel()
+
+    await get_blacklist_mirror().stop()
+    # Shutdown: 이미지 처리 워커 프로세스 정리
+    from app.config.image import pipeline as image_pipeline
+    if image_pipeline._pipeline_instance is not None:
+        image_pipeline._pipeline_instance.shutdown()
+
+    # LLM 게이트웨이 커넥션 풀 정리
+    import app.config.llm as llm
+    if llm._gateway_instance is not None:
+        await llm._gateway_instance.aclose()
+
+    # 아직 저장되지 않은 사용량 이벤트 flush
+    from app.conversation.infrastructure.background import usage_event_writer
+    if usage_event_writer._writer_instance is not None:
+        await usage_event_writer._writer_instance.aclose()
+
+    # 비동기 Redis 커넥션 풀 정리 (마지막에)
+    from app.config.redis_config import close_async_redis
+    await close_async_redis()
+
+    # 이 워커의 live 게이지가 합계에 남지 않도록
+    app_metrics.mark_process_dead(os.getpid())
 
 
 app = FastAPI(
@@ -72,11 +174,16 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint."""
+    from prometheus_client import CONTENT_TYPE_LATEST
+    from app.conversation.infrastructure.observability.metrics import render_latest
+    return Response(content=render_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 if __name__ == "__main__":
-    import uvicorn
+    # 운영과 같은 런처 사용 (워커 수는 WEB_CONCURRENCY)
+    from app.server import main
 
-    uvicorn.run(
-        app,
-        host=settings.APP_HOST,
-        port=settings.APP_PORT,
-    )
+    main()
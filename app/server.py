@@ -0,0 +1,86 @@
+"""Production server entry point (python -m app.server)."""
+
+import importlib.util
+import logging
+import os
+import shutil
+import signal
+import threading
+from typing import Callable
+
+import uvicorn
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.config.settings import settings  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+def _pick(module: str, preferred: str, fallback: str) -> str:
+    """선택 의존성(uvloop, httptools)이 설치돼 있으면 사용"""
+    return preferred if importlib.util.find_spec(module) is not None else fallback
+
+
+def install_drain_signal_handler(on_signal: Callable[[], None]) -> None:
+    """
+    SIGTERM/SIGINT 를 받는 즉시 on_signal 을 호출한 뒤 uvicorn 의 원래 핸들러(Server.handle_exit)로 넘긴다.
+    uvicorn 이 신호 핸들러를 설치한 뒤인 lifespan 시작 단계에서 호출한다.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return  # TestClient 등 메인 스레드 밖에서 lifespan 이 돌면 신호를 받을 수 없음
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        previous = signal.getsignal(sig)
+        if not callable(previous):
+            continue
+
+        def handler(signum, frame, previous=previous):
+            on_signal()
+            previous(signum, frame)
+
+        signal.signal(sig, handler)
+
+
+def _prepare_multiproc_dir(path: str) -> None:
+    # 이전 실행의 워커 지표 파일이 남아 있으면 값이 섞이므로 비우고 시작
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+
+
+def main() -> None:
+    """
+    WEB_CONCURRENCY 개의 워커 프로세스로 app.main:app 을 띄운다.
+
+    종료 신호(SIGTERM/SIGINT)를 받으면 각 워커는
+    1. 즉시 새 LLM 스트림을 거절(503)하고
+    2. 새 연결을 받지 않고 열린 연결(붙어 있는 스트림 포함)을 SERVER_GRACEFUL_TIMEOUT_SECONDS 까지 기다린 뒤
+    3. lifespan 종료에서 남은 백그라운드 채팅 생성/저장을 SERVER_DRAIN_TIMEOUT_SECONDS 까지 마무리한다.
+
+    워커가 여러 개면 Prometheus 지표를 PROMETHEUS_MULTIPROC_DIR 에 기록해 /metrics 가 전체 워커를 합산한다.
+    """
+    workers = max(1, settings.WEB_CONCURRENCY)
+    if workers > 1 and settings.PROMETHEUS_MULTIPROC_DIR:
+        # 워커가 prometheus_client 를 import 하기 전에 설정돼야 한다 (spawn 된 워커는 환경 변수를 물려받음)
+        _prepare_multiproc_dir(settings.PROMETHEUS_MULTIPROC_DIR)
+
+    loop = _pick("uvloop", "uvloop", "asyncio")
+    http = _pick("httptools", "httptools", "h11")
+    logger.info("starting %d worker(s) loop=%s http=%s", workers, loop, http)
+
+    uvicorn.run(
+        "app.main:app",  # 멀티 워커는 import 문자열이 필요 (워커마다 앱/warm-up 을 새로 구성)
+        host=settings.APP_HOST,
+        port=settings.APP_PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        lifespan="on",
+        timeout_graceful_shutdown=int(settings.SERVER_GRACEFUL_TIMEOUT_SECONDS),
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,76 +1,117 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from starlette.responses import StreamingResponse
+from typing import Optional
 
-from app.config.database.session import get_db_session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.container import AppContainer, get_container
+from app.config.database.session import get_async_db_session
 from app.account.adapter.input.web.account_router import get_current_account_id
 from app.simulation.application.usecase.simulation_usecase import SimulationService
 from app.simulation.infrastructure.repository.simulation_repository_impl import SimulationRepositoryImpl
 from app.conversation.adapter.output.stream.stream_adapter import StreamAdapter
+from app.conversation.adapter.input.web.rate_limit_dependency import LlmCaller, admit_llm_stream, enforce_llm_quota
+from app.config.rate_limit import get_admission_controller
 from app.simulation.adapter.input.web.request.start_simulation_request import StartSimulationRequest, SendMessageRequest
 
 simulation_router = APIRouter(tags=["simulation"])
 
+
+def _simulation_service(db: AsyncSession, container: AppContainer) -> SimulationService:
+    # 모든 경로가 컨테이너의 공유 서비스(암호화, 사용량, LLM 포트)로 만든다
+    repo = SimulationRepositoryImpl(db, container.crypto)
+    return SimulationService(repo, container.crypto, container.usage_meter, container.llm_chat_port)
+
+
 @simulation_router.post("/start")
 async def start_simulation(
         req: StartSimulationRequest,
-        account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        request: Request,
+        caller: LlmCaller = Depends(enforce_llm_quota),
+        db: AsyncSession = Depends(get_async_db_session),
+        container: AppContainer = Depends(get_container),
 ):
-    repo = SimulationRepositoryImpl(db)
-    service = SimulationService(repo)
+    service = _simulation_service(db, container)
 
+    await admit_llm_stream()
+    admission = get_admission_controller()
     try:
         generator, chat_id = await service.start_new_session_stream(
-            account_id=account_id,
+            account_id=caller.account_id,
             mbti=req.mbti,
             gender=req.gender,
             topic=req.topic
         )
-        return StreamingResponse(
-            generator,
-            media_type="text/event-stream",
-            headers={
-                "X-Chat-Id": str(chat_id),
-                "Access-Control-Expose-Headers": "X-Chat-Id"
-            }
-        )
     except Exception as e:
+        admission.leave()
         raise HTTPException(status_code=500, detail=f"시뮬레이션 시작 실패: {str(e)}")
+    # 허가는 응답 스트림이 끝나거나 버려질 때 반납
+    return await StreamAdapter.to_checked_response(
+        admission.guard(generator),
+        request=request,
+        headers={
+            "X-Chat-Id": str(chat_id),
+            "Access-Control-Expose-Headers": "X-Chat-Id"
+        }
+    )
 @simulation_router.post("/{chat_id}/stream")
 async def send_simulation_stream(
         chat_id: str,
         req: SendMessageRequest,
-        account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        request: Request,
+        caller: LlmCaller = Depends(enforce_llm_quota),
+        db: AsyncSession = Depends(get_async_db_session),
+        container: AppContainer = Depends(get_container),
 ):
     """
     사용자 메시지를 보내고 AI 답변을 스트리밍으로 받습니다.
     """
-    repo = SimulationRepositoryImpl(db)
-    service = SimulationService(repo)
+    service = _simulation_service(db, container)
 
+    await admit_llm_stream()
+    admission = get_admission_controller()
     try:
         generator = await service.send_user_message_stream(
             chat_id=chat_id,
-            account_id=account_id,
+            account_id=caller.account_id,
             content=req.content
         )
-        return StreamAdapter.to_streaming_response(generator)
     except PermissionError:
+        admission.leave()
         raise HTTPException(status_code=403, detail="해당 대화방에 대한 권한이 없습니다.")
     except Exception as e:
+        admission.leave()
         raise HTTPException(status_code=500, detail=f"스트리밍 오류: {str(e)}")
+    return await StreamAdapter.to_checked_response(admission.guard(generator), request=request)
+
+
+@simulation_router.get("/chats")
+async def get_simulation_page(
+        limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
+        account_id: int = Depends(get_current_account_id),
+        db: AsyncSession = Depends(get_async_db_session),
+        container: AppContainer = Depends(get_container),
+):
+    """
+    시뮬레이션 목록 (최신순, created_at 커서 페이지네이션).
+    응답의 next_cursor 를 다음 요청의 cursor 로 넘긴다.
+    """
+    service = _simulation_service(db, container)
+
+    try:
+        return await service.get_user_chat_page(account_id, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 cursor 입니다.")
 
 
 @simulation_router.get("/{chat_id}")
 async def get_simulation_detail(
         chat_id: str,
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        db: AsyncSession = Depends(get_async_db_session),
+        container: AppContainer = Depends(get_container),
 ):
-    repo = SimulationRepositoryImpl(db)
-    service = SimulationService(repo)
+    service = _simulation_service(db, container)
 
     # 1. "list" 문자열이 들어오면 목록 반환 로직으로 분기
     if chat_id == "list":
@@ -89,11 +130,11 @@ async def get_simulation_detail(
 async def delete_simulation(
         chat_id: str,
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        db: AsyncSession = Depends(get_async_db_session),
+        container: AppContainer = Depends(get_container),
 ):
 
-    repo = SimulationRepositoryImpl(db)
-    service = SimulationService(repo)
+    service = _simulation_service(db, container)
 
     try:
         success = await service.delete_session(chat_id, account_id)
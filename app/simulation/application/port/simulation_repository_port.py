@@ -1,19 +1,33 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List
 
-from app.simulation.domain.entity.simulation_chat import SimulationChat
+from app.simulation.domain.entity.simulation_chat import SimulationChat, SimulationChatSummary
 
 class SimulationRepositoryPort(ABC):
     @abstractmethod
     async def save(self, chat: SimulationChat, is_new: bool = False) -> None:
+        """chat.unsaved_messages() 만 추가 저장한다 (기존 메시지는 다시 쓰지 않음)"""
         pass
 
     @abstractmethod
-    async def find_by_id(self, chat_id: str) -> Optional[SimulationChat]:
+    async def find_by_id(self, chat_id: str, include_messages: bool = True) -> Optional[SimulationChat]:
+        """include_messages=False 면 메시지 없이 메타데이터와 message_count 만 채운다"""
         pass
 
     @abstractmethod
-    async def find_all_by_account_id(self, account_id: int) -> List[SimulationChat]:
+    async def find_messages_before(self, chat_id: str, before_seq: int, limit: int) -> List[dict]:
+        """seq < before_seq 인 메시지를 최신순(seq 내림차순)으로 최대 limit 개 (암호화 상태)"""
+        pass
+
+    @abstractmethod
+    async def find_all_by_account_id(
+        self,
+        account_id: int,
+        limit: Optional[int] = None,
+        before: Optional[tuple[datetime, str]] = None,
+    ) -> List[SimulationChatSummary]:
+        """최신순 요약 목록. before=(created_at, id) 커서보다 오래된 것만, 최대 limit 개"""
         pass
 
     @abstractmethod
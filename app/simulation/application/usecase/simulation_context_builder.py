@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List
+
+from app.config.prompt_loader import get_prompt_templates
+from app.config.settings import settings
+from app.conversation.application.policy.usage_policy import UsagePolicy
+from app.simulation.application.port.simulation_repository_port import SimulationRepositoryPort
+from app.simulation.domain.entity.simulation_chat import SimulationChat
+
+
+@lru_cache(maxsize=1024)
+def _prompt_tokens(text: str) -> int:
+    # 컴파일된 페르소나는 스냅샷이 바뀌기 전까지 같은 문자열이라 토큰 계산을 재사용한다
+    return UsagePolicy.calculate_token(text)
+
+
+def _chat_message(message: Dict) -> Dict:
+    role = message.get("role")
+    return {"role": role if role in ("user", "assistant") else "user", "content": message.get("content", "")}
+
+
+@dataclass(frozen=True)
+class SimulationContext:
+    """LLM 에 보낼 역할 분리 메시지, 업스트림 프롬프트 캐시 키 (페르소나 prefix_hash), 로컬 입력 토큰 추정치"""
+    messages: List[Dict]
+    cache_key: str
+    prompt_tokens: int
+
+
+class SimulationContextBuilder:
+    """
+    시뮬레이션 프롬프트 조립.
+    대화 기록은 최신 메시지부터 배치 단위로 읽어 필요한 만큼만 복호화하고,
+    시스템 프롬프트를 뺀 토큰 예산이 찰 때까지 턴을 채운다.
+    """
+
+    def __init__(
+            self,
+            repository: SimulationRepositoryPort,
+            decrypt: Callable[[List[Dict]], List[Dict]],
+            token_budget: int = settings.SIMULATION_PROMPT_TOKEN_BUDGET,
+            fetch_batch: int = settings.SIMULATION_HISTORY_FETCH_BATCH,
+    ):
+        self.repository = repository
+        self.decrypt = decrypt
+        self.token_budget = token_budget
+        self.fetch_batch = fetch_batch
+
+    @staticmethod
+    def system_messages(mbti: str, gender: str, topic: str) -> tuple[List[Dict], int, str]:
+        """
+        (system 메시지들, 토큰 수, cache_key).
+        미리 컴파일된 페르소나를 첫 system 메시지로 두고, 사용자 입력인 상황은 별도 메시지로 분리해
+        같은 페르소나끼리 첫 메시지가 바이트 단위로 같도록 한다.
+        """
+        templates = get_prompt_templates()
+        persona = templates.persona(mbti, gender)
+        situation = templates.situation(topic).strip()
+        messages = [
+            {"role": "system", "content": persona.text},
+            {"role": "system", "content": situation},
+        ]
+        tokens = _prompt_tokens(persona.text) + UsagePolicy.calculate_token(situation)
+        return messages, tokens, persona.prefix_hash
+
+    def build_opening(self, mbti: str, gender: str, topic: str) -> SimulationContext:
+        messages, system_tokens, cache_key = self.system_messages(mbti, gender, topic)
+        opening = get_prompt_templates().opening
+        messages.append({"role": "user", "content": opening})
+        return SimulationContext(
+            messages=messages,
+            cache_key=cache_key,
+            prompt_tokens=system_tokens + _prompt_tokens(opening),
+        )
+
+    async def build_reply(self, chat: SimulationChat) -> SimulationContext:
+        """
+        chat.unsaved_messages() (이번 턴의 평문 메시지) 는 항상 포함하고,
+        저장된 기록은 남은 예산 안에서 최신순으로 채운다.
+        """
+        messages, system_tokens, cache_key = self.system_messages(chat.mbti, chat.gender, chat.topic)
+
+        pending = [_chat_message(m) for m in chat.unsaved_messages()]
+        used = system_tokens + sum(UsagePolicy.calculate_token(m["content"]) for m in pending)
+        remaining = self.token_budget - used
+
+        history: List[Dict] = []  # 최신순
+        before_seq = chat.message_count
+        while remaining > 0 and before_seq > 0:
+            batch = await self.repository.find_messages_before(chat.id, before_seq, self.fetch_batch)
+            if not batch:
+                break
+            before_seq -= len(batch)
+
+            for message in batch:
+                # 예산을 넘는 순간 멈추므로 그 이전 메시지는 복호화하지 않는다
+                decrypted = _chat_message(self.decrypt([message])[0])
+                tokens = UsagePolicy.calculate_token(decrypted["content"])
+                if tokens > remaining:
+                    remaining = 0
+                    break
+                history.append(decrypted)
+                remaining -= tokens
+                used += tokens
+
+        history.reverse()
+        messages.extend(history)
+        messages.extend(pending)
+        return SimulationContext(
+            messages=messages,
+            cache_key=cache_key,
+            prompt_tokens=used,
+        )
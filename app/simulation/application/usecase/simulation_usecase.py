@@ -1,52 +1,55 @@
 import base64
-from typing import List, Dict
+from datetime import datetime
+from typing import List, Dict, Optional
 from app.config.call_gpt import CallGPT
 from app.simulation.application.port.simulation_repository_port import SimulationRepositoryPort
-from app.simulation.domain.entity.simulation_chat import SimulationChat
+from app.simulation.application.usecase.simulation_context_builder import SimulationContext, SimulationContextBuilder
+from app.simulation.domain.entity.simulation_chat import SimulationChat, SimulationChatSummary, preview_text
 from app.config.security.message_crypto import AESEncryption
+from app.conversation.application.port.out.llm_chat_port import LlmChatPort
+from app.conversation.application.port.out.usage_meter_port import UsageMeterPort
+from app.conversation.application.policy.usage_policy import UsagePolicy
+from app.common.domain.stream_accumulator import StreamAccumulator
+from app.conversation.application.exception.llm_exception import LlmBusyException
+from app.conversation.domain.conversation.stream_event import StreamCompleted, StreamFailed
+from app.conversation.infrastructure.observability.tracing import record_stream_size, trace_span, trace_stream
+
+
+def _usage(context: SimulationContext, reply: StreamAccumulator, upstream_usage: list) -> Dict:
+    # 업스트림이 사용량을 보고하면 그 값(캐시 적중 토큰 포함)을 우선, 없으면 로컬 추정치
+    if not upstream_usage:
+        return {
+            "input_tokens": context.prompt_tokens,
+            "cached_input_tokens": 0,
+            "output_tokens": reply.token_count,
+        }
+    usage = upstream_usage[-1]
+    return {
+        "input_tokens": usage.prompt_tokens,
+        "cached_input_tokens": usage.cached_tokens,
+        "output_tokens": usage.completion_tokens or reply.token_count,
+    }
+
+
+def _busy(e: LlmBusyException) -> StreamFailed:
+    # 첫 청크 전에만 발생 (슬롯 대기 시간 초과): 저장하지 않고 503 + Retry-After
+    return StreamFailed(status_code=503, detail=e.message, retry_after=e.retry_after)
 
 
 class SimulationService:
-    def __init__(self, repository: SimulationRepositoryPort):
+    def __init__(
+            self,
+            repository: SimulationRepositoryPort,
+            crypto: AESEncryption | None = None,
+            usage_meter: UsageMeterPort | None = None,
+            llm_chat_port: LlmChatPort | None = None,
+    ):
         self.repository = repository
-        self.crypto = AESEncryption()
-
-    def _build_system_prompt(self, mbti: str, gender: str, topic: str) -> str:
-        mbti = mbti.upper()
-        traits = []
-        if "E" in mbti:
-            traits.append("- 반응을 크게 하고 이모티콘이나 느낌표(!)를 자주 사용하며 활발하게 대화하세요.")
-        else:
-            traits.append("- 차분하고 신중하게 대화하며, 말수가 아주 많지는 않지만 깊이 있게 반응하세요.")
-
-        if "S" in mbti:
-            traits.append("- 구체적인 사실, 현실적인 상황, 오감으로 느껴지는 것에 집중해서 말하세요.")
-        else:
-            traits.append("- 비유나 상상, '만약에~' 같은 가정적인 상황에 흥미를 보이며 창의적으로 대화하세요.")
-
-        if "T" in mbti:
-            traits.append("- 공감보다는 상황에 대한 분석이나 해결책, 논리적인 판단을 우선해서 말하세요.")
-        else:
-            traits.append("- 상대방의 감정에 깊이 공감하고 '헐', '진짜?', '힘들었겠다' 같은 리액션을 꼭 포함하세요.")
-
-        if "J" in mbti:
-            traits.append("- 계획적이고 깔끔하게 정리된 결론을 선호하며, 대화의 흐름을 주도하려 하세요.")
-        else:
-            traits.append("- 유연하고 즉흥적이며, 상대방의 말에 따라 대화 주제가 바뀌는 것을 즐기세요.")
-
-        style_guide = "\n".join(traits)
-        return (
-            f"### [SYSTEM INSTRUCTION: 가상 대화 샌드박스] ###\n"
-            f"당신은 AI임을 완전히 잊고 다음의 페르소나로 완벽히 변신합니다.\n"
-            f"- 성별: {gender}\n"
-            f"- MBTI 유형: {mbti}\n"
-            f"- 현재 상황: {topic}\n\n"
-            f"### [말투 및 행동 지침] ###\n"
-            f"{style_guide}\n"
-            f"- 실제 카톡처럼 짧은 문장(10~40자) 위주로 대답하세요.\n"
-            f"---------------------------------\n"
-            f"지금부터 {mbti} {gender}로서 대화를 시작합니다."
-        )
+        self.crypto = crypto or AESEncryption()
+        # LLM 을 호출하는 경로는 사용량을 계정 쿼터에 기록한다 (쿼터 검사는 라우터 의존성에서)
+        self.usage_meter = usage_meter
+        self.context_builder = SimulationContextBuilder(repository, self._decrypt_messages)
+        self.llm = llm_chat_port or CallGPT()
 
     def _decrypt_messages(self, messages: List[Dict]) -> List[Dict]:
         decrypted_list = []
@@ -79,57 +82,134 @@ class SimulationService:
     async def start_new_session_stream(self, account_id: int, mbti: str, gender: str, topic: str):
         chat = SimulationChat(account_id=account_id, mbti=mbti, gender=gender, topic=topic)
 
-        await self.repository.save(chat, is_new=True)
+        with trace_span("persist", flow="simulation"):
+            await self.repository.save(chat, is_new=True)
 
-        prompt = self._build_system_prompt(mbti, gender, topic) + "\n상황에 맞는 첫 인사를 해주세요."
+        with trace_span("prompt_build", flow="simulation"):
+            context = self.context_builder.build_opening(mbti, gender, topic)
 
         async def generator():
-            full_text = ""
-            async for chunk in CallGPT.call_gpt(prompt):
-                if chunk:
-                    full_text += chunk
-                    yield chunk
-
-            chat.add_message("assistant", full_text)
-            await self.repository.save(chat, is_new=False)
+            reply = StreamAccumulator(UsagePolicy.calculate_token)
+            upstream_usage = []
+            try:
+                async for chunk in trace_stream(
+                    self.llm.stream_chat(
+                        context.messages, cache_key=context.cache_key, on_usage=upstream_usage.append
+                    ),
+                    flow="simulation",
+                ):
+                    if chunk:
+                        yield reply.append(chunk)
+            except LlmBusyException as e:
+                yield _busy(e)
+                return
+            record_stream_size(reply, flow="simulation")
+
+            usage = _usage(context, reply, upstream_usage)
+            with trace_span("persist", flow="simulation"):
+                chat.add_message("assistant", reply.text)
+                await self.repository.save(chat, is_new=False)
+                await self._record_usage(chat.account_id, usage)
+
+            yield StreamCompleted(
+                usage=usage,
+                extra={"chat_id": chat.id},
+            )
 
         return generator(), chat.id
 
     async def send_user_message_stream(self, chat_id: str, account_id: int, content: str):
-        chat = await self.repository.find_by_id(chat_id)
+        # 메시지는 읽지 않고 메타데이터만 (기록은 context_builder 가 필요한 만큼 읽는다)
+        with trace_span("history_load", flow="simulation"):
+            chat = await self.repository.find_by_id(chat_id, include_messages=False)
         if not chat or not chat.is_owned_by(account_id):
             raise PermissionError("접근 권한이 없습니다.")
 
-        # 히스토리 복호화 (GPT 맥락 전달용)
-        chat.messages = self._decrypt_messages(chat.messages)
         chat.add_message("user", content)
 
-        system_prompt = self._build_system_prompt(chat.mbti, chat.gender, chat.topic)
-        # 최근 6개의 대화만 컨텍스트로 유지
-        history_context = "\n".join([f"{m['role']}: {m['content']}" for m in chat.messages[-6:]])
-        final_prompt = f"{system_prompt}\n\n[대화 기록]\n{history_context}\nassistant: "
+        # 최신 기록부터 토큰 예산만큼 복호화해서 채움
+        with trace_span("prompt_build", flow="simulation"):
+            context = await self.context_builder.build_reply(chat)
 
         async def generator():
-            full_response = ""
-            async for chunk in CallGPT.call_gpt(final_prompt):
-                full_response += chunk
-                yield chunk
-            chat.add_message("assistant", full_response)
-            await self.repository.save(chat, is_new=False)
+            reply = StreamAccumulator(UsagePolicy.calculate_token)
+            upstream_usage = []
+            try:
+                async for chunk in trace_stream(
+                    self.llm.stream_chat(
+                        context.messages, cache_key=context.cache_key, on_usage=upstream_usage.append
+                    ),
+                    flow="simulation",
+                ):
+                    yield reply.append(chunk)
+            except LlmBusyException as e:
+                yield _busy(e)
+                return
+            record_stream_size(reply, flow="simulation")
+            usage = _usage(context, reply, upstream_usage)
+            with trace_span("persist", flow="simulation"):
+                chat.add_message("assistant", reply.text)
+                await self.repository.save(chat, is_new=False)
+                await self._record_usage(chat.account_id, usage)
+
+            yield StreamCompleted(
+                usage=usage,
+                extra={"chat_id": chat.id},
+            )
 
         return generator()
 
+    async def _record_usage(self, account_id: int, usage: Dict) -> None:
+        if self.usage_meter is not None:
+            await self.usage_meter.record_usage(account_id, usage["input_tokens"], usage["output_tokens"])
+
+    def _to_list_item(self, chat: SimulationChatSummary) -> Dict:
+        # 미리보기 1건만 복호화
+        decrypted = self._decrypt_messages([chat.last_message]) if chat.last_message else []
+        last_msg = decrypted[0].get("content", "") if decrypted else ""
+        return {
+            "id": chat.id, "mbti": chat.mbti, "gender": chat.gender, "topic": chat.topic,
+            "last_message": preview_text(last_msg)
+        }
+
+    @staticmethod
+    def _encode_cursor(chat: SimulationChatSummary) -> str:
+        raw = f"{chat.created_at.isoformat()}|{chat.id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+        """
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        try:
+            created_at, chat_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|", 1)
+            return datetime.fromisoformat(created_at), chat_id
+        except Exception as e:
+            raise ValueError("Invalid cursor") from e
+
     async def get_user_chat_list(self, account_id: int) -> List[Dict]:
+        # 요약 컬럼만 조회 (메시지 본문은 읽지 않음)
         chats = await self.repository.find_all_by_account_id(account_id)
-        result = []
-        for chat in chats:
-            decrypted_msgs = self._decrypt_messages(chat.messages)
-            last_msg = decrypted_msgs[-1].get("content", "") if decrypted_msgs else ""
-            result.append({
-                "id": chat.id, "mbti": chat.mbti, "gender": chat.gender, "topic": chat.topic,
-                "last_message": last_msg[:50] + "..." if len(last_msg) > 50 else last_msg
-            })
-        return result
+        return [self._to_list_item(chat) for chat in chats]
+
+    async def get_user_chat_page(self, account_id: int, limit: int, cursor: Optional[str] = None) -> Dict:
+        """
+        created_at 커서 기반 페이지. next_cursor 가 None 이면 마지막 페이지.
+
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        before = self._decode_cursor(cursor) if cursor else None
+        # 한 개 더 읽어서 다음 페이지 존재 여부 판단
+        chats = await self.repository.find_all_by_account_id(account_id, limit=limit + 1, before=before)
+        has_more = len(chats) > limit
+        chats = chats[:limit]
+        return {
+            "items": [self._to_list_item(chat) for chat in chats],
+            "next_cursor": self._encode_cursor(chats[-1]) if has_more else None,
+        }
 
     async def get_chat_details(self, chat_id: str, account_id: int) -> SimulationChat:
         chat = await self.repository.find_by_id(chat_id)
@@ -142,7 +222,7 @@ class SimulationService:
         특정 채팅을 삭제합니다.
         삭제 전 본인의 채팅인지 권한을 확인한 후 리포지토리에 삭제를 요청합니다.
         """
-        chat = await self.repository.find_by_id(chat_id)
+        chat = await self.repository.find_by_id(chat_id, include_messages=False)
 
         if not chat:
             return False
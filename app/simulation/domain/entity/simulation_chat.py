@@ -1,7 +1,16 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List, Dict
 import uuid
 
+PREVIEW_LENGTH = 50
+
+
+def preview_text(content: str) -> str:
+    """목록에 보여줄 마지막 메시지 미리보기 (여러 번 적용해도 결과가 같다)"""
+    return content[:PREVIEW_LENGTH] + "..." if len(content) > PREVIEW_LENGTH else content
+
+
 class SimulationChat:
     def __init__(
         self,
@@ -14,13 +23,19 @@ class SimulationChat:
         is_training_data: bool = False, # 일단 학습 제외로 세팅
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        message_count: Optional[int] = None,
     ):
         self.id = id or str(uuid.uuid4())
         self.account_id = account_id
         self.mbti = mbti
         self.topic = topic
         self.gender = gender
+        # 메모리에 올라온 메시지 (최근 일부만 올라올 수도 있다)
         self.messages = messages or []
+        # 저장소에 저장된 전체 메시지 수 (다음 메시지의 seq)
+        self.message_count = len(self.messages) if message_count is None else message_count
+        # messages[_saved_len:] 가 아직 저장되지 않은 메시지
+        self._saved_len = len(self.messages)
         self.is_training_data = is_training_data
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
@@ -36,4 +51,29 @@ class SimulationChat:
             "content": content,
             "timestamp": datetime.utcnow().isoformat()
         })
-        self.updated_at = datetime.utcnow()
\ No newline at end of file
+        self.updated_at = datetime.utcnow()
+
+    def unsaved_messages(self) -> List[Dict]:
+        """마지막 저장 이후 추가된 메시지"""
+        return self.messages[self._saved_len:]
+
+    def mark_saved(self, message_count: Optional[int] = None) -> None:
+        """저장소가 unsaved_messages() 를 저장한 뒤 호출 (message_count: 저장 후 DB 의 메시지 수)"""
+        if message_count is None:
+            message_count = self.message_count + len(self.messages) - self._saved_len
+        self.message_count = message_count
+        self._saved_len = len(self.messages)
+
+
+@dataclass(frozen=True)
+class SimulationChatSummary:
+    """목록 조회용 요약 (메시지 본문 없이 암호화된 마지막 메시지 미리보기만 포함)"""
+    id: str
+    account_id: int
+    mbti: str
+    topic: str
+    gender: str
+    message_count: int
+    last_message: Optional[Dict]  # {"content": base64 암호문, "iv": base64 IV} 또는 None
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text
+
+from app.config.database.session import Base
+
+
+class SimulationChatMessageORM(Base):
+    """시뮬레이션 메시지 (append-only, (chat_id, seq) 순서)"""
+    __tablename__ = "simulation_chat_message"
+
+    chat_id = Column(
+        String(50),
+        ForeignKey("simulation_chat.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    seq = Column(Integer, primary_key=True, autoincrement=False)  # 0부터 증가
+    role = Column(String(20), nullable=False)
+    content = Column(Text, nullable=False)  # base64 암호문 (레거시 평문은 iv 없음)
+    iv = Column(String(64), nullable=True)  # base64 IV
+    created_at = Column(DateTime)
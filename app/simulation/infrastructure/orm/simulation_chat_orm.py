@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, JSON, Boolean, Index
+from sqlalchemy import Column, String, Integer, DateTime, JSON, Boolean, Index, Text
 
 from app.config.database.session import Base
 
@@ -10,11 +10,16 @@ class SimulationChatORM(Base):
     mbti = Column(String(4))
     topic = Column(String(255))
     gender = Column(String(10))
-    messages = Column(JSON)
+    # 레거시 JSON 메시지 목록 (읽기/쓰기 안 함, 메시지는 simulation_chat_message 에 저장)
+    messages = Column(JSON, nullable=True)
+    # 목록 조회용 비정규화 컬럼 (메시지 테이블을 읽지 않도록)
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_message_preview = Column(Text, nullable=True)  # base64 암호문
+    last_message_iv = Column(String(64), nullable=True)  # base64 IV
     is_training_data = Column(Boolean, default=False)
     created_at = Column(DateTime)
     updated_at = Column(DateTime)
 
     __table_args__ = (
         Index('ix_account_id_created_at', 'account_id', 'created_at'),
-    )
\ No newline at end of file
+    )
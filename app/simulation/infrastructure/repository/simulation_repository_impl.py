@@ -1,115 +1,218 @@
 import base64
+from datetime import datetime
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_, select, delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.database.session import get_db_session
 from app.simulation.application.port.simulation_repository_port import SimulationRepositoryPort
-from app.simulation.domain.entity.simulation_chat import SimulationChat
+from app.simulation.domain.entity.simulation_chat import SimulationChat, SimulationChatSummary, preview_text
 from app.simulation.infrastructure.orm.simulation_chat_orm import SimulationChatORM
+from app.simulation.infrastructure.orm.simulation_chat_message_orm import SimulationChatMessageORM
 from app.config.security.message_crypto import AESEncryption
 
 
 class SimulationRepositoryImpl(SimulationRepositoryPort):
-    def __init__(self, session: Session | None = None):
-        self.db: Session = session or get_db_session()
-        self.crypto = AESEncryption()
+    def __init__(self, session: AsyncSession, crypto: AESEncryption | None = None):
+        self.db: AsyncSession = session
+        self.crypto = crypto or AESEncryption()
+
+    def _encrypt(self, content: str) -> tuple[str, str]:
+        # AESEncryption.encrypt 로직을 수정 없이 그대로 사용, 저장용 Base64 인코딩
+        enc_bytes, iv_bytes = self.crypto.encrypt(content)
+        return base64.b64encode(enc_bytes).decode('utf-8'), base64.b64encode(iv_bytes).decode('utf-8')
 
     async def save(self, chat: SimulationChat, is_new: bool = False) -> None:
-        processed_messages = []
+        """
+        새로 추가된 메시지만 INSERT 하고 부모 행은 요약 컬럼만 UPDATE 한다.
+        턴 당 쓰기 비용이 대화 길이와 무관하다.
 
-        for msg in chat.messages:
-            # 1. 이미 암호화 정보(iv)가 있는 메시지는 그대로 유지
-            if msg.get("iv"):
-                processed_messages.append(msg)
-                continue
+        seq 는 요청 시작 시점의 message_count 가 아니라 저장 시점에 부모 행의 message_count 를
+        원자적으로 증가시켜 할당한다 (같은 대화에 동시에 보낸 턴이 같은 seq 로 충돌하지 않도록).
+        """
+        pending = []
+        preview = None
 
-            # 2. 신규 평문 메시지만 암호화 수행
+        for msg in chat.unsaved_messages():
             content_plain = msg.get("content", "")
-            # AESEncryption.encrypt 로직을 수정 없이 그대로 사용 (고정 IV 반환)
-            enc_bytes, iv_bytes = self.crypto.encrypt(content_plain)
-
-            # JSON 내부에 저장하기 위해 Base64 인코딩
-            processed_messages.append({
+            timestamp = msg.get("timestamp")
+            content_enc, iv = self._encrypt(content_plain)
+            pending.append({
                 "role": msg.get("role"),
-                "content": base64.b64encode(enc_bytes).decode('utf-8'),
-                "iv": base64.b64encode(iv_bytes).decode('utf-8'),
-                "timestamp": msg.get("timestamp")
+                "content": content_enc,
+                "iv": iv,
+                "created_at": datetime.fromisoformat(timestamp) if timestamp else chat.updated_at,
             })
+            preview = content_plain
 
-        orm_chat = SimulationChatORM(
-            id=chat.id,
-            account_id=chat.account_id,
-            mbti=chat.mbti,
-            topic=chat.topic,
-            gender=chat.gender,
-            messages=processed_messages,
-            is_training_data=chat.is_training_data,
-            created_at=chat.created_at,
-            updated_at=chat.updated_at
-        )
+        summary = {"updated_at": chat.updated_at}
+        if preview is not None:
+            summary["last_message_preview"], summary["last_message_iv"] = self._encrypt(preview_text(preview))
 
         try:
             if is_new:
-                self.db.add(orm_chat)
+                message_count = chat.message_count + len(pending)
+                self.db.add(SimulationChatORM(
+                    id=chat.id,
+                    account_id=chat.account_id,
+                    mbti=chat.mbti,
+                    topic=chat.topic,
+                    gender=chat.gender,
+                    is_training_data=chat.is_training_data,
+                    created_at=chat.created_at,
+                    message_count=message_count,
+                    **summary,
+                ))
+                # 자식 행보다 부모 행이 먼저 INSERT 되도록
+                await self.db.flush()
             else:
-                self.db.merge(orm_chat)
-            self.db.commit()
+                # 증가 UPDATE 가 커밋까지 부모 행을 잠그므로 다시 읽은 값이 이 트랜잭션의 몫이다
+                await self.db.execute(
+                    update(SimulationChatORM)
+                    .where(SimulationChatORM.id == chat.id)
+                    .values(message_count=SimulationChatORM.message_count + len(pending), **summary)
+                )
+                message_count = await self.db.scalar(
+                    select(SimulationChatORM.message_count).where(SimulationChatORM.id == chat.id)
+                )
+                if message_count is None:
+                    raise ValueError("Not Found")
+
+            first_seq = message_count - len(pending)
+            self.db.add_all([
+                SimulationChatMessageORM(chat_id=chat.id, seq=first_seq + offset, **row)
+                for offset, row in enumerate(pending)
+            ])
+            await self.db.commit()
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise e
 
-    async def find_by_id(self, chat_id: str) -> Optional[SimulationChat]:
-        orm = self.db.query(SimulationChatORM).filter(SimulationChatORM.id == chat_id).first()
+        chat.mark_saved(message_count)
+
+    @staticmethod
+    def _to_message(row: SimulationChatMessageORM) -> dict:
+        return {
+            "role": row.role,
+            "content": row.content,
+            "iv": row.iv,
+            "timestamp": row.created_at.isoformat() if row.created_at else None,
+        }
+
+    async def find_by_id(self, chat_id: str, include_messages: bool = True) -> Optional[SimulationChat]:
+        orm = await self.db.scalar(
+            select(SimulationChatORM).where(SimulationChatORM.id == chat_id)
+        )
         if not orm:
             return None
+
+        messages = []
+        if include_messages:
+            rows = await self.db.scalars(
+                select(SimulationChatMessageORM)
+                .where(SimulationChatMessageORM.chat_id == chat_id)
+                .order_by(SimulationChatMessageORM.seq)
+            )
+            messages = [self._to_message(row) for row in rows]
+
         return SimulationChat(
             id=orm.id,
             account_id=orm.account_id,
             mbti=orm.mbti,
             topic=orm.topic,
             gender=orm.gender,
-            messages=orm.messages,
+            messages=messages,
             is_training_data=orm.is_training_data,
             created_at=orm.created_at,
-            updated_at=orm.updated_at
+            updated_at=orm.updated_at,
+            message_count=orm.message_count,
         )
 
-    async def find_all_by_account_id(self, account_id: int) -> List[SimulationChat]:
-        orm_list = self.db.query(SimulationChatORM).filter(
-            SimulationChatORM.account_id == account_id
-        ).order_by(SimulationChatORM.created_at.desc()).all()
+    async def find_messages_before(self, chat_id: str, before_seq: int, limit: int) -> List[dict]:
+        # PK (chat_id, seq) 를 역순으로 타므로 대화 길이와 무관하게 limit 개만 읽는다
+        rows = await self.db.scalars(
+            select(SimulationChatMessageORM)
+            .where(
+                SimulationChatMessageORM.chat_id == chat_id,
+                SimulationChatMessageORM.seq < before_seq,
+            )
+            .order_by(SimulationChatMessageORM.seq.desc())
+            .limit(limit)
+        )
+        return [self._to_message(row) for row in rows]
+
+    async def find_all_by_account_id(
+        self,
+        account_id: int,
+        limit: Optional[int] = None,
+        before: Optional[tuple[datetime, str]] = None,
+    ) -> List[SimulationChatSummary]:
+        # 메시지 본문(자식 테이블, 레거시 JSON)은 읽지 않는다
+        stmt = (
+            select(
+                SimulationChatORM.id,
+                SimulationChatORM.account_id,
+                SimulationChatORM.mbti,
+                SimulationChatORM.topic,
+                SimulationChatORM.gender,
+                SimulationChatORM.message_count,
+                SimulationChatORM.last_message_preview,
+                SimulationChatORM.last_message_iv,
+                SimulationChatORM.created_at,
+                SimulationChatORM.updated_at,
+            )
+            .where(SimulationChatORM.account_id == account_id)
+            # (account_id, created_at) 인덱스 순서, 같은 시각은 id 로 구분
+            .order_by(SimulationChatORM.created_at.desc(), SimulationChatORM.id.desc())
+        )
+        if before is not None:
+            created_at, chat_id = before
+            stmt = stmt.where(or_(
+                SimulationChatORM.created_at < created_at,
+                and_(SimulationChatORM.created_at == created_at, SimulationChatORM.id < chat_id),
+            ))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self.db.execute(stmt)
 
         return [
-            SimulationChat(
-                id=orm.id,
-                account_id=orm.account_id,
-                mbti=orm.mbti,
-                topic=orm.topic,
-                gender=orm.gender,
-                messages=orm.messages,
-                is_training_data=orm.is_training_data,
-                created_at=orm.created_at,
-                updated_at=orm.updated_at
-            ) for orm in orm_list
+            SimulationChatSummary(
+                id=row.id,
+                account_id=row.account_id,
+                mbti=row.mbti,
+                topic=row.topic,
+                gender=row.gender,
+                message_count=row.message_count,
+                last_message=(
+                    {"content": row.last_message_preview, "iv": row.last_message_iv}
+                    if row.last_message_preview else None
+                ),
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            ) for row in result
         ]
 
     async def delete_by_id(self, chat_id: str, account_id: int) -> bool:
         try:
-            query = self.db.query(SimulationChatORM).filter(
-                SimulationChatORM.id == chat_id,
-                SimulationChatORM.account_id == account_id
+            result = await self.db.execute(
+                delete(SimulationChatORM).where(
+                    SimulationChatORM.id == chat_id,
+                    SimulationChatORM.account_id == account_id
+                )
             )
 
-            target = query.first()
-
-            if not target:
+            if not result.rowcount:
+                await self.db.rollback()
                 return False
 
-            query.delete(synchronize_session=False)
-            self.db.commit()
+            # FK CASCADE 를 강제하지 않는 DB(SQLite 등)를 위해 메시지도 명시적으로 삭제
+            await self.db.execute(
+                delete(SimulationChatMessageORM).where(SimulationChatMessageORM.chat_id == chat_id)
+            )
+            await self.db.commit()
             return True
 
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             print(f"Delete Error: {e}")
-            raise e
\ No newline at end of file
+            raise e
@@ -2,9 +2,9 @@ from __future__ import annotations
 import os
 
 from fastapi import APIRouter, Depends, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.database.session import get_db_session
+from app.config.database.session import get_async_db_session
 from app.survey.infrastructure.repository.survey_repository_impl import SurveyRepositoryImpl
 from app.survey.adapter.input.web.request.create_survey_request import CreateSurveyRequest
 
@@ -18,31 +18,31 @@ SURVEY_TRIGGER_MESSAGE_COUNT = int(os.getenv("SURVEY_TRIGGER_MESSAGE_COUNT", "5"
 
 
 @router.get("/questions")
-def get_questions(
-    db: Session = Depends(get_db_session),
+async def get_questions(
+    db: AsyncSession = Depends(get_async_db_session),
     account_id: int = Depends(get_current_account_id),  # ✅ 로그인 유저 확보
 ):
     """설문 표시 여부 및 설문 데이터 반환"""
     repo = SurveyRepositoryImpl(db)
 
     # 1) 활성 템플릿 조회
-    template = repo.get_active_template()
+    template = await repo.get_active_template()
     if not template:
         return {"show": False, "reason": "no_active_template"}
 
     # 2) payload 파싱
-    payload = repo.get_active_template_payload()
+    payload = await repo.get_active_template_payload()
     if not payload or not payload.get("questions"):
         return {"show": False, "reason": "invalid_payload"}
 
     template_version = template.version
 
     # 3) 이미 응답했으면 show=false
-    if repo.has_user_responded(user_id=account_id, template_version=template_version):
+    if await repo.has_user_responded(user_id=account_id, template_version=template_version):
         return {"show": False, "reason": "already_responded"}
 
     # 4) 메시지 카운트 조건 (이상으로 변경)
-    msg_count = repo.get_user_message_count(user_id=account_id)
+    msg_count = await repo.get_user_message_count(user_id=account_id)
     if msg_count < SURVEY_TRIGGER_MESSAGE_COUNT:
         return {
             "show": False,
@@ -63,19 +63,19 @@ def get_questions(
 
 
 @router.post("/responses")
-def create_response(
+async def create_response(
         req: CreateSurveyRequest,
-        db: Session = Depends(get_db_session),
+        db: AsyncSession = Depends(get_async_db_session),
         account_id: int = Depends(get_current_account_id),
 ):
     """설문 응답 저장"""
     repo = SurveyRepositoryImpl(db)
-    tpl = repo.get_active_template()
+    tpl = await repo.get_active_template()
 
     if not tpl:
         return {"ok": False, "duplicated": False, "message": "설문 템플릿이 없습니다."}
 
-    ok, duplicated, message = repo.save_survey_response(
+    ok, duplicated, message = await repo.save_survey_response(
         user_id=account_id,
         template_version=tpl.version,
         answers=req.answers,
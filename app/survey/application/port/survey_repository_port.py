@@ -3,10 +3,10 @@ from typing import Protocol
 
 
 class SurveyRepositoryPort(Protocol):
-    def get_active_template(self) -> dict | None:
+    async def get_active_template(self) -> dict | None:
         """return: {version, title, subtitle, footer, questions(list)} or None"""
 
-    def save_response(
+    async def save_response(
         self,
         user_id: int | None,
         template_version: int,
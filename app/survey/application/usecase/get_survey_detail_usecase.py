@@ -6,5 +6,5 @@ class GetSurveyDetailUsecase:
     def __init__(self, repo: SurveyRepositoryPort):
         self.repo = repo
 
-    def execute(self) -> dict | None:
-        return self.repo.get_active_template()
+    async def execute(self) -> dict | None:
+        return await self.repo.get_active_template()
@@ -0,0 +1,102 @@
+"""
+요청 당 서비스 생성 비용 비교: 기존 방식(요청마다 생성) vs AppContainer 재사용.
+
+    python -m benchmarks.bench_request_dependencies [--iterations 20000]
+
+.env 가 없어도 돌 수 있도록 필요한 환경 변수는 더미 값으로 채운다 (Redis/DB 접속은 하지 않음).
+"""
+import argparse
+import base64
+import os
+import time
+import tracemalloc
+
+_DEFAULT_ENV = {
+    "MYSQL_HOST": "localhost",
+    "MYSQL_PORT": "3306",
+    "MYSQL_USER": "bench",
+    "MYSQL_PASSWORD": "bench",
+    "MYSQL_DATABASE": "bench",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_DB": "0",
+    "REDIS_BACKEND": "fake",
+    "CORS_ALLOWED_FRONTEND_URL": "http://localhost",
+    "JWT_SECRET_KEY": "bench-secret",
+    "JWT_ENCRYPTION_KEY": "bench-encryption",
+    "AES_KEY": base64.b64encode(b"k" * 32).decode(),
+    "AES_IV": base64.b64encode(b"i" * 16).decode(),
+    "OBJECT_STORAGE_BACKEND": "local",
+}
+
+
+def _per_request_old():
+    # user-018 이전 의존성 체인이 요청마다 만들던 객체들
+    from app.auth.infrastructure.cache.session_repository_impl import SessionRepositoryImpl
+    from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl
+    from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService
+    from app.config.security.message_crypto import AESEncryption
+    from app.simulation.application.usecase.simulation_usecase import SimulationService
+    from app.simulation.infrastructure.repository.simulation_repository_impl import SimulationRepositoryImpl
+
+    def build():
+        SessionRepositoryImpl()
+        JWTTokenService(blacklist=TokenBlacklistImpl())
+        SimulationService(SimulationRepositoryImpl(None))
+        AESEncryption()
+
+    return build
+
+
+def _per_request_container():
+    from app.config.container import build_container
+    from app.simulation.application.usecase.simulation_usecase import SimulationService
+    from app.simulation.infrastructure.repository.simulation_repository_impl import SimulationRepositoryImpl
+
+    container = build_container()
+
+    def build():
+        # 요청마다 남는 것은 DB 세션을 감싸는 가벼운 래퍼뿐
+        _ = container.session_repository, container.jwt_service
+        SimulationService(SimulationRepositoryImpl(None, container.crypto), container.crypto)
+
+    return build
+
+
+def _measure(name: str, build, iterations: int) -> None:
+    build()  # import / 첫 호출 비용 제외
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        build()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(1000):
+        build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename") if stat.size_diff > 0)
+    allocations = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+
+    print(
+        f"{name:<10} {elapsed / iterations * 1e6:8.2f} us/request   "
+        f"{allocated / 1000:8.0f} B/request (retained)   {allocations / 1000:6.1f} blocks/request"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    for key, value in _DEFAULT_ENV.items():
+        os.environ.setdefault(key, value)
+
+    _measure("per-request", _per_request_old(), args.iterations)
+    _measure("container", _per_request_container(), args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+시뮬레이션 목록 조회 비교: 전체 메시지 복호화 방식 vs 요약 컬럼(projection) 방식.
+
+    python -m benchmarks.bench_simulation_list [--accounts 3] [--chats 100] [--messages 200] [--rounds 5]  (측정 전 워밍업 1 라운드)
+
+계정마다 chats 개의 시뮬레이션, 시뮬레이션마다 messages 개의 메시지를 임시 SQLite(aiosqlite) DB 에 만든다.
+- full-decrypt : 이전 목록 경로. 계정의 모든 메시지를 읽고 전부 복호화한 뒤 마지막 것만 사용
+- projection   : SimulationService.get_user_chat_list (요약 컬럼만 읽고 채팅당 1회 복호화)
+- page(20)     : SimulationService.get_user_chat_page 첫 페이지
+"""
+import argparse
+import asyncio
+import base64
+import math
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+_DEFAULT_ENV = {
+    "MYSQL_HOST": "localhost",
+    "MYSQL_PORT": "3306",
+    "MYSQL_USER": "bench",
+    "MYSQL_PASSWORD": "bench",
+    "MYSQL_DATABASE": "bench",
+    "REDIS_HOST": "localhost",
+    "REDIS_BACKEND": "fake",
+    "CORS_ALLOWED_FRONTEND_URL": "http://localhost",
+    "FRONTEND_URL": "http://localhost",
+    "CSRF_SECRET_KEY": "bench-csrf",
+    "AWS_ACCESS_KEY_ID": "bench",
+    "AWS_SECRET_ACCESS_KEY": "bench",
+    "AWS_REGION": "ap-northeast-2",
+    "AWS_S3_BUCKET": "bench",
+    "CLOUDFRONT_DOMAIN": "localhost",
+    "CLOUDFRONT_KEY_ID": "bench",
+    "CLOUDFRONT_PRIVATE_KEY_PATH": "/dev/null",
+    "JWT_SECRET_KEY": "bench-secret",
+    "JWT_ENCRYPTION_KEY": "bench-encryption",
+    "AES_KEY": base64.b64encode(b"k" * 32).decode(),
+    "AES_IV": base64.b64encode(b"i" * 16).decode(),
+}
+
+
+async def _seed(crypto, accounts: int, chats: int, messages: int) -> None:
+    from sqlalchemy import insert
+
+    from app.config.database.session import AsyncSessionLocal, Base, async_engine
+    from app.simulation.domain.entity.simulation_chat import preview_text
+    from app.simulation.infrastructure.orm.simulation_chat_message_orm import SimulationChatMessageORM
+    from app.simulation.infrastructure.orm.simulation_chat_orm import SimulationChatORM
+
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    def encrypt(text: str) -> tuple[str, str]:
+        enc, iv = crypto.encrypt(text)
+        return base64.b64encode(enc).decode(), base64.b64encode(iv).decode()
+
+    started = datetime(2026, 1, 1)
+    async with AsyncSessionLocal() as db:
+        for account_id in range(1, accounts + 1):
+            for c in range(chats):
+                chat_id = f"{account_id}-{c:04d}"
+                created_at = started + timedelta(minutes=c)
+                rows = []
+                for seq in range(messages):
+                    content, iv = encrypt(f"[{chat_id}] {seq}번째 메시지입니다. " * 3)
+                    rows.append({
+                        "chat_id": chat_id, "seq": seq, "role": "user" if seq % 2 else "assistant",
+                        "content": content, "iv": iv, "created_at": created_at,
+                    })
+                preview, preview_iv = encrypt(preview_text(f"[{chat_id}] {messages - 1}번째 메시지입니다. " * 3))
+                await db.execute(insert(SimulationChatORM).values(
+                    id=chat_id, account_id=account_id, mbti="INFP", topic="bench", gender="female",
+                    message_count=messages, last_message_preview=preview, last_message_iv=preview_iv,
+                    is_training_data=False, created_at=created_at, updated_at=created_at,
+                ))
+                await db.execute(insert(SimulationChatMessageORM), rows)
+            await db.commit()
+
+
+async def _full_decrypt_list(db, service, account_id: int) -> list:
+    """이전 경로 재현: 모든 메시지를 읽어 전부 복호화"""
+    from sqlalchemy import select
+
+    from app.simulation.infrastructure.orm.simulation_chat_message_orm import SimulationChatMessageORM
+    from app.simulation.infrastructure.orm.simulation_chat_orm import SimulationChatORM
+
+    chats = (await db.scalars(
+        select(SimulationChatORM)
+        .where(SimulationChatORM.account_id == account_id)
+        .order_by(SimulationChatORM.created_at.desc())
+    )).all()
+    rows = await db.execute(
+        select(SimulationChatMessageORM)
+        .join(SimulationChatORM, SimulationChatORM.id == SimulationChatMessageORM.chat_id)
+        .where(SimulationChatORM.account_id == account_id)
+        .order_by(SimulationChatMessageORM.chat_id, SimulationChatMessageORM.seq)
+    )
+    grouped: dict[str, list] = {}
+    for (row,) in rows:
+        grouped.setdefault(row.chat_id, []).append({"role": row.role, "content": row.content, "iv": row.iv})
+
+    result = []
+    for chat in chats:
+        decrypted = service._decrypt_messages(grouped.get(chat.id, []))
+        last_msg = decrypted[-1].get("content", "") if decrypted else ""
+        result.append({"id": chat.id, "last_message": last_msg[:50] + "..." if len(last_msg) > 50 else last_msg})
+    return result
+
+
+async def _run(args) -> None:
+    from app.config.database.session import AsyncSessionLocal, async_engine
+    from app.config.security.message_crypto import AESEncryption
+    from app.simulation.application.usecase.simulation_usecase import SimulationService
+    from app.simulation.infrastructure.repository.simulation_repository_impl import SimulationRepositoryImpl
+
+    crypto = AESEncryption()
+    await _seed(crypto, args.accounts, args.chats, args.messages)
+
+    async def full(db, service, account_id):
+        return await _full_decrypt_list(db, service, account_id)
+
+    async def projection(db, service, account_id):
+        return await service.get_user_chat_list(account_id)
+
+    async def page(db, service, account_id):
+        return (await service.get_user_chat_page(account_id, limit=20))["items"]
+
+    expected = None
+    for name, fn in (("full-decrypt", full), ("projection", projection), ("page(20)", page)):
+        timings = []
+        # 첫 라운드는 워밍업 (커넥션/페이지 캐시, import) 으로 측정에서 제외
+        for round_no in range(args.rounds + 1):
+            for account_id in range(1, args.accounts + 1):
+                async with AsyncSessionLocal() as db:
+                    service = SimulationService(SimulationRepositoryImpl(db, crypto), crypto)
+                    started = time.perf_counter()
+                    items = await fn(db, service, account_id)
+                    if round_no > 0:
+                        timings.append(time.perf_counter() - started)
+
+        # 결과가 같은지 확인 (페이지는 앞부분만 비교)
+        previews = [item["last_message"] for item in items]
+        if expected is None:
+            expected = previews
+        assert previews == expected[:len(previews)], f"{name}: 결과 불일치"
+
+        timings.sort()
+        # nearest-rank p95
+        p95 = timings[min(len(timings) - 1, math.ceil(len(timings) * 0.95) - 1)]
+        print(
+            f"{name:<13} median {statistics.median(timings) * 1000:8.2f} ms   "
+            f"p95 {p95 * 1000:8.2f} ms   items {len(items)}"
+        )
+
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--accounts", type=int, default=3)
+    parser.add_argument("--chats", type=int, default=100)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    for key, value in _DEFAULT_ENV.items():
+        os.environ.setdefault(key, value)
+    db_path = os.path.join(tempfile.mkdtemp(), "bench_simulation_list.db")
+    os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{db_path}"
+
+    print(f"accounts={args.accounts} chats={args.chats} messages={args.messages} rounds={args.rounds}")
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()